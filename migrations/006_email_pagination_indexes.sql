@@ -0,0 +1,8 @@
+-- Inbox pagination and prev/next navigation filter by folder and order by
+-- (date, uid); the partial index serves the unread-only views.
+CREATE INDEX IF NOT EXISTS idx_emails_folder_date_uid
+    ON emails(folder, date DESC, uid DESC);
+
+CREATE INDEX IF NOT EXISTS idx_emails_folder_unread_date
+    ON emails(folder, date DESC, uid DESC)
+    WHERE is_unread;
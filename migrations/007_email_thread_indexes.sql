@@ -0,0 +1,4 @@
+-- Thread reconstruction looks emails up by Message-ID and In-Reply-To.
+CREATE INDEX IF NOT EXISTS idx_emails_message_id ON emails(message_id);
+
+CREATE INDEX IF NOT EXISTS idx_emails_in_reply_to ON emails(in_reply_to);
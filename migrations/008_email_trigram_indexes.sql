@@ -0,0 +1,8 @@
+-- Search suggestions filter senders and subjects with ILIKE '%...%'.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_emails_from_addr_trgm
+    ON emails USING gin(from_addr gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_emails_subject_trgm
+    ON emails USING gin(subject gin_trgm_ops);
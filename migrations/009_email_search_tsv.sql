@@ -0,0 +1,9 @@
+-- Store the full-text document per row so searches stop rebuilding it.
+ALTER TABLE emails ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english', COALESCE(subject, '') || ' ' || COALESCE(body_text, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_emails_search_tsv ON emails USING gin(search_tsv);
+
+DROP INDEX IF EXISTS idx_emails_fts;
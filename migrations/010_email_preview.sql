@@ -0,0 +1,3 @@
+-- Store the list-view preview inline so list queries never detoast body_text.
+ALTER TABLE emails ADD COLUMN IF NOT EXISTS preview TEXT
+    GENERATED ALWAYS AS (LEFT(body_text, 200)) STORED;
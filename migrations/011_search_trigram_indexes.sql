@@ -0,0 +1,14 @@
+-- Advanced search and contact autocomplete filter with ILIKE '%...%'.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_emails_to_addr_trgm
+    ON emails USING gin(to_addr gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_emails_attachment_filenames_trgm
+    ON emails USING gin((attachment_filenames::text) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_contacts_email_trgm
+    ON contacts USING gin(email gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_contacts_display_name_trgm
+    ON contacts USING gin(display_name gin_trgm_ops);
@@ -0,0 +1,6 @@
+-- Starred filter reads a stored boolean instead of probing gmail_labels.
+ALTER TABLE emails ADD COLUMN IF NOT EXISTS is_starred BOOLEAN
+    GENERATED ALWAYS AS (COALESCE(gmail_labels ? '\Starred', FALSE)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_emails_folder_starred_date
+    ON emails(folder, date DESC) WHERE is_starred;
@@ -0,0 +1,24 @@
+-- Inbox list pages read only these columns; carrying them in the
+-- (folder, date, uid) indexes lets Postgres answer each page with an
+-- index-only scan instead of a heap fetch per row. Headers are carried as
+-- bounded copies so a long From or Subject cannot push an index tuple past
+-- the b-tree row size limit.
+ALTER TABLE emails ADD COLUMN IF NOT EXISTS list_from TEXT
+    GENERATED ALWAYS AS (LEFT(from_addr, 120)) STORED;
+ALTER TABLE emails ADD COLUMN IF NOT EXISTS list_subject TEXT
+    GENERATED ALWAYS AS (LEFT(subject, 120)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_emails_folder_list_cov
+    ON emails(folder, date DESC, uid DESC)
+    INCLUDE (list_from, list_subject, preview, is_unread, has_attachments, is_starred);
+
+CREATE INDEX IF NOT EXISTS idx_emails_folder_unread_list_cov
+    ON emails(folder, date DESC, uid DESC)
+    INCLUDE (list_from, list_subject, preview, is_unread, has_attachments, is_starred)
+    WHERE is_unread;
+
+DROP INDEX IF EXISTS idx_emails_folder_date_uid;
+DROP INDEX IF EXISTS idx_emails_folder_unread_date;
+
+-- Index-only scans skip the heap only for all-visible pages.
+VACUUM (ANALYZE) emails;
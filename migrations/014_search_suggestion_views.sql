@@ -0,0 +1,32 @@
+-- Search autocomplete reads these pre-aggregated views instead of grouping
+-- emails on every keystroke. The engine refreshes them concurrently every
+-- SEARCH_SUGGESTIONS_REFRESH_INTERVAL seconds (default 300); the unique
+-- indexes are required for REFRESH ... CONCURRENTLY. They are built on md5
+-- key columns because a raw header can exceed the b-tree row size limit.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS email_sender_stats AS
+SELECT md5(from_addr) AS from_key, from_addr, COUNT(*) AS cnt
+FROM emails
+WHERE from_addr IS NOT NULL
+GROUP BY from_addr;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_email_sender_stats_from_key
+    ON email_sender_stats(from_key);
+CREATE INDEX IF NOT EXISTS idx_email_sender_stats_from_addr_trgm
+    ON email_sender_stats USING gin(from_addr gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_email_sender_stats_cnt
+    ON email_sender_stats(cnt DESC);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS email_subject_recent AS
+SELECT md5(subject) AS subject_key, subject, MAX(date) AS last_date
+FROM emails
+WHERE subject <> ''
+GROUP BY subject;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_email_subject_recent_subject_key
+    ON email_subject_recent(subject_key);
+CREATE INDEX IF NOT EXISTS idx_email_subject_recent_subject_trgm
+    ON email_subject_recent USING gin(subject gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_email_subject_recent_last_date
+    ON email_subject_recent(last_date DESC);
@@ -0,0 +1,20 @@
+from workspace_secretary.config import PostgresConfig
+
+
+def test_pool_sizes_keep_explicit_zero(monkeypatch):
+    monkeypatch.setenv("POSTGRES_POOL_MIN", "4")
+
+    config = PostgresConfig.from_dict({"pool_min_size": 0, "pool_max_size": 5})
+
+    assert config.pool_min_size == 0
+    assert config.pool_max_size == 5
+
+
+def test_pool_sizes_fall_back_to_environment(monkeypatch):
+    monkeypatch.setenv("POSTGRES_POOL_MIN", "4")
+    monkeypatch.setenv("POSTGRES_POOL_MAX", "12")
+
+    config = PostgresConfig.from_dict({"pool_min_size": None})
+
+    assert config.pool_min_size == 4
+    assert config.pool_max_size == 12
@@ -0,0 +1,48 @@
+from contextlib import contextmanager
+
+from workspace_secretary.db.queries import emails as email_q
+
+
+class _RecordingDatabase:
+    """Records executed SQL; every query returns no rows."""
+
+    def __init__(self):
+        self.statements = []
+
+    @contextmanager
+    def connection(self):
+        yield self
+
+    def cursor(self, row_factory=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def fetchall(self):
+        return []
+
+
+def test_thread_fallback_honours_include_body():
+    db = _RecordingDatabase()
+    email_q.get_thread_emails(db, 1, "INBOX", include_body=False)
+
+    assert len(db.statements) == 2
+    assert "snippet" in db.statements[1]
+    assert ", body_text, body_html" not in db.statements[1]
+
+
+def test_thread_queries_keep_one_row_per_message():
+    db = _RecordingDatabase()
+    email_q.get_thread_emails(db, 1, "INBOX")
+    email_q.get_thread(db, 1, "INBOX")
+
+    assert all(
+        f"DISTINCT ON ({email_q._THREAD_MESSAGE_KEY})" in sql for sql in db.statements
+    )
@@ -0,0 +1,21 @@
+import struct
+
+from psycopg.adapt import PyFormat, Transformer
+
+from workspace_secretary.db.queries.embeddings import PackedVector
+
+
+def _dump(vector: PackedVector) -> bytes:
+    transformer = Transformer()
+    return transformer.get_dumper(vector, PyFormat.BINARY).dump(vector)
+
+
+def test_packed_vector_uses_pgvector_binary_layout():
+    assert _dump(PackedVector([0.5, -1.0])) == struct.pack(">HHff", 2, 0, 0.5, -1.0)
+
+
+def test_packed_halfvec_uses_two_bytes_per_component():
+    data = _dump(PackedVector([0.5] * 1536, half=True))
+
+    assert len(data) == 4 + 2 * 1536
+    assert struct.unpack(">HH", data[:4]) == (1536, 0)
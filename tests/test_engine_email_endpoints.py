@@ -91,7 +91,7 @@ def test_create_draft_reply_success():
 
 
 def test_setup_labels_dry_run():
-    state.imap_client.list_folders.return_value = []
+    state.imap_client.list_folders_matching.return_value = []
     response = _client().post(
         "/api/email/setup-labels",
         json={"dry_run": True},
@@ -114,7 +114,7 @@ def test_setup_labels_requires_enrollment():
 
 
 def test_setup_labels_creates_missing():
-    state.imap_client.list_folders.return_value = ["Secretary"]
+    state.imap_client.list_folders_matching.return_value = ["Secretary"]
     state.imap_client.create_folder.return_value = True
 
     response = _client().post(
@@ -126,4 +126,6 @@ def test_setup_labels_creates_missing():
     assert response.status_code == status.HTTP_200_OK
     assert payload["status"] == "ok"
     assert "failed" in payload
+    assert "Secretary" in payload["already_exists"]
+    state.imap_client.list_folders_matching.assert_called_once_with("Secretary*")
     state.imap_client.create_folder.assert_called()
@@ -57,3 +57,21 @@ def test_save_draft_mime_handles_exception(mock_imap_config):
         uid = client.save_draft_mime(_build_message())
 
     assert uid is None
+
+
+def test_get_drafts_folder_prefers_special_use_and_caches(mock_imap_config):
+    client = ImapClient(mock_imap_config)
+    mock_imap = MagicMock()
+    mock_imap.list_folders.return_value = [
+        ((b"\\HasNoChildren",), b"/", "Drafts"),
+        ((b"\\HasNoChildren", b"\\Drafts"), b"/", "[Gmail]/Concepten"),
+    ]
+
+    with (
+        patch.object(client, "ensure_connected"),
+        patch.object(client, "_get_client", return_value=mock_imap),
+    ):
+        assert client._get_drafts_folder() == "[Gmail]/Concepten"
+        assert client._get_drafts_folder() == "[Gmail]/Concepten"
+
+    mock_imap.list_folders.assert_called_once()
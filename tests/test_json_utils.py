@@ -0,0 +1,14 @@
+from datetime import datetime, timezone
+
+from workspace_secretary.json_utils import JSONResponse, loads
+
+
+def test_json_response_serializes_datetimes():
+    when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    response = JSONResponse({"date": when, "labels": ["\\Starred"]})
+
+    assert response.media_type == "application/json"
+    assert loads(response.body) == {
+        "date": "2024-01-02T03:04:05+00:00",
+        "labels": ["\\Starred"],
+    }
@@ -1,12 +1,19 @@
 """Tests for email models."""
 
 import email
+import email.utils
 import unittest
+from unittest import mock
 from email.header import Header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
-from workspace_secretary.models import Email, EmailAddress, decode_mime_header
+from workspace_secretary.models import (
+    _MAX_ADDRESS_LENGTH,
+    Email,
+    EmailAddress,
+    decode_mime_header,
+)
 
 
 class TestModels(unittest.TestCase):
@@ -48,6 +55,29 @@ class TestModels(unittest.TestCase):
         addr = EmailAddress("", "jane@example.com")
         self.assertEqual(str(addr), "jane@example.com")
     
+    def test_email_address_parse_fallbacks(self):
+        """Test parsing of inputs outside the fast path."""
+        # Display name without angle brackets still yields the address
+        addr = EmailAddress.parse("john@example.com (John Doe)")
+        self.assertEqual(addr.name, "John Doe")
+        self.assertEqual(addr.address, "john@example.com")
+
+        # Unparseable input is kept verbatim as the address
+        addr = EmailAddress.parse("undisclosed-recipients")
+        self.assertEqual(addr.name, "")
+        self.assertEqual(addr.address, "undisclosed-recipients")
+
+        # Oversized input is truncated before reaching the stdlib parser,
+        # so the trailing address is cut off rather than parsed
+        oversized = "x" * 10000 + " <john@example.com>"
+        with mock.patch(
+            "email.utils.parseaddr", wraps=email.utils.parseaddr
+        ) as parseaddr:
+            addr = EmailAddress.parse(oversized)
+        parseaddr.assert_called_once_with(oversized[:_MAX_ADDRESS_LENGTH])
+        self.assertEqual(addr.name, "")
+        self.assertEqual(addr.address, "x" * _MAX_ADDRESS_LENGTH)
+
     def test_email_from_message(self):
         """Test creating email from message."""
         # Create a multipart email
@@ -90,6 +120,18 @@ class TestModels(unittest.TestCase):
         self.assertIn("From: John Doe <john@example.com>", summary)
         self.assertIn("Subject: Test Email", summary)
 
+    def test_email_is_slotted(self):
+        """Slotted models reject unknown attributes."""
+        email_obj = Email(
+            message_id="<abc@example.com>",
+            subject="Hello",
+            from_=EmailAddress("John Doe", "john@example.com"),
+            to=[EmailAddress("", "jane@example.com")],
+        )
+
+        with self.assertRaises(AttributeError):
+            email_obj.not_a_field = True
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import inspect
+from concurrent.futures import Future
+
+from workspace_secretary.json_utils import loads
+from workspace_secretary.tools import (
+    _format_email_summary,
+    _json_tool,
+    _write_task_batch,
+    create_task,
+)
+
+
+def test_json_tool_reports_errors_raised_while_formatting_rows():
+    @_json_tool("listing rows")
+    async def tool():
+        return (_format_email_summary(row) for row in [{"uid": 1, "flags": 123}])
+
+    assert "error" in loads(asyncio.run(tool()))
+
+
+def test_json_tool_encodes_generated_rows():
+    @_json_tool("listing rows")
+    async def tool():
+        return ({"uid": uid} for uid in (1, 2))
+
+    assert loads(asyncio.run(tool())) == [{"uid": 1}, {"uid": 2}]
+
+
+def test_json_tool_publishes_str_return_type():
+    @_json_tool("listing rows")
+    async def tool(limit: int = 10) -> list:
+        return []
+
+    signature = inspect.signature(tool)
+    assert signature.return_annotation is str
+    assert list(signature.parameters) == ["limit"]
+
+
+def test_task_writer_skips_cancelled_entries(tmp_path):
+    tasks_file = str(tmp_path / "tasks.md")
+    cancelled, pending = Future(), Future()
+    cancelled.cancel()
+
+    _write_task_batch(
+        [(tasks_file, "- [ ] a\n", cancelled), (tasks_file, "- [ ] b\n", pending)]
+    )
+
+    assert pending.result() is None
+    assert (tmp_path / "tasks.md").read_text() == "- [ ] b\n"
+
+
+def test_create_task_still_works_after_a_cancelled_call(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    async def scenario():
+        first = asyncio.ensure_future(create_task("first"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.wait_for(create_task("second"), timeout=5)
+
+    assert asyncio.run(scenario()) == "Task created: second"
+    assert "second" in (tmp_path / "tasks.md").read_text()
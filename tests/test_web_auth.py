@@ -0,0 +1,121 @@
+import hashlib
+import hmac
+from base64 import b64encode, urlsafe_b64decode, urlsafe_b64encode
+from types import SimpleNamespace
+
+from workspace_secretary.web import auth
+from workspace_secretary.web.auth import SESSION_TOKEN_PREFIX, AuthManager, Session
+
+
+def test_session_token_roundtrip():
+    auth_mgr = AuthManager()
+    token = auth_mgr.create_session("tester", email="t@example.com", csrf_token="c")
+
+    assert token.startswith(SESSION_TOKEN_PREFIX)
+    session = auth_mgr.verify_session(token)
+    assert session is not None
+    assert session.user_id == "tester"
+    assert session.email == "t@example.com"
+    assert session.csrf_token == "c"
+
+
+def test_session_token_rejects_tampering():
+    auth_mgr = AuthManager()
+    token = auth_mgr.create_session("tester")
+
+    other = AuthManager()
+    other._secret_bytes = b"another-secret"
+    assert auth_mgr.verify_session(other.create_session("admin")) is None
+    body = token[len(SESSION_TOKEN_PREFIX) :]
+    raw = urlsafe_b64decode(body + "=" * (-len(body) % 4))
+    tampered = urlsafe_b64encode(raw.replace(b"tester", b"admin!")).decode()
+    assert auth_mgr.verify_session(SESSION_TOKEN_PREFIX + tampered) is None
+    assert auth_mgr.verify_session(SESSION_TOKEN_PREFIX + "x") is None
+    assert auth_mgr.verify_session("not-a-token") is None
+
+
+def test_session_token_accepts_legacy_format():
+    auth_mgr = AuthManager()
+    session = Session(user_id="legacy", created_at=0.0, expires_at=4102444800.0)
+    payload = session.to_json()
+    # Signed exactly as tokens issued before the v2 format were
+    signature = hmac.new(
+        auth_mgr.session_secret, payload.encode(), hashlib.sha256
+    ).hexdigest()
+    token = b64encode(f"{payload}|{signature}".encode()).decode()
+
+    verified = auth_mgr.verify_session(token)
+    assert verified is not None
+    assert verified.user_id == "legacy"
+
+
+def test_password_verifier_is_bound_at_init():
+    salt = "pepper"
+    digest = hashlib.sha256(f"{salt}hunter2".encode()).hexdigest()
+    config = SimpleNamespace(
+        auth=SimpleNamespace(
+            password_hash=f"sha256:{salt}:{digest}", session_secret="s"
+        )
+    )
+    auth_mgr = AuthManager(config)
+
+    assert auth_mgr.verify_password("hunter2") is True
+    assert auth_mgr.verify_password("wrong") is False
+    assert AuthManager().verify_password("hunter2") is False
+
+
+def test_oidc_state_requires_matching_cookie():
+    auth_mgr = AuthManager()
+    state, nonce = auth_mgr.create_oidc_state()
+    _, other_nonce = auth_mgr.create_oidc_state()
+
+    assert auth_mgr.verify_oidc_state(state, None) is False
+    assert auth_mgr.verify_oidc_state(state, other_nonce) is False
+    assert auth_mgr.verify_oidc_state(state, nonce) is True
+
+    other = AuthManager()
+    other._secret_bytes = b"another-secret"
+    forged, forged_nonce = other.create_oidc_state()
+    assert auth_mgr.verify_oidc_state(forged, forged_nonce) is False
+
+
+def test_oidc_state_is_single_use():
+    auth_mgr = AuthManager()
+    state, nonce = auth_mgr.create_oidc_state()
+
+    assert auth_mgr.verify_oidc_state(state, nonce) is True
+    assert auth_mgr.verify_oidc_state(state, nonce) is False
+
+
+def test_redeemed_oidc_nonces_are_capped(monkeypatch):
+    monkeypatch.setattr(auth, "OIDC_NONCE_CACHE_SIZE", 2)
+    auth_mgr = AuthManager()
+    for _ in range(3):
+        state, nonce = auth_mgr.create_oidc_state()
+        assert auth_mgr.verify_oidc_state(state, nonce) is True
+
+    assert len(auth_mgr._used_oidc_nonces) == 2
+
+
+def test_oidc_state_and_session_tokens_are_not_interchangeable():
+    auth_mgr = AuthManager()
+    token = auth_mgr.create_session("tester")
+    sealed = token[len(SESSION_TOKEN_PREFIX) :]
+    assert auth_mgr.verify_oidc_state(sealed, "tester") is False
+
+    state, _ = auth_mgr.create_oidc_state()
+    assert auth_mgr.verify_session(SESSION_TOKEN_PREFIX + state) is None
+
+
+def test_verified_sessions_are_cached_until_expiry():
+    auth_mgr = AuthManager()
+    token = auth_mgr.create_session("tester")
+
+    first = auth_mgr.verify_session(token)
+    assert auth_mgr.verify_session(token) is first
+
+    auth_mgr._session_cache[token] = Session(
+        user_id="tester", created_at=0.0, expires_at=1.0
+    )
+    assert auth_mgr.verify_session(token) is None
+    assert token not in auth_mgr._session_cache
@@ -0,0 +1,201 @@
+import asyncio
+import threading
+import time
+
+from workspace_secretary.db.queries.emails import _INBOX_SQL
+from workspace_secretary.web import database
+
+
+def test_search_cache_key_depends_on_all_inputs():
+    key = database._search_cache_key([0.1, 0.2], "INBOX", 10)
+
+    assert key == database._search_cache_key([0.1, 0.2], "INBOX", 10)
+    assert key != database._search_cache_key([0.1, 0.3], "INBOX", 10)
+    assert key != database._search_cache_key([0.1, 0.2], "Sent", 10)
+    assert key != database._search_cache_key([0.1, 0.2], "INBOX", 20)
+
+
+def test_cached_search_reuses_recent_results():
+    calls = []
+
+    def search(value):
+        calls.append(value)
+        return [{"uid": value}]
+
+    database._search_cache.clear()
+    first = asyncio.run(database._cached_search(b"k", search, 1))
+    second = asyncio.run(database._cached_search(b"k", search, 2))
+
+    assert first == second == [{"uid": 1}]
+    assert calls == [1]
+    database._search_cache.clear()
+
+
+def test_cached_contacts_reuses_recent_results():
+    calls = []
+
+    def load():
+        calls.append(1)
+        return [{"email": "a@example.com"}]
+
+    database._contacts_cache.clear()
+    first = asyncio.run(database._cached_contacts(("recent", 10), load))
+    second = asyncio.run(database._cached_contacts(("recent", 10), load))
+
+    assert first == second
+    assert len(calls) == 1
+    database._contacts_cache.clear()
+
+
+def test_inbox_list_sql_selects_only_covered_columns():
+    sql = _INBOX_SQL[(False, True, True, True)]
+    assert "is_starred" in sql
+    assert "list_subject AS subject" in sql and "list_from AS from_addr" in sql
+    assert "gmail_labels" not in sql and "to_addr" not in sql
+    assert "gmail_labels" in _INBOX_SQL[(False, True, True, False)]
+
+
+def test_invalidate_folders_cache_forces_reload(monkeypatch):
+    calls = []
+
+    def get_folders(db):
+        calls.append(1)
+        return ["INBOX"]
+
+    monkeypatch.setattr(database.email_q, "get_folders", get_folders)
+    monkeypatch.setattr(database, "get_db", lambda: None)
+    database.invalidate_folders_cache()
+
+    asyncio.run(database.get_folders())
+    asyncio.run(database.get_folders())
+    database.invalidate_folders_cache()
+    asyncio.run(database.get_folders())
+
+    assert len(calls) == 2
+    database.invalidate_folders_cache()
+
+
+def test_cached_search_coalesces_concurrent_identical_queries():
+    calls = []
+
+    def search(n):
+        calls.append(n)
+        time.sleep(0.05)
+        return [{"uid": n}]
+
+    async def run():
+        return await asyncio.gather(
+            database._cached_search(b"same", search, 1),
+            database._cached_search(b"same", search, 1),
+        )
+
+    database._search_cache.clear()
+    first, second = asyncio.run(run())
+
+    assert first == second == [{"uid": 1}]
+    assert calls == [1]
+    assert not database._search_inflight
+    database._search_cache.clear()
+
+
+def test_calendar_selection_cached_until_invalidated(monkeypatch):
+    calls = []
+
+    def load(user_id):
+        calls.append(user_id)
+        return {"selected_ids": ["primary"], "available_ids": ["primary"]}
+
+    monkeypatch.setattr(database, "_load_calendar_selection_state", load)
+    database._calendar_selection_cache.clear()
+
+    database.get_calendar_selection_state("u1")
+    database.get_calendar_selection_state("u1")
+    database.invalidate_calendar_selection("u1")
+    database.get_calendar_selection_state("u1")
+
+    assert calls == ["u1", "u1"]
+    database._calendar_selection_cache.clear()
+
+
+def test_get_email_headers_cached_until_invalidated(monkeypatch):
+    calls = []
+
+    def get_email_headers(db, uid, folder):
+        calls.append((uid, folder))
+        return {"uid": uid, "folder": folder}
+
+    monkeypatch.setattr(database.email_q, "get_email_headers", get_email_headers)
+    monkeypatch.setattr(database, "get_db", lambda: None)
+    database._email_cache.clear()
+
+    asyncio.run(database.get_email_headers(1, "INBOX"))
+    asyncio.run(database.get_email_headers(1, "INBOX"))
+    asyncio.run(database.get_email_headers(2, "INBOX"))
+    database.invalidate_email(1, "INBOX")
+    asyncio.run(database.get_email_headers(1, "INBOX"))
+
+    assert calls == [(1, "INBOX"), (2, "INBOX"), (1, "INBOX")]
+    database._email_cache.clear()
+
+
+def test_get_email_always_reads_the_database(monkeypatch):
+    calls = []
+
+    def get_email(db, uid, folder):
+        calls.append(uid)
+        return {"uid": uid, "body_text": "hi"}
+
+    monkeypatch.setattr(database.email_q, "get_email", get_email)
+    monkeypatch.setattr(database, "get_db", lambda: None)
+
+    asyncio.run(database.get_email(1, "INBOX"))
+    asyncio.run(database.get_email(1, "INBOX"))
+
+    assert calls == [1, 1]
+
+
+def test_row_cache_evicts_oldest_entry_when_full(monkeypatch):
+    monkeypatch.setattr(database, "ROW_CACHE_SIZE", 2)
+    cache: dict = {}
+
+    database._row_cache_put(cache, "a", 1)
+    database._row_cache_put(cache, "b", 2)
+    database._row_cache_put(cache, "c", 3)
+
+    assert database._row_cache_get(cache, "a") == (False, None)
+    assert database._row_cache_get(cache, "c") == (True, 3)
+
+
+def test_concurrent_lazy_init_opens_one_database(monkeypatch):
+    opened = []
+
+    def open_db():
+        time.sleep(0.05)
+        opened.append(object())
+        return opened[-1]
+
+    monkeypatch.setattr(database, "_open_db", open_db)
+    monkeypatch.setattr(database, "_db", None)
+
+    threads = [threading.Thread(target=database.get_db) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(opened) == 1
+    assert database.get_db() is opened[0]
+
+
+def test_contact_sync_clears_row_and_list_caches(monkeypatch):
+    monkeypatch.setattr(
+        database.contact_q, "upsert_contacts_bulk", lambda db, rows: None
+    )
+    monkeypatch.setattr(database, "get_db", lambda: None)
+    database._contact_row_cache["a@example.com"] = (time.monotonic() + 30, {})
+    database._contacts_cache[("recent", 10)] = (time.monotonic() + 60, [])
+
+    database.upsert_contacts_bulk([])
+
+    assert not database._contact_row_cache
+    assert not database._contacts_cache
@@ -0,0 +1,45 @@
+import asyncio
+import json
+
+import httpx
+
+from workspace_secretary.web import engine_client
+
+
+def _capture_requests(monkeypatch) -> list[httpx.Request]:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    client = httpx.AsyncClient(
+        base_url="http://engine", transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(engine_client, "_client", client)
+    return seen
+
+
+def test_calendar_ids_are_encoded(monkeypatch):
+    seen = _capture_requests(monkeypatch)
+    calendar_id = "en.usa#holiday@group.v.calendar.google.com"
+
+    asyncio.run(engine_client.get_conference_solutions(calendar_id))
+    asyncio.run(engine_client.get_calendar_event(calendar_id, "abc"))
+
+    assert seen[0].url.params["calendar_id"] == calendar_id
+    assert seen[1].url.raw_path.startswith(b"/api/calendar/en.usa%23holiday%40")
+
+
+def test_request_sends_and_parses_json(monkeypatch):
+    seen = _capture_requests(monkeypatch)
+
+    result = asyncio.run(engine_client.move_email(7, "INBOX", "Archive"))
+
+    assert result == {}
+    assert seen[0].headers["content-type"] == "application/json"
+    assert json.loads(seen[0].content) == {
+        "uid": 7,
+        "folder": "INBOX",
+        "destination": "Archive",
+    }
@@ -0,0 +1,95 @@
+import os
+from datetime import datetime, timezone
+
+from fastapi import Response
+from starlette.requests import Request
+
+from workspace_secretary.web.routes import inbox
+from workspace_secretary.web.routes.inbox import (
+    decode_cursor,
+    encode_cursor,
+    not_modified,
+    to_list_item,
+    with_cache_headers,
+)
+
+
+def test_cursor_roundtrip():
+    date = datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+    cursor = encode_cursor({"uid": 42, "date": date})
+
+    assert decode_cursor(cursor) == (date, 42)
+
+
+def test_cursor_handles_missing_or_invalid_values():
+    assert encode_cursor({"uid": 1, "date": None}) is None
+    assert decode_cursor(None) is None
+    assert decode_cursor("not-a-cursor") is None
+    assert decode_cursor("2024-01-02T03:04:05_abc") is None
+
+
+def _request(headers: dict[str, str]) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_not_modified_only_on_matching_etag():
+    etag = 'W/"abc"'
+
+    assert not_modified(_request({}), etag) is None
+    assert not_modified(_request({"If-None-Match": 'W/"other"'}), etag) is None
+
+    response = not_modified(_request({"If-None-Match": etag}), etag)
+    assert response is not None
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_with_cache_headers_requires_revalidation():
+    response = with_cache_headers(Response("body"), 'W/"abc"')
+
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_to_list_item_shapes_row_for_templates():
+    item = to_list_item(
+        {
+            "uid": 7,
+            "folder": "INBOX",
+            "from_addr": '"Ada" <ada@example.com>',
+            "subject": "Hi",
+            "preview": "x" * 200,
+            "date": None,
+            "gmail_labels": ["\\Starred"],
+        },
+        preview_length=80,
+    )
+
+    assert item.uid == 7
+    assert item.from_name == "Ada"
+    assert item.is_starred is True
+    assert item.is_unread is False
+    assert item.date == ""
+    assert len(item.preview) <= 83
+
+
+def test_to_list_item_prefers_stored_starred_flag():
+    row = {"uid": 1, "folder": "INBOX", "is_starred": False}
+
+    assert to_list_item({**row, "gmail_labels": ["\\Starred"]}).is_starred is False
+    assert to_list_item({**row, "is_starred": True}).is_starred is True
+
+
+def test_markup_version_tracks_templates(tmp_path, monkeypatch):
+    template = tmp_path / "inbox.html"
+    template.write_text("<ul></ul>")
+    monkeypatch.setattr(inbox, "_TEMPLATES_DIR", tmp_path)
+
+    inbox.markup_version.cache_clear()
+    before = inbox.markup_version()
+    os.utime(template, ns=(1, template.stat().st_mtime_ns + 1_000_000_000))
+    inbox.markup_version.cache_clear()
+
+    assert inbox.markup_version() != before
+    inbox.markup_version.cache_clear()
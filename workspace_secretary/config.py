@@ -335,6 +335,27 @@ class WebApiFormat(Enum):
             )
 
 
+def _setting_or_env(data: Dict[str, Any], key: str, env_var: str, default: Any) -> Any:
+    """Return a config value, else the environment variable, else ``default``.
+
+    Only a missing or null key counts as unset, so an explicit 0 in the
+    config file is kept.
+    """
+    value = data.get(key)
+    if value is None:
+        return os.environ.get(env_var, default)
+    return value
+
+
+def default_pool_max_size() -> int:
+    """Default connection pool ceiling: two connections per core plus one.
+
+    Never drops below the previous fixed size of 10 so small hosts keep the
+    headroom the web UI's worker threads rely on.
+    """
+    return max(10, 2 * (os.cpu_count() or 1) + 1)
+
+
 @dataclass
 class PostgresConfig:
     """PostgreSQL database configuration."""
@@ -345,6 +366,13 @@ class PostgresConfig:
     user: str = "secretary"
     password: str = ""
     ssl_mode: str = "prefer"
+    pool_min_size: int = 1
+    pool_max_size: int = field(default_factory=default_pool_max_size)
+    pool_max_lifetime: float = 1800.0
+    pool_max_idle: float = 300.0
+    # Executions before psycopg server-side prepares a query; None disables
+    # prepared statements (needed behind PgBouncer in transaction mode).
+    prepare_threshold: Optional[int] = 1
 
     @property
     def connection_string(self) -> str:
@@ -360,6 +388,17 @@ class PostgresConfig:
             user=data.get("user") or os.environ.get("POSTGRES_USER", "secretary"),
             password=data.get("password") or os.environ.get("POSTGRES_PASSWORD", ""),
             ssl_mode=data.get("ssl_mode", "prefer"),
+            pool_min_size=int(
+                _setting_or_env(data, "pool_min_size", "POSTGRES_POOL_MIN", 1)
+            ),
+            pool_max_size=int(
+                _setting_or_env(
+                    data, "pool_max_size", "POSTGRES_POOL_MAX", default_pool_max_size()
+                )
+            ),
+            pool_max_lifetime=float(data.get("pool_max_lifetime", 1800.0)),
+            pool_max_idle=float(data.get("pool_max_idle", 300.0)),
+            prepare_threshold=data.get("prepare_threshold", 1),
         )
 
 
@@ -374,6 +413,9 @@ class EmbeddingsConfig:
     model: str = "text-embedding-3-small"
     api_key: str = ""
     dimensions: int = 3072  # 3072 recommended for best quality
+    # Stored column type: "vector" (fp32) or "halfvec" (fp16). Unset picks
+    # halfvec above 2000 dimensions, where pgvector's HNSW needs it anyway.
+    vector_type: Optional[str] = None
     batch_size: int = 100
     max_chars: int = 8000  # Gemini limit
     # Cohere-specific options
@@ -384,6 +426,13 @@ class EmbeddingsConfig:
     gemini_model: str = "text-embedding-004"
     task_type: str = "RETRIEVAL_DOCUMENT"
 
+    def __post_init__(self):
+        if self.vector_type not in (None, "vector", "halfvec"):
+            raise ValueError(
+                f"Invalid embeddings vector_type: {self.vector_type}. "
+                "Must be 'vector' or 'halfvec'"
+            )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EmbeddingsConfig":
         api_key = (
@@ -402,6 +451,7 @@ class EmbeddingsConfig:
             model=data.get("model", "text-embedding-3-small"),
             api_key=api_key,
             dimensions=data.get("dimensions", 3072),
+            vector_type=data.get("vector_type"),
             batch_size=data.get("batch_size", 100),
             max_chars=data.get("max_chars", 8000),
             input_type=data.get("input_type", "search_document"),
@@ -9,7 +9,7 @@ Web imports this directly for read-only operations.
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Any, Iterator
+from typing import Any, Iterator, Optional
 
 from workspace_secretary.db.types import DatabaseInterface
 from workspace_secretary.db import schema
@@ -32,6 +32,12 @@ class PostgresDatabase(DatabaseInterface):
         password: str = "",
         ssl_mode: str = "prefer",
         embedding_dimensions: int = 1536,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_max_lifetime: float = 1800.0,
+        pool_max_idle: float = 300.0,
+        prepare_threshold: Optional[int] = 1,
+        vector_type: Optional[str] = None,
     ):
         self.host = host
         self.port = port
@@ -40,11 +46,16 @@ class PostgresDatabase(DatabaseInterface):
         self.password = password
         self.ssl_mode = ssl_mode
         self.embedding_dimensions = embedding_dimensions
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_max_lifetime = pool_max_lifetime
+        self.pool_max_idle = pool_max_idle
+        self.prepare_threshold = prepare_threshold
         self._pool: Any = None
-        self._vector_type = "halfvec" if embedding_dimensions > 2000 else "vector"
-        self._vector_ops = (
-            "halfvec_ip_ops" if embedding_dimensions > 2000 else "vector_ip_ops"
+        self._vector_type = vector_type or (
+            "halfvec" if embedding_dimensions > 2000 else "vector"
         )
+        self._vector_ops = f"{self._vector_type}_ip_ops"
 
     def supports_embeddings(self) -> bool:
         """PostgreSQL with pgvector always supports embeddings."""
@@ -70,8 +81,18 @@ class PostgresDatabase(DatabaseInterface):
             )
 
         self._pool = ConnectionPool(
-            self._get_connection_string(), min_size=1, max_size=10
-        )
+            self._get_connection_string(),
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            max_lifetime=self.pool_max_lifetime,
+            max_idle=self.pool_max_idle,
+            check=ConnectionPool.check_connection,
+            kwargs={"prepare_threshold": self.prepare_threshold},
+            open=True,
+        )
+        # Block until min_size connections are up, so the first request
+        # after startup does not pay for connection setup.
+        self._pool.wait()
 
         # Initialize all schemas using shared schema module
         with self._pool.connection() as conn:
@@ -86,6 +107,8 @@ class PostgresDatabase(DatabaseInterface):
                 schema.initialize_calendar_schema(cur)
                 schema.initialize_mutation_journal(cur)
                 schema.create_indexes(cur, self._vector_type)
+                schema.initialize_search_suggestion_views(cur)
+                schema.create_quantized_embeddings_index(cur, self.embedding_dimensions)
                 conn.commit()
 
     @contextmanager
@@ -100,6 +123,16 @@ class PostgresDatabase(DatabaseInterface):
         with self._pool.connection() as conn:
             yield conn
 
+    def pool_stats(self) -> dict[str, int]:
+        """Return a snapshot of connection pool usage counters."""
+        if not self._pool:
+            return {}
+        stats = self._pool.get_stats()
+        return {
+            key: stats.get(key, 0)
+            for key in ("pool_size", "pool_available", "requests_waiting")
+        }
+
     def close(self) -> None:
         """Close connection pool and release resources."""
         if self._pool:
@@ -244,7 +277,7 @@ class PostgresDatabase(DatabaseInterface):
         )
 
     def get_thread_emails(
-        self, uid: int, folder: str = "INBOX"
+        self, uid: int, folder: str = "INBOX", include_body: bool = False
     ) -> list[dict[str, Any]]:
         raise NotImplementedError(
             "CRUD methods not yet extracted to base. Use engine.database for now."
@@ -353,6 +386,8 @@ class PostgresDatabase(DatabaseInterface):
         subject_contains: str | None = None,
         body_contains: str | None = None,
         limit: int = 100,
+        summary_only: bool = False,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         raise NotImplementedError(
             "CRUD methods not yet extracted to base. Use engine.database for now."
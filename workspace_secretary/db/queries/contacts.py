@@ -50,14 +50,28 @@ def add_contact_interaction(
     email_date: str,
     message_id: Optional[str] = None,
 ) -> None:
-    """Record interaction with contact and update stats."""
+    """Record interaction with contact and update stats.
+
+    Insert and counter update run as one statement; the update joins the
+    insert's RETURNING row, so replaying an interaction that is already
+    recorded leaves the contact's stats untouched.
+    """
     with db.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
-                INSERT INTO contact_interactions (contact_id, email_uid, email_folder, direction, subject, email_date, message_id)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (contact_id, email_uid, email_folder, direction) DO NOTHING
+                WITH ins AS (
+                    INSERT INTO contact_interactions (contact_id, email_uid, email_folder, direction, subject, email_date, message_id)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (contact_id, email_uid, email_folder, direction) DO NOTHING
+                    RETURNING contact_id, email_date
+                )
+                UPDATE contacts 
+                SET email_count = email_count + 1,
+                    last_email_date = GREATEST(COALESCE(last_email_date, ins.email_date), ins.email_date),
+                    updated_at = CURRENT_TIMESTAMP
+                FROM ins
+                WHERE contacts.id = ins.contact_id
                 """,
                 (
                     contact_id,
@@ -69,15 +83,90 @@ def add_contact_interaction(
                     message_id,
                 ),
             )
+            conn.commit()
+
+
+def upsert_contacts_bulk(
+    db: DatabaseInterface,
+    rows: list[tuple[Any, ...]],
+) -> None:
+    """Upsert many contacts and record their interactions in one transaction.
+
+    Each row is ``(email, display_name, first_name, last_name, email_uid,
+    email_folder, direction, subject, email_date, message_id)``. Rows are
+    streamed into a session temp table with COPY, then merged with two
+    set-based statements that apply the same rules as
+    :func:`upsert_contact` and :func:`add_contact_interaction`.
+    """
+    if not rows:
+        return
+
+    with db.connection() as conn:
+        with conn.cursor() as cur:
             cur.execute(
                 """
+                CREATE TEMP TABLE IF NOT EXISTS contact_staging (
+                    email TEXT,
+                    display_name TEXT,
+                    first_name TEXT,
+                    last_name TEXT,
+                    email_uid INT,
+                    email_folder TEXT,
+                    direction TEXT,
+                    subject TEXT,
+                    email_date TIMESTAMPTZ,
+                    message_id TEXT
+                ) ON COMMIT DELETE ROWS
+                """
+            )
+            with cur.copy(
+                """
+                COPY contact_staging (email, display_name, first_name, last_name,
+                    email_uid, email_folder, direction, subject, email_date, message_id)
+                FROM STDIN
+                """
+            ) as copy:
+                for row in rows:
+                    copy.write_row(row)
+
+            # One row per address; prefer a real name over the bare address
+            cur.execute(
+                """
+                INSERT INTO contacts (email, display_name, first_name, last_name, first_email_date, email_count)
+                SELECT DISTINCT ON (email)
+                       email, display_name, first_name, last_name, CURRENT_TIMESTAMP, 1
+                FROM contact_staging
+                ORDER BY email, (display_name IS DISTINCT FROM email) DESC
+                ON CONFLICT (email) DO UPDATE SET
+                    display_name = COALESCE(EXCLUDED.display_name, contacts.display_name),
+                    first_name = COALESCE(EXCLUDED.first_name, contacts.first_name),
+                    last_name = COALESCE(EXCLUDED.last_name, contacts.last_name),
+                    updated_at = CURRENT_TIMESTAMP
+                """
+            )
+            cur.execute(
+                """
+                WITH ins AS (
+                    INSERT INTO contact_interactions (contact_id, email_uid, email_folder, direction, subject, email_date, message_id)
+                    SELECT c.id, s.email_uid, s.email_folder, s.direction,
+                           s.subject, s.email_date, s.message_id
+                    FROM contact_staging s
+                    JOIN contacts c ON c.email = s.email
+                    WHERE s.email_date IS NOT NULL
+                    ON CONFLICT (contact_id, email_uid, email_folder, direction) DO NOTHING
+                    RETURNING contact_id, email_date
+                ),
+                stats AS (
+                    SELECT contact_id, COUNT(*) AS n, MAX(email_date) AS latest
+                    FROM ins GROUP BY contact_id
+                )
                 UPDATE contacts 
-                SET email_count = email_count + 1,
-                    last_email_date = GREATEST(COALESCE(last_email_date, %s), %s),
+                SET email_count = email_count + stats.n,
+                    last_email_date = GREATEST(COALESCE(last_email_date, stats.latest), stats.latest),
                     updated_at = CURRENT_TIMESTAMP
-                WHERE id = %s
-                """,
-                (email_date, email_date, contact_id),
+                FROM stats
+                WHERE contacts.id = stats.contact_id
+                """
             )
             conn.commit()
 
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 from psycopg.rows import dict_row
@@ -15,6 +18,24 @@ from workspace_secretary.db.types import DatabaseInterface
 # Core Email CRUD Operations (from engine/database.py)
 # ============================================================================
 
+# Columns needed to render an email in a result list (no bodies).
+SUMMARY_COLUMNS = (
+    "uid, folder, from_addr, to_addr, cc_addr, subject, date, is_unread, flags"
+)
+
+# Message headers and attachment names, without the bodies.
+HEADER_COLUMNS = f"""{SUMMARY_COLUMNS}, message_id, in_reply_to, references_header,
+    gmail_thread_id, gmail_labels, has_attachments, attachment_filenames"""
+
+# Columns needed to show a message in a conversation view.
+THREAD_COLUMNS = f"{HEADER_COLUMNS}, body_text, body_html"
+
+# Full message detail; leaves out sync bookkeeping (content_hash, modseq,
+# synced_at) that no reader of a single email uses.
+EMAIL_COLUMNS = f"""{THREAD_COLUMNS}, bcc_addr, internal_date, is_important, size,
+    gmail_msgid, auth_results_raw, spf, dkim, dmarc, is_suspicious_sender,
+    suspicious_sender_signals, security_score, warning_type"""
+
 
 def upsert_email(
     db: DatabaseInterface,
@@ -183,7 +204,22 @@ def get_email(
     with db.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                "SELECT * FROM emails WHERE uid = %s AND folder = %s",
+                f"SELECT {EMAIL_COLUMNS} FROM emails WHERE uid = %s AND folder = %s",
+                (uid, folder),
+            )
+            return cur.fetchone()
+
+
+def get_email_headers(
+    db: DatabaseInterface,
+    uid: int,
+    folder: str,
+) -> Optional[dict[str, Any]]:
+    """Get an email's headers and attachment names, without its bodies."""
+    with db.connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                f"SELECT {HEADER_COLUMNS} FROM emails WHERE uid = %s AND folder = %s",
                 (uid, folder),
             )
             return cur.fetchone()
@@ -200,7 +236,8 @@ def get_emails_by_uids(
     with db.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                "SELECT * FROM emails WHERE folder = %s AND uid = ANY(%s) ORDER BY date DESC",
+                f"SELECT {EMAIL_COLUMNS} FROM emails"
+                " WHERE folder = %s AND uid = ANY(%s) ORDER BY date DESC",
                 (folder, uids),
             )
             return cur.fetchall()
@@ -215,8 +252,15 @@ def search_emails(
     subject_contains: Optional[str] = None,
     body_contains: Optional[str] = None,
     limit: int = 100,
+    summary_only: bool = False,
+    offset: int = 0,
 ) -> list[dict[str, Any]]:
-    """Search emails with basic filters."""
+    """Search emails with basic filters.
+
+    With ``summary_only`` only the header columns in ``SUMMARY_COLUMNS`` are
+    fetched, which keeps message bodies off the wire for list views.
+    ``offset`` skips that many matches, for paging through results.
+    """
     conditions = ["folder = %s"]
     params: list[Any] = [folder]
 
@@ -236,8 +280,9 @@ def search_emails(
         conditions.append("subject ILIKE %s")
         params.append(f"%{subject_contains}%")
 
-    query = f"SELECT * FROM emails WHERE {' AND '.join(conditions)} ORDER BY date DESC LIMIT %s"
-    params.append(limit)
+    columns = SUMMARY_COLUMNS if summary_only else EMAIL_COLUMNS
+    query = f"SELECT {columns} FROM emails WHERE {' AND '.join(conditions)} ORDER BY date DESC LIMIT %s OFFSET %s"
+    params.extend([limit, offset])
 
     with db.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
@@ -285,12 +330,19 @@ def mark_email_read(
 
 
 def get_synced_uids(db: DatabaseInterface, folder: str) -> list[int]:
-    """Get all synced UIDs for a folder."""
+    """Get all synced UIDs for a folder.
+
+    Large folders hold hundreds of thousands of UIDs, so rows are streamed
+    in single-row mode rather than buffered as a full result first.
+    """
     with db.connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("SELECT uid FROM emails WHERE folder = %s", (folder,))
-            rows = cur.fetchall()
-            return [int(row[0]) for row in rows]
+            return [
+                int(row[0])
+                for row in cur.stream(
+                    "SELECT uid FROM emails WHERE folder = %s", (folder,)
+                )
+            ]
 
 
 def count_emails(db: DatabaseInterface, folder: str) -> int:
@@ -482,6 +534,42 @@ def log_sync_error(
 # ============================================================================
 
 
+_INBOX_COLUMNS = """uid, folder, from_addr, to_addr, cc_addr, subject,
+               preview, date, is_unread, has_attachments,
+               gmail_labels"""
+# Only what the web list renders; every column is held by the covering
+# idx_emails_folder_list_cov indexes, so folder views are index-only scans.
+# Sender and subject come from their bounded list_* copies.
+_INBOX_LIST_COLUMNS = """uid, folder, list_from AS from_addr,
+               list_subject AS subject, preview, date,
+               is_unread, has_attachments, is_starred"""
+
+
+def _build_inbox_sql(
+    by_label: bool, unread_only: bool, keyset: bool, list_only: bool
+) -> str:
+    filters = ["gmail_labels::jsonb ? %s" if by_label else "folder = %s"]
+    if unread_only:
+        filters.append("is_unread = true")
+    if keyset:
+        filters.append("(date, uid) < (%s, %s)")
+    return f"""
+        SELECT {_INBOX_LIST_COLUMNS if list_only else _INBOX_COLUMNS}
+        FROM emails 
+        WHERE {" AND ".join(filters)}
+        ORDER BY date DESC, uid DESC
+        LIMIT %s OFFSET %s
+    """
+
+
+# Every (label, unread, keyset, list_only) variant, built once so each has
+# fixed text.
+_INBOX_SQL = {
+    flags: _build_inbox_sql(*flags)
+    for flags in itertools.product((False, True), repeat=4)
+}
+
+
 def get_inbox_emails(
     db: DatabaseInterface,
     folder: str,
@@ -489,6 +577,8 @@ def get_inbox_emails(
     offset: int,
     unread_only: bool = False,
     label: Optional[str] = None,
+    before: Optional[tuple[datetime, int]] = None,
+    list_only: bool = False,
 ) -> list[dict[str, Any]]:
     """Get inbox emails with preview for list view.
 
@@ -496,38 +586,21 @@ def get_inbox_emails(
         db: Database interface
         folder: IMAP folder name (ignored if label is specified)
         limit: Max emails to return
-        offset: Pagination offset
+        offset: Pagination offset (ignored when ``before`` is given)
         unread_only: Only return unread emails
         label: Gmail label to filter by (e.g., "Secretary/Priority")
+        before: Keyset cursor ``(date, uid)`` of the last row already shown;
+            only older emails are returned, without scanning skipped rows
+        list_only: Return just the columns an email list renders, with
+            ``is_starred`` in place of the raw recipients and labels
     """
-    # Build filter conditions
-    filters = []
-    params: list[Any] = []
-
-    if label:
-        # Filter by Gmail label (stored as JSON array)
-        filters.append("gmail_labels::jsonb ? %s")
-        params.append(label)
-    else:
-        # Filter by folder
-        filters.append("folder = %s")
-        params.append(folder)
-
-    if unread_only:
-        filters.append("is_unread = true")
-
-    where_clause = " AND ".join(filters)
-
-    sql = f"""
-        SELECT uid, folder, from_addr, to_addr, cc_addr, subject, 
-               LEFT(body_text, 200) as preview, date, is_unread, has_attachments,
-               gmail_labels
-        FROM emails 
-        WHERE {where_clause}
-        ORDER BY date DESC 
-        LIMIT %s OFFSET %s
-    """
+    # Label filter (stored as JSON array) takes precedence over folder
+    params: list[Any] = [label if label else folder]
+    if before:
+        params.extend(before)
+        offset = 0
     params.extend([limit, offset])
+    sql = _INBOX_SQL[(bool(label), unread_only, before is not None, list_only)]
 
     with db.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
@@ -535,95 +608,158 @@ def get_inbox_emails(
             return cur.fetchall()
 
 
+_NEIGHBOR_UIDS_SQL = """
+    WITH anchor AS (
+        SELECT date FROM emails WHERE uid = %s AND folder = %s
+    )
+    (
+        SELECT 'next' AS kind, e.uid FROM emails e, anchor
+        WHERE e.folder = %s {unread_filter}
+        AND (e.date, e.uid) > (anchor.date, %s)
+        ORDER BY e.date ASC, e.uid ASC LIMIT 1
+    )
+    UNION ALL
+    (
+        SELECT 'prev' AS kind, e.uid FROM emails e, anchor
+        WHERE e.folder = %s {unread_filter}
+        AND (e.date, e.uid) < (anchor.date, %s)
+        ORDER BY e.date DESC, e.uid DESC LIMIT 1
+    )
+"""
+# One fixed query text per variant so psycopg's auto-prepare can reuse plans.
+NEIGHBOR_UIDS_SQL = _NEIGHBOR_UIDS_SQL.format(unread_filter="")
+NEIGHBOR_UIDS_UNREAD_SQL = _NEIGHBOR_UIDS_SQL.format(
+    unread_filter="AND e.is_unread = true"
+)
+
+
 def get_neighbor_uids(
     db: DatabaseInterface,
     folder: str,
     uid: int,
     unread_only: bool = False,
 ) -> dict[str, Optional[int]]:
-    """Get UIDs of next and previous emails for navigation."""
+    """Get UIDs of next and previous emails for navigation.
+
+    The current email's date and both neighbours are resolved in a single
+    round trip: a CTE looks up the anchor row and two ``LIMIT 1`` branches
+    walk the (folder, date, uid) index in each direction.
+    """
+    sql = NEIGHBOR_UIDS_UNREAD_SQL if unread_only else NEIGHBOR_UIDS_SQL
+    neighbors: dict[str, Optional[int]] = {"next": None, "prev": None}
     with db.connection() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
-            # Get current email's date
-            cur.execute(
-                "SELECT date FROM emails WHERE uid = %s AND folder = %s",
-                (uid, folder),
-            )
-            current = cur.fetchone()
-            if not current:
-                return {"next": None, "prev": None}
-
-            current_date = current["date"]
-            unread_filter = "AND is_unread = true" if unread_only else ""
-
-            # Next (Newer) - ORDER BY date ASC
-            sql_next = f"""
-                SELECT uid FROM emails 
-                WHERE folder = %s {unread_filter}
-                AND (date > %s OR (date = %s AND uid > %s))
-                ORDER BY date ASC, uid ASC LIMIT 1
-            """
-            cur.execute(sql_next, (folder, current_date, current_date, uid))
-            next_row = cur.fetchone()
-
-            # Previous (Older) - ORDER BY date DESC
-            sql_prev = f"""
-                SELECT uid FROM emails 
-                WHERE folder = %s {unread_filter}
-                AND (date < %s OR (date = %s AND uid < %s))
-                ORDER BY date DESC, uid DESC LIMIT 1
-            """
-            cur.execute(sql_prev, (folder, current_date, current_date, uid))
-            prev_row = cur.fetchone()
-
-            return {
-                "next": next_row["uid"] if next_row else None,
-                "prev": prev_row["uid"] if prev_row else None,
-            }
+        with conn.cursor() as cur:
+            cur.execute(sql, (uid, folder, folder, uid, folder, uid))
+            for kind, neighbor_uid in cur.fetchall():
+                neighbors[kind] = neighbor_uid
+    return neighbors
 
 
-def get_thread(
+# Gmail stores one message under several folders (INBOX, All Mail, labels);
+# thread queries keep one row per Message-ID, preferring the requested folder.
+_THREAD_MESSAGE_KEY = "COALESCE(message_id, folder || '/' || uid)"
+
+
+def get_thread_emails(
     db: DatabaseInterface,
     uid: int,
     folder: str,
+    include_body: bool = False,
 ) -> list[dict[str, Any]]:
-    """Get email thread by reconstructing from message-id/references."""
+    """Get all emails in a conversation via Gmail's X-GM-THRID.
+
+    The anchor lookup and the thread fetch run as one statement, so a whole
+    conversation costs a single round-trip. Each row carries a 150-character
+    ``snippet``; full bodies are only fetched when ``include_body`` is set.
+    Falls back to message-id reconstruction (:func:`get_thread`) for mail
+    synced without a Gmail thread id.
+    """
+    columns = (
+        f"{SUMMARY_COLUMNS}, "
+        "LEFT(COALESCE(NULLIF(body_text, ''), body_html, ''), 150) AS snippet"
+    )
+    if include_body:
+        columns += ", body_text, body_html"
+
     with db.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                "SELECT message_id, in_reply_to, references_header FROM emails WHERE uid = %s AND folder = %s",
-                (uid, folder),
+                f"""
+                WITH anchor AS (
+                    SELECT gmail_thread_id FROM emails
+                    WHERE uid = %s AND folder = %s AND gmail_thread_id IS NOT NULL
+                )
+                SELECT * FROM (
+                    SELECT DISTINCT ON ({_THREAD_MESSAGE_KEY}) {columns}
+                    FROM emails
+                    WHERE gmail_thread_id = (SELECT gmail_thread_id FROM anchor)
+                    ORDER BY {_THREAD_MESSAGE_KEY}, folder = %s DESC
+                ) thread
+                ORDER BY date ASC
+                """,
+                (uid, folder, folder),
             )
-            row = cur.fetchone()
-            if not row:
-                return []
+            rows = cur.fetchall()
 
-            message_id = row["message_id"]
-            in_reply_to = row["in_reply_to"] or ""
-            references = row["references_header"] or ""
+    if rows:
+        return rows
+    return _reconstruct_thread(db, uid, folder, columns)
 
-            related_ids = set()
-            if message_id:
-                related_ids.add(message_id)
-            for ref in (in_reply_to + " " + references).split():
-                if ref:
-                    related_ids.add(ref)
 
-            if not related_ids:
-                cur.execute(
-                    "SELECT * FROM emails WHERE uid = %s AND folder = %s",
-                    (uid, folder),
-                )
-                single = cur.fetchone()
-                return [single] if single else []
+def get_thread(
+    db: DatabaseInterface,
+    uid: int,
+    folder: str,
+) -> list[dict[str, Any]]:
+    """Get email thread by reconstructing from message-id/references.
 
+    A recursive CTE expands the seed email's Message-ID, In-Reply-To and
+    References into the transitive closure of linked ids, following every
+    reply and ancestor it reaches, so deep threads load in one round trip.
+    The seed itself is always included, which also covers emails with no
+    threading headers at all.
+    """
+    return _reconstruct_thread(db, uid, folder, THREAD_COLUMNS)
+
+
+def _reconstruct_thread(
+    db: DatabaseInterface,
+    uid: int,
+    folder: str,
+    columns: str,
+) -> list[dict[str, Any]]:
+    with db.connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                """
-                SELECT * FROM emails 
-                WHERE message_id = ANY(%s) OR in_reply_to = ANY(%s)
+                f"""
+                WITH RECURSIVE ids(mid) AS (
+                    SELECT regexp_split_to_table(
+                        COALESCE(message_id, '') || ' ' || COALESCE(in_reply_to, '')
+                            || ' ' || COALESCE(references_header, ''),
+                        '\\s+'
+                    )
+                    FROM emails WHERE uid = %s AND folder = %s
+                    UNION
+                    SELECT regexp_split_to_table(
+                        COALESCE(e.message_id, '') || ' ' || COALESCE(e.in_reply_to, '')
+                            || ' ' || COALESCE(e.references_header, ''),
+                        '\\s+'
+                    )
+                    FROM emails e
+                    JOIN ids ON ids.mid <> ''
+                        AND (e.message_id = ids.mid OR e.in_reply_to = ids.mid)
+                )
+                SELECT * FROM (
+                    SELECT DISTINCT ON ({_THREAD_MESSAGE_KEY}) {columns}
+                    FROM emails
+                    WHERE message_id = ANY(ARRAY(SELECT mid FROM ids WHERE mid <> ''))
+                       OR in_reply_to = ANY(ARRAY(SELECT mid FROM ids WHERE mid <> ''))
+                       OR (uid = %s AND folder = %s)
+                    ORDER BY {_THREAD_MESSAGE_KEY}, folder = %s DESC
+                ) thread
                 ORDER BY date ASC
-            """,
-                (list(related_ids), list(related_ids)),
+                """,
+                (uid, folder, uid, folder, folder),
             )
             return cur.fetchall()
 
@@ -640,12 +776,10 @@ def search_emails_fts(
             cur.execute(
                 """
                 SELECT uid, folder, from_addr, subject, 
-                       LEFT(body_text, 200) as preview, date, is_unread
+                       preview, date, is_unread
                 FROM emails 
-                WHERE folder = %s AND (
-                    to_tsvector('english', COALESCE(subject, '') || ' ' || COALESCE(body_text, '')) 
-                    @@ plainto_tsquery('english', %s)
-                )
+                WHERE folder = %s
+                AND search_tsv @@ plainto_tsquery('english', %s)
                 ORDER BY date DESC LIMIT %s
             """,
                 (folder, query, limit),
@@ -653,6 +787,18 @@ def search_emails_fts(
             return cur.fetchall()
 
 
+@lru_cache(maxsize=256)
+def _advanced_search_sql(conditions: tuple[str, ...]) -> str:
+    """Assemble the advanced search query for a given set of filter clauses."""
+    return f"""
+        SELECT uid, folder, from_addr, subject, 
+               preview, date, is_unread, has_attachments
+        FROM emails 
+        WHERE {" AND ".join(conditions)}
+        ORDER BY date DESC LIMIT %s
+    """
+
+
 def search_emails_advanced(
     db: DatabaseInterface,
     query: str,
@@ -665,12 +811,7 @@ def search_emails_advanced(
     params: list[Any] = [folder]
 
     if query.strip():
-        conditions.append(
-            """(
-                to_tsvector('english', COALESCE(subject, '') || ' ' || COALESCE(body_text, '')) 
-                @@ plainto_tsquery('english', %s)
-            )"""
-        )
+        conditions.append("search_tsv @@ plainto_tsquery('english', %s)")
         params.append(query)
 
     if filters.get("from_addr"):
@@ -703,21 +844,14 @@ def search_emails_advanced(
 
     if filters.get("is_starred") is not None:
         if filters["is_starred"]:
-            conditions.append("gmail_labels ? '\\\\Starred'")
+            conditions.append("is_starred")
 
     if filters.get("attachment_filename"):
         conditions.append("attachment_filenames::text ILIKE %s")
         params.append(f"%{filters['attachment_filename']}%")
 
     params.append(limit)
-
-    sql = f"""
-        SELECT uid, folder, from_addr, subject, 
-               LEFT(body_text, 200) as preview, date, is_unread, has_attachments
-        FROM emails 
-        WHERE {" AND ".join(conditions)}
-        ORDER BY date DESC LIMIT %s
-    """
+    sql = _advanced_search_sql(tuple(conditions))
 
     with db.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
@@ -730,40 +864,50 @@ def get_search_suggestions(
     query: str,
     limit: int = 5,
 ) -> list[dict[str, Any]]:
-    """Get search suggestions for autocomplete (senders and subjects)."""
-    suggestions: list[dict[str, Any]] = []
+    """Get search suggestions for autocomplete (senders and subjects).
+
+    Senders (most frequent first) are listed before subjects (most recent
+    first). Both come from the pre-aggregated ``email_sender_stats`` and
+    ``email_subject_recent`` views, so a keystroke is two trigram index
+    probes rather than two aggregates over ``emails``.
+    """
+    pattern = f"%{query}%"
     with db.connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
-            # Suggest senders
             cur.execute(
                 """
-                SELECT DISTINCT from_addr, COUNT(*) as cnt
-                FROM emails
-                WHERE from_addr ILIKE %s
-                GROUP BY from_addr
-                ORDER BY cnt DESC LIMIT %s
+                SELECT type, value FROM (
+                    (
+                        SELECT 'sender' AS type, from_addr AS value, 1 AS grp,
+                               ROW_NUMBER() OVER (ORDER BY cnt DESC) AS rank
+                        FROM email_sender_stats
+                        WHERE from_addr ILIKE %s
+                        ORDER BY cnt DESC LIMIT %s
+                    )
+                    UNION ALL
+                    (
+                        SELECT 'subject', subject, 2,
+                               ROW_NUMBER() OVER (ORDER BY last_date DESC)
+                        FROM email_subject_recent
+                        WHERE subject ILIKE %s
+                        ORDER BY last_date DESC LIMIT %s
+                    )
+                ) suggestions
+                ORDER BY grp, rank
+                LIMIT %s
                 """,
-                (f"%{query}%", limit),
+                (pattern, limit, pattern, limit, limit),
             )
-            for row in cur.fetchall():
-                suggestions.append({"type": "sender", "value": row["from_addr"]})
+            return cur.fetchall()
 
-            # Suggest subjects
-            cur.execute(
-                """
-                SELECT subject
-                FROM emails
-                WHERE subject ILIKE %s
-                GROUP BY subject
-                ORDER BY MAX(date) DESC LIMIT %s
-                """,
-                (f"%{query}%", limit),
-            )
-            for row in cur.fetchall():
-                if row["subject"]:
-                    suggestions.append({"type": "subject", "value": row["subject"]})
 
-    return suggestions[:limit]
+def refresh_search_suggestions(db: DatabaseInterface) -> None:
+    """Rebuild the autocomplete views without blocking readers."""
+    with db.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY email_sender_stats")
+            cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY email_subject_recent")
+            conn.commit()
 
 
 def get_new_priority_emails(
@@ -778,7 +922,7 @@ def get_new_priority_emails(
                 cur.execute(
                     """
                     SELECT uid, folder, from_addr, subject, 
-                           LEFT(body_text, 200) as preview, date
+                           preview, date
                     FROM emails
                     WHERE date > %s
                       AND is_unread = true
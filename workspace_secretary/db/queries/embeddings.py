@@ -2,13 +2,52 @@
 
 from __future__ import annotations
 
+import struct
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any, cast
 
+import psycopg
+from psycopg.adapt import Dumper
+from psycopg.pq import Format
 from psycopg.rows import dict_row
 
 from workspace_secretary.db.types import DatabaseInterface
 
 
+class PackedVector:
+    """An embedding bound in pgvector's own binary wire format."""
+
+    __slots__ = ("values", "half")
+
+    def __init__(self, values: Sequence[float], half: bool = False) -> None:
+        self.values = values
+        self.half = half
+
+
+class _PackedVectorDumper(Dumper):
+    """Dump a :class:`PackedVector` as ``vector``/``halfvec`` binary input.
+
+    The layout is what pgvector's receive functions read: uint16 dimension,
+    uint16 unused, then big-endian float4 (or float16 for halfvec) values,
+    i.e. 4 (or 2) bytes per component. The oid stays 0 so the server takes
+    the type from the ``::vector`` cast or the target column.
+    """
+
+    format = Format.BINARY
+
+    def dump(self, obj: PackedVector) -> bytes:
+        n = len(obj.values)
+        return struct.pack(f">HH{n}{'e' if obj.half else 'f'}", n, 0, *obj.values)
+
+
+psycopg.adapters.register_dumper(PackedVector, _PackedVectorDumper)
+
+
+def _pack(db: DatabaseInterface, embedding: Sequence[float]) -> PackedVector:
+    return PackedVector(embedding, half=cast(Any, db)._vector_type == "halfvec")
+
+
 def upsert_embedding(
     db: DatabaseInterface,
     uid: int,
@@ -17,57 +56,129 @@ def upsert_embedding(
     model: str,
     content_hash: str,
 ) -> None:
-    """Insert or update email embedding."""
+    """Insert or update email embedding.
+
+    The vector is bound in pgvector's binary format (see
+    :class:`PackedVector`): about 6 KB for 1536 dimensions instead of
+    ~32 KB of decimal text, and no float parsing on the server.
+    """
     with db.connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 """
                 INSERT INTO email_embeddings (email_uid, email_folder, embedding, model, content_hash)
-                VALUES (%s, %s, %s, %s, %s)
+                VALUES (%s, %s, %b, %s, %s)
                 ON CONFLICT (email_uid, email_folder) DO UPDATE SET
                     embedding = EXCLUDED.embedding,
                     model = EXCLUDED.model,
                     content_hash = EXCLUDED.content_hash,
                     created_at = NOW()
                 """,
-                (uid, folder, embedding, model, content_hash),
+                (uid, folder, _pack(db, embedding), model, content_hash),
             )
             conn.commit()
 
 
+# pgvector's HNSW scan returns at most ``hnsw.ef_search`` rows (1000 max) and
+# defaults to 40. Searches raise it per transaction: higher values trade
+# latency for recall.
+HNSW_EF_SEARCH = 100
+HNSW_EF_SEARCH_MAX = 1000
+
+# Nearest neighbours fetched from the HNSW index before metadata filters run.
+SEMANTIC_CANDIDATES = 500
+
+# Quantized candidates per requested result in the two-stage semantic search.
+QUANTIZED_OVERSAMPLE = 10
+
+
+def _set_ef_search(conn: Any, ef_search: int) -> None:
+    """Set hnsw.ef_search for the current transaction only.
+
+    Callers issue this inside ``conn.pipeline()`` together with the search
+    itself, so it costs no extra round trip, and the pooled connection
+    keeps its default afterwards.
+    """
+    conn.execute(
+        "SELECT set_config('hnsw.ef_search', %s, true)",
+        (str(min(ef_search, HNSW_EF_SEARCH_MAX)),),
+    )
+
+
 def semantic_search(
     db: DatabaseInterface,
     query_embedding: list[float],
     folder: str,
     limit: int,
     threshold: float = 0.5,
+    ef_search: int = HNSW_EF_SEARCH,
 ) -> list[dict[str, Any]]:
-    """Semantic search using inner product on normalized vectors."""
+    """Semantic search using inner product on normalized vectors.
+
+    Two stages: the ``cand`` CTE walks the Hamming index over
+    binary-quantized embeddings for ``limit * QUANTIZED_OVERSAMPLE``
+    neighbours, touching one bit per dimension, and only those are
+    re-ranked by the exact inner product. The query vector is bound once,
+    in binary, and referenced through scalar subqueries. ``ef_search``
+    sizes the HNSW search beam; it is raised to the candidate count.
+    """
     vtype = cast(Any, db)._vector_type
-    with db.connection() as conn:
+    bits = f"bit({cast(Any, db).embedding_dimensions})"
+    candidates = min(limit * QUANTIZED_OVERSAMPLE, HNSW_EF_SEARCH_MAX)
+    with db.connection() as conn, conn.pipeline():
+        _set_ef_search(conn, max(ef_search, candidates))
         with conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
                 f"""
+                WITH q AS (SELECT %b::{vtype} AS v),
+                cand AS (
+                    SELECT email_uid, email_folder, embedding
+                    FROM email_embeddings
+                    WHERE email_folder = %s
+                    ORDER BY binary_quantize(embedding)::{bits}
+                             <~> binary_quantize((SELECT v FROM q))
+                    LIMIT %s
+                )
                 SELECT e.uid, e.folder, e.from_addr, e.subject, 
-                       LEFT(e.body_text, 200) as preview, e.date, e.is_unread,
-                       -(emb.embedding <#> %s::{vtype}) as similarity
-                FROM email_embeddings emb
-                JOIN emails e ON e.uid = emb.email_uid AND e.folder = emb.email_folder
-                WHERE e.folder = %s AND -(emb.embedding <#> %s::{vtype}) > %s
-                ORDER BY emb.embedding <#> %s::{vtype} LIMIT %s
+                       e.preview, e.date, e.is_unread,
+                       -(c.embedding <#> (SELECT v FROM q)) as similarity
+                FROM cand c
+                JOIN emails e ON e.uid = c.email_uid AND e.folder = c.email_folder
+                WHERE c.embedding <#> (SELECT v FROM q) < %s
+                ORDER BY c.embedding <#> (SELECT v FROM q) LIMIT %s
             """,
-                (
-                    query_embedding,
-                    folder,
-                    query_embedding,
-                    threshold,
-                    query_embedding,
-                    limit,
-                ),
+                (_pack(db, query_embedding), folder, candidates, -threshold, limit),
             )
             return cur.fetchall()
 
 
+@lru_cache(maxsize=256)
+def _semantic_search_advanced_sql(vtype: str, conditions: tuple[str, ...]) -> str:
+    """Assemble the filtered semantic search query for a set of clauses.
+
+    The ``cand`` CTE is a plain ``ORDER BY <#> LIMIT`` over email_embeddings,
+    which the planner serves from the HNSW index; metadata filters are then
+    applied to that bounded candidate set instead of the whole table.
+    """
+    return f"""
+        WITH q AS (SELECT %b::{vtype} AS v),
+        cand AS (
+            SELECT email_uid, email_folder, embedding <#> (SELECT v FROM q) AS d
+            FROM email_embeddings
+            WHERE email_folder = %s
+            ORDER BY embedding <#> (SELECT v FROM q)
+            LIMIT %s
+        )
+        SELECT e.uid, e.folder, e.from_addr, e.subject, 
+               e.preview, e.date, e.is_unread, e.has_attachments,
+               -c.d as similarity
+        FROM cand c
+        JOIN emails e ON e.uid = c.email_uid AND e.folder = c.email_folder
+        WHERE {" AND ".join(conditions)}
+        ORDER BY c.d LIMIT %s
+    """
+
+
 def semantic_search_advanced(
     db: DatabaseInterface,
     query_embedding: list[float],
@@ -75,11 +186,17 @@ def semantic_search_advanced(
     limit: int,
     filters: dict[str, Any],
     threshold: float = 0.5,
+    ef_search: int = SEMANTIC_CANDIDATES,
 ) -> list[dict[str, Any]]:
-    """Semantic search with advanced metadata filters."""
+    """Semantic search with advanced metadata filters.
+
+    ``ef_search`` is both the HNSW beam and the number of nearest
+    neighbours the metadata filters are applied to.
+    """
     vtype = cast(Any, db)._vector_type
-    conditions = ["e.folder = %s", f"-(emb.embedding <#> %s::{vtype}) > %s"]
-    params: list[Any] = [folder, query_embedding, threshold]
+    candidates = min(max(ef_search, limit), HNSW_EF_SEARCH_MAX)
+    conditions = ["c.d < %s"]
+    params: list[Any] = [_pack(db, query_embedding), folder, candidates, -threshold]
 
     if filters.get("from_addr"):
         conditions.append("e.from_addr ILIKE %s")
@@ -111,25 +228,17 @@ def semantic_search_advanced(
 
     if filters.get("is_starred") is not None:
         if filters["is_starred"]:
-            conditions.append("e.gmail_labels ? '\\\\Starred'")
+            conditions.append("e.is_starred")
 
     if filters.get("attachment_filename"):
         conditions.append("e.attachment_filenames::text ILIKE %s")
         params.append(f"%{filters['attachment_filename']}%")
 
-    params.extend([query_embedding, query_embedding, limit])
-
-    sql = f"""
-        SELECT e.uid, e.folder, e.from_addr, e.subject, 
-               LEFT(e.body_text, 200) as preview, e.date, e.is_unread, e.has_attachments,
-               -(emb.embedding <#> %s::{vtype}) as similarity
-        FROM email_embeddings emb
-        JOIN emails e ON e.uid = emb.email_uid AND e.folder = emb.email_folder
-        WHERE {" AND ".join(conditions)}
-        ORDER BY emb.embedding <#> %s::{vtype} LIMIT %s
-    """
+    params.append(limit)
+    sql = _semantic_search_advanced_sql(vtype, tuple(conditions))
 
-    with db.connection() as conn:
+    with db.connection() as conn, conn.pipeline():
+        _set_ef_search(conn, candidates)
         with conn.cursor(row_factory=dict_row) as cur:
             cur.execute(sql, params)
             return cur.fetchall()
@@ -140,32 +249,33 @@ def find_related_emails(
     uid: int,
     folder: str,
     limit: int = 5,
+    ef_search: int = HNSW_EF_SEARCH,
 ) -> list[dict[str, Any]]:
-    """Find emails similar to a reference email."""
-    vtype = cast(Any, db)._vector_type
-    with db.connection() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(
-                "SELECT embedding FROM email_embeddings WHERE email_uid = %s AND email_folder = %s",
-                (uid, folder),
-            )
-            row = cur.fetchone()
-            if not row:
-                return []
+    """Find emails similar to a reference email.
 
-            embedding = row["embedding"]
+    The reference embedding is looked up inside the query, so the vector
+    never round-trips through the client. No rows come back when the
+    email has no embedding.
+    """
+    with db.connection() as conn, conn.pipeline():
+        _set_ef_search(conn, max(ef_search, limit))
+        with conn.cursor(row_factory=dict_row) as cur:
             cur.execute(
-                f"""
+                """
+                WITH ref AS (
+                    SELECT embedding AS v FROM email_embeddings
+                    WHERE email_uid = %s AND email_folder = %s
+                )
                 SELECT e.uid, e.folder, e.from_addr, e.subject, 
-                       LEFT(e.body_text, 150) as preview, e.date,
-                       -(emb.embedding <#> %s::{vtype}) as similarity
+                       LEFT(e.preview, 150) as preview, e.date,
+                       -(emb.embedding <#> (SELECT v FROM ref)) as similarity
                 FROM email_embeddings emb
                 JOIN emails e ON e.uid = emb.email_uid AND e.folder = emb.email_folder
                 WHERE NOT (e.uid = %s AND e.folder = %s)
-                  AND -(emb.embedding <#> %s::{vtype}) > 0.6
-                ORDER BY emb.embedding <#> %s::{vtype} LIMIT %s
+                  AND emb.embedding <#> (SELECT v FROM ref) < -0.6
+                ORDER BY emb.embedding <#> (SELECT v FROM ref) LIMIT %s
             """,
-                (embedding, uid, folder, embedding, embedding, limit),
+                (uid, folder, uid, folder, limit),
             )
             return cur.fetchall()
 
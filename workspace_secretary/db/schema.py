@@ -21,6 +21,8 @@ def initialize_core_schema(
     """
     # Enable pgvector extension
     cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    # Trigram indexes back the ILIKE '%...%' search suggestions
+    cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
 
     # Emails table
     cur.execute(
@@ -60,6 +62,15 @@ def initialize_core_schema(
             suspicious_sender_signals JSONB,
             security_score INTEGER DEFAULT 100,
             warning_type TEXT,
+            search_tsv tsvector GENERATED ALWAYS AS (
+                to_tsvector('english', COALESCE(subject, '') || ' ' || COALESCE(body_text, ''))
+            ) STORED,
+            preview TEXT GENERATED ALWAYS AS (LEFT(body_text, 200)) STORED,
+            is_starred BOOLEAN GENERATED ALWAYS AS (
+                COALESCE(gmail_labels ? '\\Starred', FALSE)
+            ) STORED,
+            list_from TEXT GENERATED ALWAYS AS (LEFT(from_addr, 120)) STORED,
+            list_subject TEXT GENERATED ALWAYS AS (LEFT(subject, 120)) STORED,
             PRIMARY KEY (uid, folder)
         )
         """
@@ -80,6 +91,44 @@ def initialize_core_schema(
         "ALTER TABLE emails ADD COLUMN IF NOT EXISTS security_score INTEGER DEFAULT 100"
     )
     cur.execute("ALTER TABLE emails ADD COLUMN IF NOT EXISTS warning_type TEXT")
+    # Full-text document stored once per row instead of rebuilt per query
+    cur.execute(
+        """
+        ALTER TABLE emails ADD COLUMN IF NOT EXISTS search_tsv tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english', COALESCE(subject, '') || ' ' || COALESCE(body_text, ''))
+        ) STORED
+        """
+    )
+    # List views read this short inline copy instead of detoasting body_text
+    cur.execute(
+        """
+        ALTER TABLE emails ADD COLUMN IF NOT EXISTS preview TEXT
+        GENERATED ALWAYS AS (LEFT(body_text, 200)) STORED
+        """
+    )
+    # Starred filter reads a plain boolean instead of probing gmail_labels
+    cur.execute(
+        """
+        ALTER TABLE emails ADD COLUMN IF NOT EXISTS is_starred BOOLEAN
+        GENERATED ALWAYS AS (COALESCE(gmail_labels ? '\\Starred', FALSE)) STORED
+        """
+    )
+    # Bounded copies of the list headers; the covering list indexes carry
+    # these, since a raw header could push an index tuple past the b-tree
+    # row size limit and make the row fail to sync
+    cur.execute(
+        """
+        ALTER TABLE emails ADD COLUMN IF NOT EXISTS list_from TEXT
+        GENERATED ALWAYS AS (LEFT(from_addr, 120)) STORED
+        """
+    )
+    cur.execute(
+        """
+        ALTER TABLE emails ADD COLUMN IF NOT EXISTS list_subject TEXT
+        GENERATED ALWAYS AS (LEFT(subject, 120)) STORED
+        """
+    )
 
     # Folder state
     cur.execute(
@@ -482,14 +531,45 @@ def create_indexes(cur: Any, vector_type: str) -> None:
     cur.execute(
         "CREATE INDEX IF NOT EXISTS idx_emails_is_suspicious_sender ON emails(is_suspicious_sender)"
     )
+    # Inbox pagination and prev/next navigation order by (date, uid) per
+    # folder; INCLUDE carries the list columns so pages are index-only scans
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_folder_list_cov ON emails(folder, date DESC, uid DESC) INCLUDE (list_from, list_subject, preview, is_unread, has_attachments, is_starred)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_folder_unread_list_cov ON emails(folder, date DESC, uid DESC) INCLUDE (list_from, list_subject, preview, is_unread, has_attachments, is_starred) WHERE is_unread"
+    )
+    cur.execute("DROP INDEX IF EXISTS idx_emails_folder_date_uid")
+    cur.execute("DROP INDEX IF EXISTS idx_emails_folder_unread_date")
+    # Thread reconstruction matches on Message-ID / In-Reply-To
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_message_id ON emails(message_id)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_in_reply_to ON emails(in_reply_to)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_from_addr_trgm ON emails USING gin(from_addr gin_trgm_ops)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_subject_trgm ON emails USING gin(subject gin_trgm_ops)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_folder_starred_date ON emails(folder, date DESC) WHERE is_starred"
+    )
+    # Advanced search filters on recipients and attachment names the same way
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_to_addr_trgm ON emails USING gin(to_addr gin_trgm_ops)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_emails_attachment_filenames_trgm ON emails USING gin((attachment_filenames::text) gin_trgm_ops)"
+    )
 
-    # FTS index
+    # FTS index on the stored tsvector; replaces the old expression index
     cur.execute(
-        """
-        CREATE INDEX IF NOT EXISTS idx_emails_fts
-        ON emails USING gin(to_tsvector('english', COALESCE(subject, '') || ' ' || COALESCE(body_text, '')))
-        """
+        "CREATE INDEX IF NOT EXISTS idx_emails_search_tsv ON emails USING gin(search_tsv)"
     )
+    cur.execute("DROP INDEX IF EXISTS idx_emails_fts")
 
     # Embeddings index (basic creation, no self-heal)
     ops = "halfvec_ip_ops" if vector_type == "halfvec" else "vector_ip_ops"
@@ -511,6 +591,13 @@ def create_indexes(cur: Any, vector_type: str) -> None:
     cur.execute(
         "CREATE INDEX IF NOT EXISTS idx_contacts_search_vector ON contacts USING GIN(search_vector)"
     )
+    # Autocomplete matches ILIKE '%...%' on address and name
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_email_trgm ON contacts USING gin(email gin_trgm_ops)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_display_name_trgm ON contacts USING gin(display_name gin_trgm_ops)"
+    )
     cur.execute(
         "CREATE INDEX IF NOT EXISTS idx_contacts_is_vip ON contacts(is_vip) WHERE is_vip = TRUE"
     )
@@ -545,6 +632,69 @@ def create_indexes(cur: Any, vector_type: str) -> None:
     )
 
 
+def initialize_search_suggestion_views(cur: Any) -> None:
+    """Pre-aggregated sender/subject lists behind search autocomplete.
+
+    Refreshed periodically by the engine; the unique indexes are what
+    ``REFRESH MATERIALIZED VIEW CONCURRENTLY`` requires. They are built on an
+    md5 key column because a raw header can exceed the b-tree row size limit.
+    """
+    cur.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS email_sender_stats AS
+        SELECT md5(from_addr) AS from_key, from_addr, COUNT(*) AS cnt
+        FROM emails
+        WHERE from_addr IS NOT NULL
+        GROUP BY from_addr
+        """
+    )
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_email_sender_stats_from_key ON email_sender_stats(from_key)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_email_sender_stats_from_addr_trgm ON email_sender_stats USING gin(from_addr gin_trgm_ops)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_email_sender_stats_cnt ON email_sender_stats(cnt DESC)"
+    )
+
+    cur.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS email_subject_recent AS
+        SELECT md5(subject) AS subject_key, subject, MAX(date) AS last_date
+        FROM emails
+        WHERE subject <> ''
+        GROUP BY subject
+        """
+    )
+    cur.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_email_subject_recent_subject_key ON email_subject_recent(subject_key)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_email_subject_recent_subject_trgm ON email_subject_recent USING gin(subject gin_trgm_ops)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_email_subject_recent_last_date ON email_subject_recent(last_date DESC)"
+    )
+
+
+def create_quantized_embeddings_index(cur: Any, embedding_dimensions: int) -> None:
+    """
+    Create the Hamming HNSW index over binary-quantized embeddings.
+
+    Semantic search walks this one-bit-per-dimension index for candidates
+    and re-ranks them with the exact inner product. The query must use the
+    same ``binary_quantize(embedding)::bit(n)`` expression to match it.
+    """
+    cur.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_embeddings_bits
+        ON email_embeddings
+        USING hnsw ((binary_quantize(embedding)::bit({embedding_dimensions})) bit_hamming_ops)
+        """
+    )
+
+
 def initialize_all_schemas(
     cur: Any, vector_type: str, embedding_dimensions: int
 ) -> None:
@@ -555,3 +705,5 @@ def initialize_all_schemas(
     initialize_mutation_journal(cur)
     initialize_imap_jobs_schema(cur)
     create_indexes(cur, vector_type)
+    initialize_search_suggestion_views(cur)
+    create_quantized_embeddings_index(cur, embedding_dimensions)
@@ -158,8 +158,11 @@ class DatabaseInterface(ABC):
     def get_synced_folders(self) -> list[dict[str, Any]]:
         raise NotImplementedError
 
+    def refresh_search_suggestions(self) -> None:
+        raise NotImplementedError
+
     def get_thread_emails(
-        self, uid: int, folder: str = "INBOX"
+        self, uid: int, folder: str = "INBOX", include_body: bool = False
     ) -> list[dict[str, Any]]:
         raise NotImplementedError
 
@@ -257,6 +260,8 @@ class DatabaseInterface(ABC):
         subject_contains: Optional[str] = None,
         body_contains: Optional[str] = None,
         limit: int = 100,
+        summary_only: bool = False,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         raise NotImplementedError
 
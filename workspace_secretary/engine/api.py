@@ -29,6 +29,7 @@ from workspace_secretary.engine.calendar_sync import CalendarClient
 from workspace_secretary.db import DatabaseInterface
 from workspace_secretary.engine.database import create_database
 from workspace_secretary.engine.analysis import PhishingAnalyzer
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.smtp_client import SMTPClient
 
 if TYPE_CHECKING:
@@ -58,6 +59,9 @@ SECRETARY_LABELS = [
     "Secretary/Unclear",
 ]
 
+# LIST pattern covering the "Secretary" parent and every label beneath it
+SECRETARY_LABEL_PATTERN = "Secretary*"
+
 
 def ensure_smart_labels() -> dict[str, Any]:
     """Ensure all Secretary/* labels exist in Gmail. Called on startup.
@@ -73,21 +77,10 @@ def ensure_smart_labels() -> dict[str, Any]:
     errors = []
 
     try:
-        # Get current Gmail labels
-        current_labels = {
-            f.decode() if isinstance(f, bytes) else f
-            for f in state.imap_client.client.list_folders()
-        }
-        current_label_names = {parts[-1] for parts in current_labels if parts}
-
-        # Also check by full path for nested labels
-        all_labels = set()
-        for folder_info in state.imap_client.client.list_folders():
-            if folder_info and len(folder_info) >= 3:
-                folder_name = folder_info[2]
-                if isinstance(folder_name, bytes):
-                    folder_name = folder_name.decode()
-                all_labels.add(folder_name)
+        # One scoped LIST instead of listing every label in the mailbox
+        all_labels = set(
+            state.imap_client.list_folders_matching(SECRETARY_LABEL_PATTERN)
+        )
 
         for label in SECRETARY_LABELS:
             if label in all_labels:
@@ -134,6 +127,7 @@ class EngineState:
         self.enrollment_task: Optional[asyncio.Task] = None
         self.heartbeat_task: Optional[asyncio.Task] = None
         self.contact_sync_task: Optional[asyncio.Task] = None
+        self.suggestions_task: Optional[asyncio.Task] = None
         self.running = False
         self.enrolled = False
         self.enrollment_error: Optional[str] = None
@@ -549,6 +543,21 @@ async def _contact_sync_scheduler():
         await _trigger_contact_sync()
 
 
+async def _search_suggestions_refresh_loop():
+    """Keep the search autocomplete views close to the synced mail."""
+    interval = int(os.environ.get("SEARCH_SUGGESTIONS_REFRESH_INTERVAL", "300"))
+    while state.running:
+        try:
+            if state.database:
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(
+                    None, state.database.refresh_search_suggestions
+                )
+        except Exception as e:
+            logger.error(f"Search suggestions refresh failed: {e}")
+        await asyncio.sleep(interval)
+
+
 async def sync_loop():
     """Background sync loop for email and calendar.
 
@@ -585,6 +594,9 @@ async def sync_loop():
                     state.contact_sync_task = asyncio.create_task(
                         _contact_sync_scheduler()
                     )
+                    state.suggestions_task = asyncio.create_task(
+                        _search_suggestions_refresh_loop()
+                    )
 
                     if state.database.supports_embeddings():
                         logger.info(
@@ -954,9 +966,10 @@ def _email_to_db_params(email_obj: "Email", folder: str) -> dict[str, Any]:
     if not isinstance(headers, dict):
         headers = {}
 
+    from_addr = str(email_obj.from_)
     analysis = state.phishing_analyzer.analyze_email(
         {
-            "from_addr": str(email_obj.from_),
+            "from_addr": from_addr,
             "headers": headers,
             "reply_to": headers.get("Reply-To"),
         }
@@ -976,7 +989,7 @@ def _email_to_db_params(email_obj: "Email", folder: str) -> dict[str, Any]:
         "folder": folder,
         "message_id": email_obj.message_id,
         "subject": email_obj.subject,
-        "from_addr": str(email_obj.from_),
+        "from_addr": from_addr,
         "to_addr": ",".join(str(addr) for addr in email_obj.to),
         "cc_addr": ",".join(str(addr) for addr in email_obj.cc),
         "bcc_addr": "",
@@ -1353,7 +1366,9 @@ async def debounced_sync():
     state._sync_debounce_task = asyncio.create_task(_delayed_sync())
 
 
-app = FastAPI(title="Secretary Engine", lifespan=lifespan)
+app = FastAPI(
+    title="Secretary Engine", lifespan=lifespan, default_response_class=JSONResponse
+)
 
 
 # ============================================================================
@@ -1783,7 +1798,9 @@ async def setup_labels(req: SetupLabelsRequest):
     failed: list[str] = []
 
     try:
-        folders = set(state.imap_client.list_folders(refresh=True))
+        folders = set(
+            state.imap_client.list_folders_matching(SECRETARY_LABEL_PATTERN)
+        )
 
         for label_name in SECRETARY_LABELS:
             if label_name in folders:
@@ -62,6 +62,7 @@ class PostgresDatabase(DatabaseInterface):
 
         if actual_type_name != expected_base_type:
             cur.execute("DROP INDEX IF EXISTS idx_embeddings_vector")
+            cur.execute("DROP INDEX IF EXISTS idx_embeddings_bits")
             cur.execute(
                 f"""
                 ALTER TABLE email_embeddings
@@ -97,6 +98,22 @@ class PostgresDatabase(DatabaseInterface):
             """
         )
 
+        # The quantized index bakes the dimension count into its expression
+        cur.execute(
+            """
+            SELECT indexdef
+            FROM pg_indexes
+            WHERE schemaname = 'public'
+              AND tablename = 'email_embeddings'
+              AND indexname = 'idx_embeddings_bits'
+            """
+        )
+        row = cur.fetchone()
+        if row and f"bit({self.embedding_dimensions})" not in str(row[0]):
+            cur.execute("DROP INDEX IF EXISTS idx_embeddings_bits")
+
+        schema.create_quantized_embeddings_index(cur, self.embedding_dimensions)
+
     def __init__(
         self,
         host: str = "localhost",
@@ -106,6 +123,12 @@ class PostgresDatabase(DatabaseInterface):
         password: str = "",
         ssl_mode: str = "prefer",
         embedding_dimensions: int = 1536,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_max_lifetime: float = 1800.0,
+        pool_max_idle: float = 300.0,
+        prepare_threshold: Optional[int] = 1,
+        vector_type: Optional[str] = None,
     ):
         super().__init__()
 
@@ -116,11 +139,16 @@ class PostgresDatabase(DatabaseInterface):
         self.password = password
         self.ssl_mode = ssl_mode
         self.embedding_dimensions = embedding_dimensions
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_max_lifetime = pool_max_lifetime
+        self.pool_max_idle = pool_max_idle
+        self.prepare_threshold = prepare_threshold
         self._pool: Any = None
-        self._vector_type = "halfvec" if embedding_dimensions > 2000 else "vector"
-        self._vector_ops = (
-            "halfvec_ip_ops" if embedding_dimensions > 2000 else "vector_ip_ops"
+        self._vector_type = vector_type or (
+            "halfvec" if embedding_dimensions > 2000 else "vector"
         )
+        self._vector_ops = f"{self._vector_type}_ip_ops"
 
     def supports_embeddings(self) -> bool:
         return True
@@ -137,8 +165,18 @@ class PostgresDatabase(DatabaseInterface):
             )
 
         self._pool = ConnectionPool(
-            self._get_connection_string(), min_size=1, max_size=10
+            self._get_connection_string(),
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            max_lifetime=self.pool_max_lifetime,
+            max_idle=self.pool_max_idle,
+            check=ConnectionPool.check_connection,
+            kwargs={"prepare_threshold": self.prepare_threshold},
+            open=True,
         )
+        # Block until min_size connections are up, so the first request
+        # after startup does not pay for connection setup.
+        self._pool.wait()
 
         with self._pool.connection() as conn:
             with conn.cursor() as cur:
@@ -150,6 +188,7 @@ class PostgresDatabase(DatabaseInterface):
                 schema.initialize_calendar_schema(cur)
                 schema.initialize_mutation_journal(cur)
                 schema.create_indexes(cur, self._vector_type)
+                schema.initialize_search_suggestion_views(cur)
                 self._ensure_embeddings_index(cur)
                 conn.commit()
 
@@ -160,6 +199,15 @@ class PostgresDatabase(DatabaseInterface):
         with self._pool.connection() as conn:
             yield conn
 
+    def pool_stats(self) -> dict[str, int]:
+        if not self._pool:
+            return {}
+        stats = self._pool.get_stats()
+        return {
+            key: stats.get(key, 0)
+            for key in ("pool_size", "pool_available", "requests_waiting")
+        }
+
     def close(self) -> None:
         if self._pool:
             self._pool.close()
@@ -255,6 +303,11 @@ class PostgresDatabase(DatabaseInterface):
     def get_emails_by_uids(self, uids: list[int], folder: str) -> list[dict[str, Any]]:
         return email_q.get_emails_by_uids(self, uids, folder)
 
+    def get_thread_emails(
+        self, uid: int, folder: str = "INBOX", include_body: bool = False
+    ) -> list[dict[str, Any]]:
+        return email_q.get_thread_emails(self, uid, folder, include_body)
+
     def search_emails(
         self,
         folder: str = "INBOX",
@@ -264,6 +317,8 @@ class PostgresDatabase(DatabaseInterface):
         subject_contains: Optional[str] = None,
         body_contains: Optional[str] = None,
         limit: int = 100,
+        summary_only: bool = False,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         return email_q.search_emails(
             self,
@@ -274,6 +329,8 @@ class PostgresDatabase(DatabaseInterface):
             subject_contains,
             body_contains,
             limit,
+            summary_only,
+            offset,
         )
 
     def delete_email(self, uid: int, folder: str) -> None:
@@ -338,6 +395,9 @@ class PostgresDatabase(DatabaseInterface):
     def get_synced_folders(self) -> list[dict[str, Any]]:
         return email_q.get_synced_folders(self)
 
+    def refresh_search_suggestions(self) -> None:
+        email_q.refresh_search_suggestions(self)
+
     def upsert_embedding(
         self,
         uid: int,
@@ -540,8 +600,10 @@ def create_database(config: Any) -> DatabaseInterface:
         raise ValueError("PostgreSQL config is required (database.postgres)")
 
     embedding_dimensions = 1536
+    vector_type = None
     if hasattr(config, "embeddings") and config.embeddings:
         embedding_dimensions = getattr(config.embeddings, "dimensions", 1536)
+        vector_type = getattr(config.embeddings, "vector_type", None)
 
     return PostgresDatabase(
         host=postgres_config.host,
@@ -551,4 +613,10 @@ def create_database(config: Any) -> DatabaseInterface:
         password=postgres_config.password,
         ssl_mode=getattr(postgres_config, "ssl_mode", "prefer"),
         embedding_dimensions=embedding_dimensions,
+        pool_min_size=postgres_config.pool_min_size,
+        pool_max_size=postgres_config.pool_max_size,
+        pool_max_lifetime=postgres_config.pool_max_lifetime,
+        pool_max_idle=postgres_config.pool_max_idle,
+        prepare_threshold=postgres_config.prepare_threshold,
+        vector_type=vector_type,
     )
@@ -16,6 +16,9 @@ from workspace_secretary.engine.oauth2 import get_access_token
 
 logger = logging.getLogger(__name__)
 
+# RFC 6154 SPECIAL-USE attribute marking the drafts mailbox
+DRAFTS_FLAG = rb"\Drafts"
+
 
 class ModifiedError(Exception):
     """Raised when STORE fails due to UNCHANGEDSINCE race condition.
@@ -64,6 +67,7 @@ class ImapClient:
         self.folder_message_counts: Dict[
             str, Dict[str, int]
         ] = {}  # Cache for folder message counts
+        self._drafts_folder: Optional[str] = None  # Resolved once per connection
 
     def connect(self) -> None:
         """Connect to IMAP server.
@@ -126,6 +130,7 @@ class ImapClient:
             finally:
                 self.client = None
                 self.connected = False
+                self._drafts_folder = None
                 logger.info("Disconnected from IMAP server")
 
     def ensure_connected(self) -> None:
@@ -400,6 +405,31 @@ class ImapClient:
         logger.debug(f"Listed {len(folders)} folders")
         return folders
 
+    def list_folders_matching(self, pattern: str) -> List[str]:
+        """List folders matching an IMAP LIST pattern.
+
+        Issues a single scoped ``LIST "" <pattern>`` instead of listing the
+        whole mailbox. The folder cache is left untouched and allowed_folders
+        is not applied, so the result reflects what exists on the server.
+
+        Args:
+            pattern: LIST pattern (e.g. "Secretary*")
+
+        Returns:
+            List of matching folder names
+
+        Raises:
+            ConnectionError: If not connected and connection fails
+        """
+        client = self._get_client()
+
+        folders = []
+        for _flags, _delimiter, name in client.list_folders("", pattern):
+            if isinstance(name, bytes):
+                name = name.decode("utf-8")
+            folders.append(name)
+        return folders
+
     def folder_exists(self, folder: str) -> bool:
         """Check if a folder exists.
 
@@ -437,8 +467,9 @@ class ImapClient:
         try:
             client.create_folder(folder)
             logger.info(f"Created folder '{folder}'")
-            # Refresh cache
-            self.list_folders(refresh=True)
+            # Record the new folder instead of re-listing the whole mailbox
+            if self._is_folder_allowed(folder):
+                self.folder_cache[folder] = []
             return True
         except Exception as e:
             logger.error(f"Failed to create folder '{folder}': {e}")
@@ -1745,17 +1776,30 @@ class ImapClient:
     def _get_drafts_folder(self) -> str:
         """Get the drafts folder name for the current server.
 
+        The result is cached for the lifetime of the connection. The folder
+        carrying the SPECIAL-USE drafts attribute wins over name heuristics.
+
         Returns:
             The name of the drafts folder, or "INBOX" as fallback
         """
+        if self._drafts_folder:
+            return self._drafts_folder
+
         self.ensure_connected()
         folders = self.list_folders(refresh=True)
 
+        for folder in folders:
+            if DRAFTS_FLAG in self.folder_cache.get(folder, ()):
+                logger.debug(f"Using SPECIAL-USE drafts folder: {folder}")
+                self._drafts_folder = folder
+                return folder
+
         # Check for Gmail's special folders structure
         if self.config.host and "gmail" in self.config.host.lower():
             gmail_drafts = [f for f in folders if f.lower().endswith("/drafts")]
             if gmail_drafts:
                 logger.debug(f"Using Gmail drafts folder: {gmail_drafts[0]}")
+                self._drafts_folder = gmail_drafts[0]
                 return gmail_drafts[0]
 
         # Look for standard drafts folder names (case-insensitive)
@@ -1769,9 +1813,11 @@ class ImapClient:
         for folder in folders:
             if folder.lower() in [name.lower() for name in drafts_folder_names]:
                 logger.debug(f"Using drafts folder: {folder}")
+                self._drafts_folder = folder
                 return folder
 
-        # Fallback to INBOX if no drafts folder found
+        # Fallback to INBOX if no drafts folder found (not cached, so a
+        # folder created later is still picked up)
         logger.warning("No drafts folder found, using INBOX as fallback")
         return "INBOX"
 
@@ -52,6 +52,12 @@ async def _run_sync_job(job_id: str) -> None:
         password=db_cfg.password,
         ssl_mode=db_cfg.ssl_mode,
         embedding_dimensions=config.database.embeddings.dimensions,
+        pool_min_size=db_cfg.pool_min_size,
+        pool_max_size=db_cfg.pool_max_size,
+        pool_max_lifetime=db_cfg.pool_max_lifetime,
+        pool_max_idle=db_cfg.pool_max_idle,
+        prepare_threshold=db_cfg.prepare_threshold,
+        vector_type=config.database.embeddings.vector_type,
     )
     db.initialize()
 
@@ -422,6 +428,12 @@ async def run_forever(cfg: ExecutorConfig = ExecutorConfig()) -> None:
         password=db_cfg.password,
         ssl_mode=db_cfg.ssl_mode,
         embedding_dimensions=config.database.embeddings.dimensions,
+        pool_min_size=db_cfg.pool_min_size,
+        pool_max_size=db_cfg.pool_max_size,
+        pool_max_lifetime=db_cfg.pool_max_lifetime,
+        pool_max_idle=db_cfg.pool_max_idle,
+        prepare_threshold=db_cfg.prepare_threshold,
+        vector_type=config.database.embeddings.vector_type,
     )
     db.initialize()
 
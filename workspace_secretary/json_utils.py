@@ -0,0 +1,88 @@
+"""JSON helpers backed by orjson when it is installed.
+
+orjson is a C implementation that is roughly an order of magnitude faster
+than the stdlib encoder and serializes datetimes natively. When it is not
+available the stdlib fallback produces the same shape of output.
+"""
+
+import json
+from datetime import date, datetime, time
+from typing import Any, Union
+
+from starlette.responses import JSONResponse as _StarletteJSONResponse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types neither encoder handles natively."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        # Dataclasses (e.g. EmailAddress) go through _default like they do
+        # with the stdlib encoder, so both paths render them via str().
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=_default, ensure_ascii=False
+    ).encode()
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as str
+    """
+    if orjson is not None:
+        return dumps_bytes(obj, indent=indent).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=_default)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error
+            type subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JSONResponse(_StarletteJSONResponse):
+    """JSON response rendered with :func:`dumps_bytes`.
+
+    Drop-in for Starlette's ``JSONResponse`` and the default response class
+    of the web and engine apps, so both explicit and implicit JSON bodies
+    are encoded by orjson when it is installed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -10,6 +10,17 @@ from email.header import decode_header
 from email.message import Message
 from typing import Dict, List, Optional, Union, Any, cast
 
+# Upper bound on header text handed to the stdlib address parser; adversarial
+# headers (e.g. ";;;;" stuffing) make its parser pathologically slow.
+_MAX_ADDRESS_LENGTH = 4096
+
+# Fast path for the common shapes: `Name <local@domain>`, `"Name" <local@domain>`
+# and a bare `local@domain`.
+_ADDR_RE = re.compile(
+    r'^\s*(?:"?([^"<]{0,200}?)"?\s*<([^\s<>@]{1,64}@[^\s<>]{1,255})>'
+    r'|([^\s<>@"]{1,64}@[^\s<>"]{1,255}))\s*$'
+)
+
 
 def decode_mime_header(header_value: Optional[str]) -> str:
     """Decode a MIME header value.
@@ -40,7 +51,7 @@ def decode_mime_header(header_value: Optional[str]) -> str:
     return "".join(decoded_parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddress:
     """Email address representation."""
 
@@ -57,14 +68,17 @@ class EmailAddress:
         Returns:
             EmailAddress object
         """
-        # For the special case of just an email address without brackets
-        if "@" in address_str and "<" not in address_str:
-            return cls(name="", address=address_str.strip())
+        address_str = address_str[:_MAX_ADDRESS_LENGTH]
 
-        # Extract name and address with angle brackets
-        match = re.match(r'"?([^"<]*)"?\s*<([^>]*)>', address_str.strip())
+        match = _ADDR_RE.match(address_str)
         if match:
-            name, address = match.groups()
+            name, bracketed, bare = match.groups()
+            if bare:
+                return cls(name="", address=bare)
+            return cls(name=(name or "").strip(), address=bracketed)
+
+        name, address = email.utils.parseaddr(address_str)
+        if address:
             return cls(name=name.strip(), address=address.strip())
 
         # Fallback: treat the whole string as an address
@@ -77,7 +91,7 @@ class EmailAddress:
         return self.address
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailAttachment:
     """Email attachment representation."""
 
@@ -133,7 +147,7 @@ class EmailAttachment:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailContent:
     """Email content representation."""
 
@@ -151,7 +165,7 @@ class EmailContent:
         return ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Email:
     """Email message representation."""
 
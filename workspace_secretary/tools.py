@@ -6,17 +6,25 @@ Architecture:
 - No direct IMAP/Gmail/Calendar client access
 """
 
+import asyncio
+import functools
+import inspect
 import json
 import logging
+import queue
 import re
+import threading
 import idna
+from concurrent.futures import Future
 from datetime import datetime
 from email.utils import parseaddr
-from typing import Any, Dict, List, Optional
+from types import GeneratorType
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional
 
 from mcp.server.fastmcp import FastMCP, Context
 
 from workspace_secretary.config import ServerConfig
+from workspace_secretary.json_utils import dumps as _json_dumps, loads as _loads
 from workspace_secretary.db import DatabaseInterface
 from workspace_secretary.engine_client import EngineClient
 from workspace_secretary.engine.analysis import PhishingAnalyzer
@@ -27,10 +35,84 @@ mcp = FastMCP("workspace-secretary")
 
 import os
 
+# Upper bound on concurrent engine requests issued by a single batch tool.
+_ENGINE_CONCURRENCY = 10
+
 enable_semantic_search = (
     os.environ.get("ENABLE_SEMANTIC_SEARCH", "false").lower() == "true"
 )
 
+# Tool output is read by the model, so it is emitted compact; set MCP_PRETTY=1
+# to indent it again when debugging.
+_PRETTY_JSON = os.environ.get("MCP_PRETTY") == "1"
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON."""
+    return _json_dumps(obj, indent=_PRETTY_JSON)
+
+
+_TASK_PRIORITIES = frozenset(("low", "medium", "high"))
+_DUE_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Pending task entries as (tasks_file, entry, future); drained by _task_writer.
+_TASK_QUEUE: "queue.Queue[tuple[str, str, Future]]" = queue.Queue()
+_task_writer_lock = threading.Lock()
+_task_writer_thread: Optional[threading.Thread] = None
+
+
+def _task_writer() -> None:
+    """Drain queued task entries, coalescing bursts into one write + fsync."""
+    while True:
+        batch = [_TASK_QUEUE.get()]
+        try:
+            while True:
+                batch.append(_TASK_QUEUE.get_nowait())
+        except queue.Empty:
+            pass
+
+        try:
+            _write_task_batch(batch)
+        except Exception as e:
+            # Keep the writer alive; the next batch gets a fresh attempt
+            logger.error(f"Task writer failed: {e}")
+
+
+def _write_task_batch(batch: List[tuple[str, str, Future]]) -> None:
+    by_file: Dict[str, List[tuple[str, Future]]] = {}
+    for path, entry, future in batch:
+        # Entries whose caller was cancelled before the write are dropped
+        if future.set_running_or_notify_cancel():
+            by_file.setdefault(path, []).append((entry, future))
+
+    for path, items in by_file.items():
+        try:
+            with open(path, "a") as f:
+                f.writelines(entry for entry, _ in items)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+        else:
+            for _, future in items:
+                future.set_result(None)
+
+
+def _enqueue_task(tasks_file: str, entry: str) -> Future:
+    """Queue a task entry for the writer thread, (re)starting it as needed."""
+    global _task_writer_thread
+    with _task_writer_lock:
+        if _task_writer_thread is None or not _task_writer_thread.is_alive():
+            _task_writer_thread = threading.Thread(
+                target=_task_writer, name="task-writer", daemon=True
+            )
+            _task_writer_thread.start()
+
+    future: Future = Future()
+    _TASK_QUEUE.put((tasks_file, entry, future))
+    return future
+
 
 def _get_database(ctx: Context) -> DatabaseInterface:
     """Get database from context."""
@@ -61,26 +143,118 @@ def _get_embeddings_client(ctx: Context):
     return ctx.request_context.lifespan_context.get("embeddings_client")
 
 
+# Responses estimated above this many characters are serialized off the
+# event loop so one large thread/body does not stall concurrent tool calls.
+_OFFLOAD_JSON_CHARS = 65536
+
+
+def _estimate_json_chars(payload: Any, budget: int = _OFFLOAD_JSON_CHARS) -> int:
+    """Cheaply estimate serialized size, stopping once the budget is exceeded."""
+    total = 0
+    stack = [payload]
+    while stack and total <= budget:
+        item = stack.pop()
+        if isinstance(item, str):
+            total += len(item) + 2
+        elif isinstance(item, dict):
+            total += 2
+            for key, value in item.items():
+                total += len(str(key)) + 4
+                stack.append(value)
+        elif isinstance(item, (list, tuple)):
+            total += 2
+            stack.extend(item)
+        else:
+            total += 8
+    return total
+
+
+def _stream_json_array(rows: Iterable[Any]) -> str:
+    """Serialize an iterable of rows as a JSON array, one row at a time.
+
+    Rows are formatted and encoded as they are consumed, so only the encoded
+    fragments are kept until they are joined, not the formatted dicts.
+    """
+    if _PRETTY_JSON:
+        return _dumps(list(rows))
+    return "[" + ",".join(_dumps(row) for row in rows) + "]"
+
+
+async def _json_async(payload: Any) -> str:
+    """Serialize a tool response, offloading large payloads to a thread.
+
+    Generators are encoded row by row; their size is unknown up front, so
+    they are always encoded off the event loop.
+    """
+    if isinstance(payload, GeneratorType):
+        return await asyncio.to_thread(_stream_json_array, payload)
+    if _estimate_json_chars(payload) > _OFFLOAD_JSON_CHARS:
+        return await asyncio.to_thread(_dumps, payload)
+    return _dumps(payload)
+
+
+def _json_tool(
+    action: str,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[str]]]:
+    """Wrap a read tool: serialize its result and report failures as JSON.
+
+    The wrapped coroutine returns a JSON-serializable object (or a ready
+    string); any exception is logged and returned as ``{"error": ...}``.
+
+    Args:
+        action: Short description used in the error log (e.g. "listing folders")
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[str]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                result = await fn(*args, **kwargs)
+                if isinstance(result, str):
+                    return result
+                # Generators format their rows while being serialized
+                return await _json_async(result)
+            except Exception as e:
+                logger.error(f"Error {action}: {e}")
+                return _dumps({"error": str(e)})
+
+        # Tools are published as returning ``str``; FastMCP reads the signature
+        # through __wrapped__, so override it rather than just __annotations__
+        wrapper.__annotations__ = {**fn.__annotations__, "return": str}
+        wrapper.__signature__ = inspect.signature(fn).replace(  # type: ignore[attr-defined]
+            return_annotation=str
+        )
+        return wrapper
+
+    return decorator
+
+
 def _format_email_summary(email: Dict[str, Any]) -> Dict[str, Any]:
-    """Format email dict for API response."""
-    flags = email.get("flags", "").split(",") if email.get("flags") else []
+    """Format email dict for API response.
+
+    Runs once per listed row, so the row lookup is bound locally and
+    each column is read exactly once.
+    """
+    get = email.get
+    flags = get("flags")
     return {
-        "uid": email.get("uid"),
-        "folder": email.get("folder"),
-        "from": email.get("from_addr"),
-        "to": email.get("to_addr"),
-        "cc": email.get("cc_addr"),
-        "subject": email.get("subject"),
-        "date": email.get("date"),
-        "is_unread": email.get("is_unread", False),
-        "flags": flags,
+        "uid": get("uid"),
+        "folder": get("folder"),
+        "from": get("from_addr"),
+        "to": get("to_addr"),
+        "cc": get("cc_addr"),
+        "subject": get("subject"),
+        "date": get("date"),
+        "is_unread": get("is_unread", False),
+        "flags": flags.split(",") if flags else [],
     }
 
 
 def _format_email_detail(email: Dict[str, Any]) -> Dict[str, Any]:
     """Format email dict with full details and security analysis.
 
-    Prioritizes stored security scores, falls back to real-time analysis.
+    Prioritizes stored security scores, falls back to real-time analysis
+    on the shared CPU pool.
     """
     base = _format_email_summary(email)
 
@@ -93,7 +267,7 @@ def _format_email_detail(email: Dict[str, Any]) -> Dict[str, Any]:
     if attachments:
         if isinstance(attachments, str):
             try:
-                base["attachment_filenames"] = json.loads(attachments)
+                base["attachment_filenames"] = _loads(attachments)
             except json.JSONDecodeError:
                 base["attachment_filenames"] = []
         else:
@@ -105,8 +279,7 @@ def _format_email_detail(email: Dict[str, Any]) -> Dict[str, Any]:
     warning = email.get("warning_type")
 
     if score is None:
-        analyzer = PhishingAnalyzer()
-        result = analyzer.analyze_email(email)
+        result = PhishingAnalyzer().analyze_email(email)
         score = result["score"]
         warning = result["warning_type"]
         base["analysis_source"] = "realtime"
@@ -128,22 +301,19 @@ def _format_email_detail(email: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @mcp.tool()
-async def list_folders(ctx: Context) -> str:
+@_json_tool("listing folders")
+async def list_folders(ctx: Context) -> Any:
     """List all synced email folders.
 
     Returns:
         JSON list of folder information
     """
-    try:
-        db = _get_database(ctx)
-        folders = db.get_synced_folders()
-        return json.dumps(folders, indent=2, default=str)
-    except Exception as e:
-        logger.error(f"Error listing folders: {e}")
-        return json.dumps({"error": str(e)})
+    db = _get_database(ctx)
+    return db.get_synced_folders()
 
 
 @mcp.tool()
+@_json_tool("searching emails")
 async def search_emails(
     folder: str = "INBOX",
     from_addr: Optional[str] = None,
@@ -153,7 +323,7 @@ async def search_emails(
     unread_only: bool = False,
     limit: int = 50,
     ctx: Context = None,  # type: ignore
-) -> str:
+) -> Any:
     """Search emails in the database.
 
     Args:
@@ -169,30 +339,27 @@ async def search_emails(
     Returns:
         JSON list of matching emails
     """
-    try:
-        db = _get_database(ctx)
-        emails = db.search_emails(
-            folder=folder,
-            from_addr=from_addr,
-            to_addr=to_addr,
-            subject_contains=subject,
-            body_contains=body,
-            is_unread=True if unread_only else None,
-            limit=limit,
-        )
-        results = [_format_email_summary(e) for e in emails]
-        return json.dumps(results, indent=2, default=str)
-    except Exception as e:
-        logger.error(f"Error searching emails: {e}")
-        return json.dumps({"error": str(e)})
+    db = _get_database(ctx)
+    emails = db.search_emails(
+        folder=folder,
+        from_addr=from_addr,
+        to_addr=to_addr,
+        subject_contains=subject,
+        body_contains=body,
+        is_unread=True if unread_only else None,
+        limit=limit,
+        summary_only=True,
+    )
+    return [_format_email_summary(e) for e in emails]
 
 
 @mcp.tool()
+@_json_tool("getting email details")
 async def get_email_details(
     uid: int,
     folder: str = "INBOX",
     ctx: Context = None,  # type: ignore
-) -> str:
+) -> Any:
     """Get full details of a specific email.
 
     Args:
@@ -203,67 +370,69 @@ async def get_email_details(
     Returns:
         JSON with email details including body
     """
-    try:
-        db = _get_database(ctx)
-        email = db.get_email_by_uid(uid, folder)
-        if not email:
-            return json.dumps({"error": f"Email {uid} not found in {folder}"})
-        return json.dumps(_format_email_detail(email), indent=2, default=str)
-    except Exception as e:
-        logger.error(f"Error getting email details: {e}")
-        return json.dumps({"error": str(e)})
+    db = _get_database(ctx)
+    email = db.get_email_by_uid(uid, folder)
+    if not email:
+        return _dumps({"error": f"Email {uid} not found in {folder}"})
+    return _format_email_detail(email)
 
 
 @mcp.tool()
+@_json_tool("getting email thread")
 async def get_email_thread(
     uid: int,
     folder: str = "INBOX",
+    include_body: bool = False,
     ctx: Context = None,  # type: ignore
-) -> str:
+) -> Any:
     """Get all emails in a conversation thread.
 
     Args:
         uid: UID of an email in the thread
         folder: Folder name
+        include_body: Include full body_text/body_html for each email
         ctx: MCP context
 
     Returns:
         JSON list of emails in the thread, sorted by date
     """
-    try:
-        db = _get_database(ctx)
-        thread_emails = db.get_thread_emails(uid, folder)
-        if not thread_emails:
-            # Fall back to single email
-            email = db.get_email_by_uid(uid, folder)
-            if email:
-                thread_emails = [email]
-            else:
-                return json.dumps({"error": f"Email {uid} not found"})
+    db = _get_database(ctx)
+    thread_emails = db.get_thread_emails(uid, folder, include_body=include_body)
+    if not thread_emails:
+        # Fall back to single email
+        email = db.get_email_by_uid(uid, folder)
+        if email:
+            thread_emails = [email]
+        else:
+            return _dumps({"error": f"Email {uid} not found"})
 
-        # Sort by date
-        thread_emails.sort(key=lambda e: e.get("date") or "")
+    # Sort by date
+    thread_emails.sort(key=lambda e: e.get("date") or "")
 
-        results = []
+    def rows() -> Iterator[Dict[str, Any]]:
         for email in thread_emails:
             result = _format_email_summary(email)
             result["snippet"] = (
-                email.get("body_text") or email.get("body_html") or ""
+                email.get("snippet")
+                or email.get("body_text")
+                or email.get("body_html")
+                or ""
             )[:150]
-            results.append(result)
+            if include_body:
+                result["body_text"] = email.get("body_text")
+                result["body_html"] = email.get("body_html")
+            yield result
 
-        return json.dumps(results, indent=2, default=str)
-    except Exception as e:
-        logger.error(f"Error getting email thread: {e}")
-        return json.dumps({"error": str(e)})
+    return rows()
 
 
 @mcp.tool()
+@_json_tool("getting unread messages")
 async def get_unread_messages(
     folder: str = "INBOX",
     limit: int = 50,
     ctx: Context = None,  # type: ignore
-) -> str:
+) -> Any:
     """Get unread messages from a folder.
 
     Args:
@@ -274,26 +443,24 @@ async def get_unread_messages(
     Returns:
         JSON list of unread emails
     """
-    try:
-        db = _get_database(ctx)
-        emails = db.search_emails(folder=folder, is_unread=True, limit=limit)
-        results = []
-        for email in emails:
-            result = _format_email_summary(email)
-            result["snippet"] = (email.get("body_text") or "")[:100]
-            results.append(result)
-        return json.dumps(results, indent=2, default=str)
-    except Exception as e:
-        logger.error(f"Error getting unread messages: {e}")
-        return json.dumps({"error": str(e)})
+    db = _get_database(ctx)
+    emails = db.search_emails(folder=folder, is_unread=True, limit=limit)
+    results = []
+    for email in emails:
+        result = _format_email_summary(email)
+        result["snippet"] = (email.get("body_text") or "")[:100]
+        results.append(result)
+    return results
 
 
 @mcp.tool()
+@_json_tool("in gmail_search")
 async def gmail_search(
     query: str,
     max_results: int = 20,
+    offset: int = 0,
     ctx: Context = None,  # type: ignore
-) -> str:
+) -> Any:
     """Search emails using Gmail-like syntax.
 
     Supports: from:, to:, subject:, is:unread, is:read
@@ -301,54 +468,51 @@ async def gmail_search(
     Args:
         query: Gmail-style search query
         max_results: Maximum results
+        offset: Number of matches to skip (pass the previous offset plus
+            max_results to fetch the next page)
         ctx: MCP context
 
     Returns:
         JSON list of matching emails
     """
-    try:
-        db = _get_database(ctx)
-
-        # Parse Gmail-style query
-        is_unread = None
-        from_addr = None
-        to_addr = None
-        subject_contains = None
-
-        query_lower = query.lower()
-        if "is:unread" in query_lower:
-            is_unread = True
-        if "is:read" in query_lower:
-            is_unread = False
-
-        from_match = re.search(r"from:(\S+)", query_lower)
-        if from_match:
-            from_addr = from_match.group(1)
-
-        to_match = re.search(r"to:(\S+)", query_lower)
-        if to_match:
-            to_addr = to_match.group(1)
-
-        subject_match = re.search(
-            r'subject:(["\']?)(.+?)\1(?:\s|$)', query, re.IGNORECASE
-        )
-        if subject_match:
-            subject_contains = subject_match.group(2)
-
-        emails = db.search_emails(
-            folder="INBOX",
-            from_addr=from_addr,
-            to_addr=to_addr,
-            subject_contains=subject_contains,
-            is_unread=is_unread,
-            limit=max_results,
-        )
-
-        results = [_format_email_summary(e) for e in emails]
-        return json.dumps(results, indent=2, default=str)
-    except Exception as e:
-        logger.error(f"Error in gmail_search: {e}")
-        return json.dumps({"error": str(e)})
+    db = _get_database(ctx)
+
+    # Parse Gmail-style query
+    is_unread = None
+    from_addr = None
+    to_addr = None
+    subject_contains = None
+
+    query_lower = query.lower()
+    if "is:unread" in query_lower:
+        is_unread = True
+    if "is:read" in query_lower:
+        is_unread = False
+
+    from_match = re.search(r"from:(\S+)", query_lower)
+    if from_match:
+        from_addr = from_match.group(1)
+
+    to_match = re.search(r"to:(\S+)", query_lower)
+    if to_match:
+        to_addr = to_match.group(1)
+
+    subject_match = re.search(r'subject:(["\']?)(.+?)\1(?:\s|$)', query, re.IGNORECASE)
+    if subject_match:
+        subject_contains = subject_match.group(2)
+
+    emails = db.search_emails(
+        folder="INBOX",
+        from_addr=from_addr,
+        to_addr=to_addr,
+        subject_contains=subject_contains,
+        is_unread=is_unread,
+        limit=max_results,
+        summary_only=True,
+        offset=offset,
+    )
+
+    return (_format_email_summary(e) for e in emails)
 
 
 # ============================================================
@@ -564,6 +728,9 @@ async def list_calendar_events(
     time_min: str,
     time_max: str,
     calendar_id: str = "primary",
+    max_results: Optional[int] = None,
+    offset: int = 0,
+    fields: Optional[str] = None,
     ctx: Context = None,  # type: ignore
 ) -> str:
     """List calendar events in a time range.
@@ -572,6 +739,10 @@ async def list_calendar_events(
         time_min: Start time (ISO format, e.g., 2024-01-01T00:00:00Z)
         time_max: End time (ISO format)
         calendar_id: Calendar ID
+        max_results: Maximum events to return; all remaining events if omitted
+        offset: Number of events to skip (for paging)
+        fields: Comma-separated event fields to return
+            (e.g. "id,summary,start,end"); all fields if omitted
         ctx: MCP context
 
     Returns:
@@ -582,12 +753,17 @@ async def list_calendar_events(
         result = engine.list_calendar_events(time_min, time_max, calendar_id)
         if result.get("status") == "no_account":
             return result.get("message", "No account configured")
-        return json.dumps(result.get("events", []), indent=2, default=str)
+        end = None if max_results is None else offset + max_results
+        events = result.get("events", [])[offset:end]
+        if fields:
+            keep = [f.strip() for f in fields.split(",") if f.strip()]
+            events = [{k: event[k] for k in keep if k in event} for event in events]
+        return _dumps(events)
     except ConnectionError:
         return "Engine not running. Start secretary-engine first."
     except Exception as e:
         logger.error(f"Error listing calendar events: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -611,12 +787,12 @@ async def get_calendar_availability(
         result = engine.get_calendar_availability(time_min, time_max)
         if result.get("status") == "no_account":
             return result.get("message", "No account configured")
-        return json.dumps(result, indent=2, default=str)
+        return _dumps(result)
     except ConnectionError:
         return "Engine not running. Start secretary-engine first."
     except Exception as e:
         logger.error(f"Error getting availability: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -658,14 +834,13 @@ async def create_calendar_event(
         )
         if result.get("status") == "ok":
             event = result.get("event", {})
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "event_id": event.get("id"),
                     "html_link": event.get("htmlLink"),
                     "summary": event.get("summary"),
                 },
-                indent=2,
             )
         elif result.get("status") == "no_account":
             return result.get("message", "No account configured")
@@ -675,7 +850,7 @@ async def create_calendar_event(
         return "Engine not running. Start secretary-engine first."
     except Exception as e:
         logger.error(f"Error creating calendar event: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -874,10 +1049,10 @@ async def get_daily_briefing(
                 }
             )
 
-        return json.dumps(briefing, indent=2, default=str)
+        return _dumps(briefing)
     except Exception as e:
         logger.error(f"Error generating daily briefing: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -955,14 +1130,13 @@ async def create_draft_reply(
             reply_all=reply_all,
         )
         if result.get("status") == "ok":
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "message": "Draft created",
                     "draft_uid": result.get("draft_uid"),
                     "draft_folder": result.get("draft_folder"),
                 },
-                indent=2,
             )
         elif result.get("status") == "no_account":
             return result.get("message", "No account configured")
@@ -972,7 +1146,7 @@ async def create_draft_reply(
         return "Engine not running. Start secretary-engine first."
     except Exception as e:
         logger.error(f"Error creating draft: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -998,10 +1172,13 @@ async def create_task(
     if not description:
         return "Error: Description is required"
 
-    if priority not in ["low", "medium", "high"]:
+    if priority not in _TASK_PRIORITIES:
         return f"Error: Invalid priority '{priority}'. Use: low, medium, high"
 
     if due_date:
+        # Cheap shape check first; strptime then rejects impossible dates
+        if not _DUE_DATE_RE.match(due_date):
+            return f"Error: Invalid date format '{due_date}'. Use YYYY-MM-DD"
         try:
             datetime.strptime(due_date, "%Y-%m-%d")
         except ValueError:
@@ -1015,8 +1192,8 @@ async def create_task(
     tasks_file = os.path.join(os.getcwd(), "tasks.md")
 
     try:
-        with open(tasks_file, "a") as f:
-            f.write(task_entry)
+        # Resolves once the entry has been written and fsynced
+        await asyncio.wrap_future(_enqueue_task(tasks_file, task_entry))
         return f"Task created: {description}"
     except Exception as e:
         logger.error(f"Error creating task: {e}")
@@ -1053,12 +1230,13 @@ async def trigger_sync(ctx: Context = None) -> str:  # type: ignore
 if enable_semantic_search:
 
     @mcp.tool()
+    @_json_tool("in semantic search")
     async def semantic_search_emails(
         query: str,
         folder: str = "INBOX",
         limit: int = 20,
         ctx: Context = None,  # type: ignore
-    ) -> str:
+    ) -> Any:
         """Search emails by meaning using AI embeddings.
 
         Args:
@@ -1070,47 +1248,44 @@ if enable_semantic_search:
         Returns:
             JSON list of semantically similar emails
         """
-        try:
-            db = _get_database(ctx)
-            embeddings = _get_embeddings_client(ctx)
+        db = _get_database(ctx)
+        embeddings = _get_embeddings_client(ctx)
 
-            if not embeddings:
-                return json.dumps({"error": "Embeddings not available"})
+        if not embeddings:
+            return _dumps({"error": "Embeddings not available"})
 
-            if not db.supports_embeddings():
-                return json.dumps({"error": "Database does not support embeddings"})
+        if not db.supports_embeddings():
+            return _dumps({"error": "Database does not support embeddings"})
 
-            # Get query embedding
-            result = await embeddings.embed_query(query)
+        # Get query embedding
+        result = await embeddings.embed_query(query)
 
-            # Search
-            emails = db.semantic_search(
-                query_embedding=result.embedding,
-                folder=folder,
-                limit=limit,
-            )
+        # Search
+        emails = db.semantic_search(
+            query_embedding=result.embedding,
+            folder=folder,
+            limit=limit,
+        )
 
-            if not emails:
-                return json.dumps({"message": "No semantically similar emails found"})
+        if not emails:
+            return _dumps({"message": "No semantically similar emails found"})
 
-            results = []
-            for email in emails:
-                r = _format_email_summary(email)
-                r["similarity"] = round(email.get("similarity", 0), 3)
-                results.append(r)
+        results = []
+        for email in emails:
+            r = _format_email_summary(email)
+            r["similarity"] = round(email.get("similarity", 0), 3)
+            results.append(r)
 
-            return json.dumps(results, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Error in semantic search: {e}")
-            return json.dumps({"error": str(e)})
+        return results
 
     @mcp.tool()
+    @_json_tool("finding related emails")
     async def find_related_emails(
         uid: int,
         folder: str = "INBOX",
         limit: int = 10,
         ctx: Context = None,  # type: ignore
-    ) -> str:
+    ) -> Any:
         """Find emails similar to a specific email.
 
         Args:
@@ -1122,29 +1297,26 @@ if enable_semantic_search:
         Returns:
             JSON list of similar emails
         """
-        try:
-            db = _get_database(ctx)
+        db = _get_database(ctx)
 
-            if not db.supports_embeddings():
-                return json.dumps({"error": "Database does not support embeddings"})
+        if not db.supports_embeddings():
+            return _dumps({"error": "Database does not support embeddings"})
 
-            emails = db.find_similar_emails(uid, folder, limit)
+        emails = db.find_similar_emails(uid, folder, limit)
 
-            if not emails:
-                return json.dumps({"message": f"No similar emails found for UID {uid}"})
+        if not emails:
+            return _dumps({"message": f"No similar emails found for UID {uid}"})
 
-            results = []
-            for email in emails:
-                r = _format_email_summary(email)
-                r["similarity"] = round(email.get("similarity", 0), 3)
-                results.append(r)
+        results = []
+        for email in emails:
+            r = _format_email_summary(email)
+            r["similarity"] = round(email.get("similarity", 0), 3)
+            results.append(r)
 
-            return json.dumps(results, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Error finding related emails: {e}")
-            return json.dumps({"error": str(e)})
+        return results
 
     @mcp.tool()
+    @_json_tool("in filtered semantic search")
     async def semantic_search_filtered(
         query: str,
         folder: Optional[str] = None,
@@ -1155,7 +1327,7 @@ if enable_semantic_search:
         has_attachments: Optional[bool] = None,
         limit: int = 20,
         ctx: Context = None,  # type: ignore
-    ) -> str:
+    ) -> Any:
         """Metadata-augmented semantic search - combines hard filters with AI similarity.
 
         Hard filters are applied FIRST to prevent "vector drift" (finding semantically
@@ -1176,44 +1348,38 @@ if enable_semantic_search:
         Returns:
             JSON list of emails matching filters, ranked by semantic similarity
         """
-        try:
-            db = _get_database(ctx)
-            embeddings = _get_embeddings_client(ctx)
-
-            if not embeddings:
-                return json.dumps({"error": "Embeddings not available"})
-
-            if not db.supports_embeddings():
-                return json.dumps({"error": "Database does not support embeddings"})
-
-            result = await embeddings.embed_query(query)
-
-            emails = db.semantic_search_filtered(
-                query_embedding=result.embedding,
-                folder=folder,
-                from_addr=from_addr,
-                to_addr=to_addr,
-                date_from=date_from,
-                date_to=date_to,
-                has_attachments=has_attachments,
-                limit=limit,
-            )
+        db = _get_database(ctx)
+        embeddings = _get_embeddings_client(ctx)
 
-            if not emails:
-                return json.dumps(
-                    {"message": "No emails found matching filters and query"}
-                )
+        if not embeddings:
+            return _dumps({"error": "Embeddings not available"})
 
-            results = []
-            for email in emails:
-                r = _format_email_summary(email)
-                r["similarity"] = round(email.get("similarity", 0), 3)
-                results.append(r)
+        if not db.supports_embeddings():
+            return _dumps({"error": "Database does not support embeddings"})
 
-            return json.dumps(results, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Error in filtered semantic search: {e}")
-            return json.dumps({"error": str(e)})
+        result = await embeddings.embed_query(query)
+
+        emails = db.semantic_search_filtered(
+            query_embedding=result.embedding,
+            folder=folder,
+            from_addr=from_addr,
+            to_addr=to_addr,
+            date_from=date_from,
+            date_to=date_to,
+            has_attachments=has_attachments,
+            limit=limit,
+        )
+
+        if not emails:
+            return _dumps({"message": "No emails found matching filters and query"})
+
+        results = []
+        for email in emails:
+            r = _format_email_summary(email)
+            r["similarity"] = round(email.get("similarity", 0), 3)
+            results.append(r)
+
+        return results
 
 # ============================================================
 # BATCH OPERATION TOOLS (Time-boxed with continuation)
@@ -1250,7 +1416,7 @@ async def quick_clean_inbox(
 
         # Parse continuation state
         state = (
-            json.loads(continuation_state)
+            _loads(continuation_state)
             if continuation_state
             else {
                 "offset": 0,
@@ -1269,13 +1435,13 @@ async def quick_clean_inbox(
         for i, email in enumerate(emails[offset:]):
             # Check time limit
             if time.time() - start_time > time_limit_seconds:
-                return json.dumps(
+                return _dumps(
                     {
                         "status": "partial",
                         "has_more": True,
                         "time_limit_reached": True,
                         "candidates": candidates,
-                        "continuation_state": json.dumps(
+                        "continuation_state": _dumps(
                             {
                                 "offset": offset + i,
                                 "processed_uids": list(
@@ -1284,7 +1450,6 @@ async def quick_clean_inbox(
                             }
                         ),
                     },
-                    indent=2,
                 )
 
             uid = email.get("uid")
@@ -1323,19 +1488,17 @@ async def quick_clean_inbox(
                 }
             )
 
-        return json.dumps(
+        return _dumps(
             {
                 "status": "complete",
                 "has_more": False,
                 "candidates": candidates,
             },
-            indent=2,
-            default=str,
         )
 
     except Exception as e:
         logger.error(f"Error in quick_clean_inbox: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -1359,34 +1522,42 @@ async def execute_clean_batch(
 
         results = {"success": 0, "failed": 0, "errors": []}
 
-        for uid in uids:
-            try:
-                if action == "archive":
-                    # Mark read and apply label
-                    engine.mark_read(uid, "INBOX")
-                    engine.modify_labels(
-                        uid, "INBOX", ["Secretary/Auto-Cleaned"], "add"
-                    )
-                    engine.move_email(uid, "INBOX", "[Gmail]/All Mail")
-                elif action == "mark_read":
-                    engine.mark_read(uid, "INBOX")
-                elif action == "label":
-                    engine.modify_labels(
-                        uid, "INBOX", ["Secretary/Auto-Cleaned"], "add"
-                    )
-
-                results["success"] += 1
-            except Exception as e:
+        def process(uid: int) -> None:
+            if action == "archive":
+                # Mark read and apply label
+                engine.mark_read(uid, "INBOX")
+                engine.modify_labels(uid, "INBOX", ["Secretary/Auto-Cleaned"], "add")
+                engine.move_email(uid, "INBOX", "[Gmail]/All Mail")
+            elif action == "mark_read":
+                engine.mark_read(uid, "INBOX")
+            elif action == "label":
+                engine.modify_labels(uid, "INBOX", ["Secretary/Auto-Cleaned"], "add")
+
+        # The engine client is synchronous; run the per-UID calls on worker
+        # threads so they overlap instead of paying one round-trip each.
+        semaphore = asyncio.Semaphore(_ENGINE_CONCURRENCY)
+
+        async def run(uid: int) -> None:
+            async with semaphore:
+                await asyncio.to_thread(process, uid)
+
+        outcomes = await asyncio.gather(
+            *(run(uid) for uid in uids), return_exceptions=True
+        )
+        for uid, outcome in zip(uids, outcomes):
+            if isinstance(outcome, Exception):
                 results["failed"] += 1
-                results["errors"].append(f"UID {uid}: {e}")
+                results["errors"].append(f"UID {uid}: {outcome}")
+            else:
+                results["success"] += 1
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except ConnectionError:
         return "Engine not running. Start secretary-engine first."
     except Exception as e:
         logger.error(f"Error executing clean batch: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -1425,7 +1596,7 @@ async def triage_priority_emails(
                 if continuation_state.startswith("raw:")
                 else continuation_state
             )
-            state = json.loads(raw_state)
+            state = _loads(raw_state)
         else:
             state = {
                 "offset": 0,
@@ -1441,12 +1612,12 @@ async def triage_priority_emails(
 
         for i, email in enumerate(emails[offset:]):
             if time.time() - start_time > time_limit_seconds:
-                return json.dumps(
+                return _dumps(
                     {
                         "status": "partial",
                         "has_more": True,
                         "priority_emails": priority_emails,
-                        "continuation_state": json.dumps(
+                        "continuation_state": _dumps(
                             {
                                 "offset": offset + i,
                                 "processed_uids": list(
@@ -1455,7 +1626,6 @@ async def triage_priority_emails(
                             }
                         ),
                     },
-                    indent=2,
                 )
 
             uid = email.get("uid")
@@ -1508,16 +1678,14 @@ async def triage_priority_emails(
                     }
                 )
 
-        return json.dumps(
+        return _dumps(
             {
                 "status": "complete",
                 "has_more": False,
                 "priority_emails": priority_emails,
             },
-            indent=2,
-            default=str,
         )
 
     except Exception as e:
         logger.error(f"Error in triage_priority_emails: {e}")
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
@@ -9,9 +9,11 @@ Provides a human interface to the email system with:
 - Authentication (password, OIDC, SAML2)
 """
 
+import functools
 import logging
 import asyncio
 import os
+import time
 from datetime import datetime
 from typing import Optional
 from contextlib import asynccontextmanager
@@ -23,6 +25,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from pathlib import Path
 
 from workspace_secretary.config import WebConfig, load_config_with_oauth2
+from workspace_secretary.json_utils import JSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +42,30 @@ def _running_in_docker() -> bool:
     return Path("/.dockerenv").exists()
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_iso_string(value: str, format_string: str) -> str:
+    """Parse an ISO timestamp and format it; memoized per (value, format).
+
+    List views render the same handful of formats over and over, and the
+    same timestamps recur across page loads, so most calls are cache hits.
+    """
+    if value.endswith("Z"):
+        # datetime.fromisoformat only accepts a trailing "Z" from Python 3.11
+        value_to_parse = value[:-1] + "+00:00"
+    else:
+        value_to_parse = value
+    try:
+        return datetime.fromisoformat(value_to_parse).strftime(format_string)
+    except ValueError:
+        return value
+
+
 def _strftime_filter(value, format_string: str) -> str:
     """Format datetime value using strftime. Handles ISO strings and datetime objects."""
     if value is None:
         return ""
     if isinstance(value, str):
-        try:
-            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            return value
+        return _format_iso_string(value, format_string)
     if isinstance(value, datetime):
         return value.strftime(format_string)
     return str(value)
@@ -57,8 +75,14 @@ templates.env.filters["strftime"] = _strftime_filter
 
 _web_config: Optional[WebConfig] = None
 
+# Per-user (theme, density) read from user_preferences, kept briefly so page
+# renders don't each pay a database round-trip.
+UI_PREFS_CACHE_TTL_SECONDS = 60
+_ui_prefs_cache: dict[str, tuple[float, Optional[str], Optional[str]]] = {}
+
 HEALTH_CHECK_INTERVAL_SECONDS = 300
 HEALTH_CHECK_INITIAL_DELAY_SECONDS = 60
+HEALTH_CHECK_TIMEOUT_SECONDS = 30
 
 
 async def _health_check_loop():
@@ -66,10 +90,22 @@ async def _health_check_loop():
     from workspace_secretary.web.alerting import check_and_alert
 
     await asyncio.sleep(HEALTH_CHECK_INITIAL_DELAY_SECONDS)
+    next_run = time.monotonic()
     while True:
+        # Fixed cadence on the monotonic clock, so slow checks don't add
+        # drift; a missed slot is skipped rather than run back-to-back.
+        next_run = max(next_run, time.monotonic()) + HEALTH_CHECK_INTERVAL_SECONDS
         try:
-            mutation_stats = get_mutation_stats()
-            sync_stats = get_sync_stats()
+            # The stats helpers run blocking DB queries; keep them off the
+            # event loop and bound them so a stuck database can't stall
+            # alerting forever.
+            mutation_stats, sync_stats = await asyncio.wait_for(
+                asyncio.gather(
+                    asyncio.to_thread(get_mutation_stats),
+                    asyncio.to_thread(get_sync_stats),
+                ),
+                timeout=HEALTH_CHECK_TIMEOUT_SECONDS,
+            )
 
             overall_health = "healthy"
             if (
@@ -79,13 +115,19 @@ async def _health_check_loop():
                 overall_health = "critical"
 
             if overall_health == "critical":
-                alerts_sent = check_and_alert(mutation_stats, sync_stats)
+                alerts_sent = await asyncio.to_thread(
+                    check_and_alert, mutation_stats, sync_stats
+                )
                 if alerts_sent:
                     logger.warning(f"Critical alerts sent: {alerts_sent}")
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Health check timed out after {HEALTH_CHECK_TIMEOUT_SECONDS}s"
+            )
         except Exception as e:
             logger.error(f"Health check error: {e}")
 
-        await asyncio.sleep(HEALTH_CHECK_INTERVAL_SECONDS)
+        await asyncio.sleep(max(0.0, next_run - time.monotonic()))
 
 
 async def _init_shared_state():
@@ -118,6 +160,13 @@ async def lifespan(app):
     global _executor_task
     
     await _init_shared_state()
+
+    from workspace_secretary.web.database import init_db
+
+    try:
+        await asyncio.to_thread(init_db)
+    except Exception as e:
+        logger.error(f"Web database init failed, will retry on first use: {e}")
     
     health_check_task = asyncio.create_task(_health_check_loop())
     logger.info("Background health check started")
@@ -142,6 +191,19 @@ async def lifespan(app):
         pass
     logger.info("Background health check stopped")
 
+    from workspace_secretary.web.auth import close_oidc_client
+
+    await close_oidc_client()
+
+    from workspace_secretary.web.engine_client import close_client
+
+    await close_client()
+
+    from workspace_secretary.web.database import close_db
+
+    close_db()
+    logger.info("Web database pool closed")
+
 
 web_app = FastAPI(
     title="Secretary Web",
@@ -149,6 +211,7 @@ web_app = FastAPI(
     docs_url="/api/docs",
     redoc_url=None,
     lifespan=lifespan,
+    default_response_class=JSONResponse,
 )
 
 
@@ -189,10 +252,50 @@ def get_web_config() -> Optional[WebConfig]:
     return _web_config
 
 
-def get_template_context(request: Request, **kwargs) -> dict:
-    from workspace_secretary.web.auth import CSRF_COOKIE, get_session
+def _load_ui_prefs(user_id: str) -> tuple[Optional[str], Optional[str]]:
+    """Read the user's theme and density from user_preferences."""
     from workspace_secretary.web.database import get_pool
-    import json
+    from workspace_secretary.json_utils import loads
+
+    pool = get_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT prefs_json FROM user_preferences WHERE user_id = %s",
+                (user_id,),
+            )
+            row = cur.fetchone()
+    if not row or not row[0]:
+        return None, None
+    prefs = row[0]
+    if isinstance(prefs, (str, bytes)):
+        prefs = loads(prefs)
+    return prefs.get("theme"), prefs.get("density")
+
+
+async def get_ui_prefs(user_id: str) -> tuple[Optional[str], Optional[str]]:
+    """Return the user's (theme, density), cached for a short TTL.
+
+    Cache misses run the blocking query on a worker thread so the event
+    loop keeps serving other requests meanwhile.
+    """
+    now = time.monotonic()
+    cached = _ui_prefs_cache.get(user_id)
+    if cached and cached[0] > now:
+        return cached[1], cached[2]
+
+    theme, density = await asyncio.to_thread(_load_ui_prefs, user_id)
+    _ui_prefs_cache[user_id] = (now + UI_PREFS_CACHE_TTL_SECONDS, theme, density)
+    return theme, density
+
+
+def invalidate_ui_prefs(user_id: str) -> None:
+    """Drop a user's cached UI preferences after they change."""
+    _ui_prefs_cache.pop(user_id, None)
+
+
+async def get_template_context(request: Request, **kwargs) -> dict:
+    from workspace_secretary.web.auth import CSRF_COOKIE, get_session
 
     session = get_session(request)
     theme = "dark"
@@ -200,18 +303,9 @@ def get_template_context(request: Request, **kwargs) -> dict:
 
     if session:
         try:
-            pool = get_pool()
-            with pool.connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "SELECT prefs_json FROM user_preferences WHERE user_id = %s",
-                        (session.user_id,),
-                    )
-                    row = cur.fetchone()
-                    if row:
-                        prefs = json.loads(row[0])
-                        theme = prefs.get("theme", theme)
-                        density = prefs.get("density", density)
+            cached_theme, cached_density = await get_ui_prefs(session.user_id)
+            theme = cached_theme or theme
+            density = cached_density or density
         except Exception:
             pass
 
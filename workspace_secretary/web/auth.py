@@ -10,14 +10,14 @@ Supports:
 
 import hashlib
 import hmac
-import json
 import logging
+import os
 import secrets
 import time
-from base64 import b64decode, b64encode
+from base64 import b64decode, urlsafe_b64decode, urlsafe_b64encode
 from dataclasses import dataclass
 from functools import wraps
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 from urllib.parse import urlencode
 
 import httpx
@@ -32,6 +32,7 @@ from workspace_secretary.config import (
     WebOIDCConfig,
     WebSAML2Config,
 )
+from workspace_secretary.json_utils import dumps, dumps_bytes, loads
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +42,50 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 SESSION_COOKIE = "secretary_session"
 CSRF_COOKIE = "secretary_csrf"
 CSRF_HEADER = "X-CSRF-Token"
+OIDC_STATE_COOKIE = "secretary_oidc_state"
+OIDC_STATE_TTL_SECONDS = 600
+# Signed into every OIDC state so a state and a session token can never be
+# swapped for one another, even though both are sealed with the same key
+OIDC_STATE_PURPOSE = b"oidc-state"
+# Redeemed state nonces remembered per process; see verify_oidc_state
+OIDC_NONCE_CACHE_SIZE = 1024
 SESSION_MAX_AGE = 86400  # 24 hours default
 
+# Session token format: "v2:" + urlsafe_b64(payload + b"." + signature),
+# where signature is a raw 128-bit keyed BLAKE2b digest of the JSON payload.
+SESSION_TOKEN_PREFIX = "v2:"
+SESSION_SIGNATURE_SIZE = 16
+# Verified tokens kept in memory so repeat requests skip signature + decode
+SESSION_CACHE_SIZE = 1024
 
-@dataclass
+# Sentinel for "not yet looked up" in the per-request session cache
+_UNSET = object()
+
+# Shared client for OIDC provider calls, so discovery, token exchange and
+# userinfo reuse pooled keep-alive connections instead of new TLS handshakes.
+_oidc_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_oidc_client() -> httpx.AsyncClient:
+    global _oidc_client
+    if _oidc_client is None:
+        _oidc_client = httpx.AsyncClient(
+            timeout=10.0, limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    return _oidc_client
+
+
+async def close_oidc_client() -> None:
+    """Close the shared OIDC HTTP client (called on app shutdown)."""
+    global _oidc_client
+    if _oidc_client is not None:
+        await _oidc_client.aclose()
+        _oidc_client = None
+
+
+@dataclass(frozen=True, slots=True)
 class Session:
-    """User session data."""
+    """User session data (immutable once decoded from the signed token)."""
 
     user_id: str
     email: Optional[str] = None
@@ -58,21 +97,25 @@ class Session:
     def is_valid(self) -> bool:
         return time.time() < self.expires_at
 
+    def to_dict(self) -> dict:
+        return {
+            "user_id": self.user_id,
+            "email": self.email,
+            "name": self.name,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
+            "csrf_token": self.csrf_token,
+        }
+
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "user_id": self.user_id,
-                "email": self.email,
-                "name": self.name,
-                "created_at": self.created_at,
-                "expires_at": self.expires_at,
-                "csrf_token": self.csrf_token,
-            }
-        )
+        return dumps(self.to_dict())
+
+    def to_bytes(self) -> bytes:
+        return dumps_bytes(self.to_dict())
 
     @classmethod
-    def from_json(cls, data: str) -> "Session":
-        d = json.loads(data)
+    def from_json(cls, data: Union[str, bytes]) -> "Session":
+        d = loads(data)
         return cls(
             user_id=d["user_id"],
             email=d.get("email"),
@@ -83,6 +126,81 @@ class Session:
         )
 
 
+def _reject_password(password: str) -> bool:
+    return False
+
+
+def _make_password_verifier(stored_hash: Optional[str]) -> Callable[[str], bool]:
+    """Build the password check for ``stored_hash`` once, at startup.
+
+    Dispatches on the hash prefix and imports the hashing library up front,
+    so each login attempt is a single call into the verifier.
+    """
+    if not stored_hash:
+        return _reject_password
+
+    # Support argon2 if available
+    if stored_hash.startswith("$argon2"):
+        try:
+            from argon2 import PasswordHasher
+            from argon2.exceptions import VerifyMismatchError
+        except ImportError:
+            logger.error("argon2-cffi not installed, cannot verify argon2 hash")
+            return _reject_password
+
+        hasher = PasswordHasher()
+
+        def verify_argon2(password: str) -> bool:
+            try:
+                return hasher.verify(stored_hash, password)
+            except VerifyMismatchError:
+                return False
+
+        return verify_argon2
+
+    # Support bcrypt
+    if stored_hash.startswith("$2"):
+        try:
+            import bcrypt
+        except ImportError:
+            logger.error("bcrypt not installed, cannot verify bcrypt hash")
+            return _reject_password
+
+        stored_hash_bytes = stored_hash.encode()
+
+        def verify_bcrypt(password: str) -> bool:
+            return bcrypt.checkpw(password.encode(), stored_hash_bytes)
+
+        return verify_bcrypt
+
+    # Fallback: SHA-256 (not recommended for production)
+    if stored_hash.startswith("sha256:"):
+        if os.environ.get("WEB_DISABLE_SHA256_PASSWORDS", "false").lower() == "true":
+            logger.error(
+                "sha256 password hashes are disabled by WEB_DISABLE_SHA256_PASSWORDS"
+            )
+            return _reject_password
+        try:
+            _, salt, hash_val = stored_hash.split(":")
+            expected = bytes.fromhex(hash_val)
+        except ValueError:
+            logger.error("Malformed sha256 password hash, expected sha256:salt:hash")
+            return _reject_password
+        logger.warning(
+            "sha256 password hashes are deprecated; switch to an argon2 or bcrypt hash"
+        )
+        salt_bytes = salt.encode()
+
+        def verify_sha256(password: str) -> bool:
+            computed = hashlib.sha256(salt_bytes + password.encode()).digest()
+            return hmac.compare_digest(computed, expected)
+
+        return verify_sha256
+
+    logger.error(f"Unknown password hash format: {stored_hash[:10]}...")
+    return _reject_password
+
+
 class AuthManager:
     """Manages authentication for the web UI."""
 
@@ -90,6 +208,13 @@ class AuthManager:
         self.config = config
         self._oidc_config_cache: Optional[dict] = None
         self._oidc_config_expires: float = 0.0
+        self._secret_bytes = self._load_session_secret()
+        self._session_cache: dict[str, Session] = {}
+        # OIDC state nonces already redeemed, kept until their state expires
+        self._used_oidc_nonces: dict[bytes, int] = {}
+        self._verify_password = _make_password_verifier(
+            self.auth_config.password_hash if self.auth_config else None
+        )
 
     @property
     def auth_config(self):
@@ -101,13 +226,26 @@ class AuthManager:
             return WebAuthMethod.NONE
         return self.auth_config.method
 
-    @property
-    def session_secret(self) -> bytes:
+    def _load_session_secret(self) -> bytes:
         if not self.auth_config or not self.auth_config.session_secret:
             # Fallback for development - NOT SECURE
             return b"insecure-dev-secret-do-not-use-in-production"
         return self.auth_config.session_secret.encode()
 
+    @property
+    def session_secret(self) -> bytes:
+        return self._secret_bytes
+
+    def _sign(self, payload: bytes) -> bytes:
+        """Sign a session payload with keyed BLAKE2b (128-bit raw digest)."""
+        return hashlib.blake2b(
+            payload, key=self._secret_bytes, digest_size=SESSION_SIGNATURE_SIZE
+        ).digest()
+
+    def _sign_legacy(self, payload: bytes) -> str:
+        """HMAC-SHA256 signature used by pre-v2 ``payload|hexdigest`` tokens."""
+        return hmac.new(self._secret_bytes, payload, hashlib.sha256).hexdigest()
+
     @property
     def session_expiry(self) -> int:
         if not self.auth_config:
@@ -131,74 +269,142 @@ class AuthManager:
             expires_at=now + self.session_expiry,
             csrf_token=csrf_token,
         )
-        payload = session.to_json()
-        signature = hmac.new(
-            self.session_secret, payload.encode(), hashlib.sha256
-        ).hexdigest()
-        token = b64encode(f"{payload}|{signature}".encode()).decode()
+        token = SESSION_TOKEN_PREFIX + self._seal(session.to_bytes())
+        self._cache_session(token, session)
         return token
 
+    def _cache_session(self, token: str, session: Session) -> None:
+        """Remember a verified session, evicting the oldest entry when full."""
+        if len(self._session_cache) >= SESSION_CACHE_SIZE:
+            self._session_cache.pop(next(iter(self._session_cache)))
+        self._session_cache[token] = session
+
+    def forget_session(self, token: str) -> None:
+        """Drop a token from the verified-session cache."""
+        self._session_cache.pop(token, None)
+
+    def _seal(self, payload: bytes) -> str:
+        """Encode ``payload + b"." + signature`` as unpadded urlsafe base64.
+
+        The pieces are appended into one buffer so only the buffer and the
+        encoded output are allocated.
+        """
+        buf = bytearray(payload)
+        buf += b"."
+        buf += self._sign(payload)
+        return urlsafe_b64encode(buf).rstrip(b"=").decode()
+
+    def _split_token(self, token: str) -> tuple[bytes, bool]:
+        """Decode a session token into its payload and signature validity."""
+        if not token.startswith(SESSION_TOKEN_PREFIX):
+            # Pre-v2 token: b64("<json>|<hex signature>")
+            payload, signature = b64decode(token.encode()).rsplit(b"|", 1)
+            expected = self._sign_legacy(payload)
+            return payload, hmac.compare_digest(signature.decode(), expected)
+
+        payload = self._open_signed(token[len(SESSION_TOKEN_PREFIX) :])
+        return payload or b"", payload is not None
+
+    def _open_signed(self, value: str) -> Optional[bytes]:
+        """Return the payload of ``b64(payload + b"." + signature)`` if valid."""
+        raw = urlsafe_b64decode(value + "=" * (-len(value) % 4))
+        # The signature is fixed-width raw bytes and may itself contain b".",
+        # so split by length rather than on the separator.
+        split_at = len(raw) - SESSION_SIGNATURE_SIZE - 1
+        if split_at < 1 or raw[split_at : split_at + 1] != b".":
+            return None
+        payload, signature = raw[:split_at], raw[split_at + 1 :]
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+        return payload
+
     def verify_session(self, token: str) -> Optional[Session]:
-        """Verify and decode a session token."""
+        """Verify and decode a session token.
+
+        Tokens that already verified are served from an in-memory cache until
+        they expire, so the signature and JSON payload are checked once per
+        token rather than once per request.
+        """
+        cached = self._session_cache.get(token)
+        if cached is not None:
+            if cached.is_valid():
+                return cached
+            self.forget_session(token)
+            logger.debug("Session expired")
+            return None
+
         try:
-            decoded = b64decode(token.encode()).decode()
-            payload, signature = decoded.rsplit("|", 1)
-            expected = hmac.new(
-                self.session_secret, payload.encode(), hashlib.sha256
-            ).hexdigest()
-            if not hmac.compare_digest(signature, expected):
+            payload, valid = self._split_token(token)
+            if not valid:
                 logger.warning("Invalid session signature")
                 return None
             session = Session.from_json(payload)
             if not session.is_valid():
                 logger.debug("Session expired")
                 return None
+            self._cache_session(token, session)
             return session
         except Exception as e:
             logger.debug(f"Session verification failed: {e}")
             return None
 
-    def verify_password(self, password: str) -> bool:
-        """Verify password against stored hash."""
-        if not self.auth_config or not self.auth_config.password_hash:
+    def create_oidc_state(self) -> tuple[str, str]:
+        """Create a signed, self-expiring OIDC state for one login attempt.
+
+        Returns:
+            ``(state, nonce)``; the state goes to the provider and the nonce
+            into the browser's state cookie, binding the two together.
+        """
+        nonce = secrets.token_urlsafe(16)
+        expires_at = int(time.time()) + OIDC_STATE_TTL_SECONDS
+        payload = b".".join(
+            (OIDC_STATE_PURPOSE, nonce.encode(), str(expires_at).encode())
+        )
+        return self._seal(payload), nonce
+
+    def verify_oidc_state(self, state: str, cookie_nonce: Optional[str]) -> bool:
+        """Verify and redeem an OIDC state against the login's nonce cookie.
+
+        A state is accepted once per process: redeemed nonces are kept in
+        this process's memory only, so with several web workers (or after a
+        restart) a replayed state can still pass until it expires. The
+        nonce cookie is what binds a state to the browser that started the
+        login, and the callback clears it on every outcome.
+        """
+        if not state or not cookie_nonce:
             return False
-
-        stored_hash = self.auth_config.password_hash
-
-        # Support argon2 if available
-        if stored_hash.startswith("$argon2"):
-            try:
-                from argon2 import PasswordHasher
-                from argon2.exceptions import VerifyMismatchError
-
-                ph = PasswordHasher()
-                try:
-                    ph.verify(stored_hash, password)
-                    return True
-                except VerifyMismatchError:
-                    return False
-            except ImportError:
-                logger.error("argon2-cffi not installed, cannot verify argon2 hash")
-                return False
-
-        # Support bcrypt
-        if stored_hash.startswith("$2"):
-            try:
-                import bcrypt
-
-                return bcrypt.checkpw(password.encode(), stored_hash.encode())
-            except ImportError:
-                logger.error("bcrypt not installed, cannot verify bcrypt hash")
+        try:
+            payload = self._open_signed(state)
+            if payload is None:
                 return False
+            purpose, nonce, expires = payload.split(b".")
+            expires_at = int(expires)
+        except ValueError:
+            return False
+        if purpose != OIDC_STATE_PURPOSE:
+            return False
+        if not hmac.compare_digest(nonce, cookie_nonce.encode()):
+            return False
 
-        # Fallback: SHA-256 (not recommended for production)
-        if stored_hash.startswith("sha256:"):
-            _, salt, hash_val = stored_hash.split(":")
-            computed = hashlib.sha256((salt + password).encode()).hexdigest()
-            return hmac.compare_digest(computed, hash_val)
+        now = time.time()
+        if now > expires_at or nonce in self._used_oidc_nonces:
+            return False
+        self._remember_oidc_nonce(nonce, expires_at, now)
+        return True
+
+    def _remember_oidc_nonce(self, nonce: bytes, expires_at: int, now: float) -> None:
+        """Record a redeemed nonce, dropping expired and then oldest entries."""
+        used = self._used_oidc_nonces
+        for old, old_expiry in list(used.items()):
+            if old_expiry < now:
+                del used[old]
+        if len(used) >= OIDC_NONCE_CACHE_SIZE:
+            used.pop(next(iter(used)))
+        used[nonce] = expires_at
 
-        logger.error(f"Unknown password hash format: {stored_hash[:10]}...")
-        return False
+    def verify_password(self, password: str) -> bool:
+        """Verify password against stored hash."""
+        return self._verify_password(password)
 
     async def get_oidc_config(self) -> dict:
         """Fetch OIDC provider configuration."""
@@ -217,12 +423,12 @@ class AuthManager:
             f"{oidc.provider_url.rstrip('/')}/.well-known/openid-configuration"
         )
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(well_known_url, timeout=10.0)
-            resp.raise_for_status()
-            self._oidc_config_cache = resp.json()
-            self._oidc_config_expires = time.time() + 3600
-            return self._oidc_config_cache  # type: ignore[return-value]
+        client = _get_oidc_client()
+        resp = await client.get(well_known_url)
+        resp.raise_for_status()
+        self._oidc_config_cache = loads(resp.content)
+        self._oidc_config_expires = time.time() + 3600
+        return self._oidc_config_cache  # type: ignore[return-value]
 
     def get_oidc_authorize_url(self, redirect_uri: str, state: str) -> str:
         """Build OIDC authorization URL."""
@@ -264,40 +470,39 @@ class AuthManager:
         if "accounts.google.com" in oidc.provider_url:
             token_endpoint = "https://oauth2.googleapis.com/token"
 
-        async with httpx.AsyncClient() as client:
-            # Exchange code for tokens
-            token_resp = await client.post(
-                token_endpoint,
-                data={
-                    "client_id": oidc.client_id,
-                    "client_secret": oidc.client_secret,
-                    "code": code,
-                    "redirect_uri": redirect_uri,
-                    "grant_type": "authorization_code",
-                },
-                timeout=10.0,
-            )
-            token_resp.raise_for_status()
-            tokens = token_resp.json()
-
-            # Get user info
-            userinfo_endpoint = f"{oidc.provider_url.rstrip('/')}/userinfo"
-            if "accounts.google.com" in oidc.provider_url:
-                userinfo_endpoint = "https://openidconnect.googleapis.com/v1/userinfo"
-
-            userinfo_resp = await client.get(
-                userinfo_endpoint,
-                headers={"Authorization": f"Bearer {tokens['access_token']}"},
-                timeout=10.0,
-            )
-            userinfo_resp.raise_for_status()
-            userinfo = userinfo_resp.json()
+        client = _get_oidc_client()
+
+        # Exchange code for tokens
+        token_resp = await client.post(
+            token_endpoint,
+            data={
+                "client_id": oidc.client_id,
+                "client_secret": oidc.client_secret,
+                "code": code,
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+            },
+        )
+        token_resp.raise_for_status()
+        tokens = loads(token_resp.content)
 
-            user_id = userinfo.get("sub", userinfo.get("id", "unknown"))
-            email = userinfo.get("email")
-            name = userinfo.get("name")
+        # Get user info
+        userinfo_endpoint = f"{oidc.provider_url.rstrip('/')}/userinfo"
+        if "accounts.google.com" in oidc.provider_url:
+            userinfo_endpoint = "https://openidconnect.googleapis.com/v1/userinfo"
+
+        userinfo_resp = await client.get(
+            userinfo_endpoint,
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        )
+        userinfo_resp.raise_for_status()
+        userinfo = loads(userinfo_resp.content)
 
-            return user_id, email, name
+        user_id = userinfo.get("sub", userinfo.get("id", "unknown"))
+        email = userinfo.get("email")
+        name = userinfo.get("name")
+
+        return user_id, email, name
 
 
 # Global auth manager instance
@@ -320,12 +525,22 @@ def init_auth(config: Optional[WebConfig]):
 
 
 def get_session(request: Request) -> Optional[Session]:
-    """Extract and verify session from request."""
-    auth_mgr = get_auth_manager()
+    """Extract and verify session from request.
+
+    The result (including ``None``) is memoized on ``request.state``, which
+    Starlette shares across middleware and dependencies, so the cookie is
+    verified at most once per request.
+    """
+    cached = getattr(request.state, "_session_cached", _UNSET)
+    if cached is not _UNSET:
+        return cached
+
+    session = None
     token = request.cookies.get(SESSION_COOKIE)
-    if not token:
-        return None
-    return auth_mgr.verify_session(token)
+    if token:
+        session = get_auth_manager().verify_session(token)
+    request.state._session_cached = session
+    return session
 
 
 class CSRFMiddleware(BaseHTTPMiddleware):
@@ -363,13 +578,16 @@ class CSRFMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+_ANONYMOUS_SESSION = Session(user_id="anonymous", email=None, name="Anonymous")
+
+
 async def require_auth(request: Request) -> Session:
     """Dependency that requires authentication."""
     auth_mgr = get_auth_manager()
 
     # No auth required
     if auth_mgr.method == WebAuthMethod.NONE:
-        return Session(user_id="anonymous", email=None, name="Anonymous")
+        return _ANONYMOUS_SESSION
 
     session = get_session(request)
     if not session:
@@ -384,33 +602,6 @@ async def require_auth(request: Request) -> Session:
     return session
 
 
-# In-memory state storage for OIDC (use Redis in production)
-_oidc_states: dict[str, float] = {}
-
-
-def _generate_state() -> str:
-    """Generate and store OIDC state parameter."""
-    state = secrets.token_urlsafe(32)
-    _oidc_states[state] = time.time() + 600  # Valid for 10 minutes
-    # Clean old states
-    now = time.time()
-    expired = [s for s, exp in _oidc_states.items() if exp < now]
-    for s in expired:
-        del _oidc_states[s]
-    return state
-
-
-def _verify_state(state: str) -> bool:
-    """Verify OIDC state parameter."""
-    if state not in _oidc_states:
-        return False
-    if time.time() > _oidc_states[state]:
-        del _oidc_states[state]
-        return False
-    del _oidc_states[state]
-    return True
-
-
 # =============================================================================
 # Auth Routes
 # =============================================================================
@@ -434,10 +625,19 @@ async def login_page(request: Request, next: str = "/"):
 
     # OIDC - redirect to provider
     if auth_mgr.method == WebAuthMethod.OIDC:
-        state = _generate_state()
+        state, nonce = auth_mgr.create_oidc_state()
         redirect_uri = str(request.url_for("oidc_callback"))
         auth_url = auth_mgr.get_oidc_authorize_url(redirect_uri, state)
-        return RedirectResponse(url=auth_url)
+        response = RedirectResponse(url=auth_url)
+        response.set_cookie(
+            OIDC_STATE_COOKIE,
+            nonce,
+            max_age=OIDC_STATE_TTL_SECONDS,
+            httponly=True,
+            samesite="lax",
+            secure=request.url.scheme == "https",
+        )
+        return response
 
     # SAML2 - redirect to IdP
     if auth_mgr.method == WebAuthMethod.SAML2:
@@ -522,9 +722,11 @@ async def oidc_callback(
         logger.error(f"OIDC error: {error}")
         return RedirectResponse(url="/auth/login?error=oidc_error")
 
-    if not _verify_state(state):
+    if not auth_mgr.verify_oidc_state(state, request.cookies.get(OIDC_STATE_COOKIE)):
         logger.error("Invalid OIDC state")
-        return RedirectResponse(url="/auth/login?error=invalid_state")
+        response = RedirectResponse(url="/auth/login?error=invalid_state")
+        response.delete_cookie(OIDC_STATE_COOKIE)
+        return response
 
     try:
         redirect_uri = str(request.url_for("oidc_callback"))
@@ -551,6 +753,7 @@ async def oidc_callback(
             samesite="lax",
             secure=request.url.scheme == "https",
         )
+        response.delete_cookie(OIDC_STATE_COOKIE)
         return response
     except Exception as e:
         logger.exception(f"OIDC callback failed: {e}")
@@ -560,6 +763,9 @@ async def oidc_callback(
 @router.get("/logout")
 async def logout(request: Request):
     """Log out and clear session."""
+    token = request.cookies.get(SESSION_COOKIE)
+    if token:
+        get_auth_manager().forget_session(token)
     response = RedirectResponse(url="/auth/login", status_code=303)
     response.delete_cookie(SESSION_COOKIE)
     response.delete_cookie(CSRF_COOKIE)
@@ -2,12 +2,19 @@
 Web UI database access layer - read-only queries using shared PostgresDatabase.
 """
 
-from typing import Optional, Any
+from typing import Any, Callable, Optional
+from array import array
 from contextlib import contextmanager
+from datetime import datetime
+import asyncio
+import hashlib
 import logging
-from psycopg.rows import dict_row
+import threading
+import time
 
+from workspace_secretary.config import load_config
 from workspace_secretary.db import PostgresDatabase
+from workspace_secretary.json_utils import dumps_bytes
 from workspace_secretary.db.queries import emails as email_q
 from workspace_secretary.db.queries import embeddings as emb_q
 from workspace_secretary.db.queries import contacts as contact_q
@@ -18,38 +25,96 @@ from workspace_secretary.db.queries import booking_links as booking_q
 logger = logging.getLogger(__name__)
 
 _db: Optional[PostgresDatabase] = None
+# Serializes lazy creation so concurrent first requests share one pool
+_db_lock = threading.Lock()
+
+# Folder list changes rarely but is rendered on every search page.
+FOLDERS_CACHE_TTL_SECONDS = 60
+_folders_cache: Optional[tuple[float, list[str]]] = None
+
+# Whether any embeddings exist; only flips once the first batch is indexed.
+EMBEDDINGS_CACHE_TTL_SECONDS = 60
+_has_embeddings_cache: Optional[tuple[float, bool]] = None
+
+# Frequent/recent contact sidebars are aggregates over the whole contacts table.
+CONTACTS_CACHE_TTL_SECONDS = 60
+_contacts_cache: dict[tuple, tuple[float, list[dict]]] = {}
+
+# Calendar selection (preferences + sync states) is read several times per
+# calendar page; settings writes drop a user's entry immediately.
+CALENDAR_SELECTION_CACHE_TTL_SECONDS = 60
+_calendar_selection_cache: dict[str, tuple[float, dict]] = {}
+
+# Identical semantic searches (refresh, back navigation) reuse recent results.
+SEARCH_CACHE_TTL_SECONDS = 60
+SEARCH_CACHE_SIZE = 256
+_search_cache: dict[bytes, tuple[float, list[dict]]] = {}
+# Identical searches already running; later callers await the same task.
+_search_inflight: dict[bytes, asyncio.Future] = {}
+
+# Single-row lookups by primary key (email headers, contact, booking link) are
+# repeated on every navigation; mutations through the web UI drop the affected
+# entry. Email bodies are never cached, and paths that decide a mutation read
+# the uncached row.
+ROW_CACHE_TTL_SECONDS = 30
+ROW_CACHE_SIZE = 1024
+_email_cache: dict[tuple[int, str], tuple[float, Optional[dict]]] = {}
+_contact_row_cache: dict[str, tuple[float, Optional[dict]]] = {}
+_booking_link_cache: dict[str, tuple[float, Optional[dict]]] = {}
+
+
+def init_db() -> PostgresDatabase:
+    """Create the shared PostgresDatabase for the web UI and bind it.
+
+    Called once from the app lifespan so schema setup and pool creation
+    happen at startup rather than inside the first request.
+    """
+    global _db
+    if _db is not None:
+        return _db
+
+    with _db_lock:
+        if _db is None:
+            _db = _open_db()
+            logger.info("Web UI database initialized")
+        return _db
+
+
+def _open_db() -> PostgresDatabase:
+    config = load_config()
+    if not config.database or not config.database.postgres:
+        logger.error("PostgreSQL configuration is missing from config.yaml")
+        raise RuntimeError("PostgreSQL configuration is missing")
+
+    db_config = config.database.postgres
+    embedding_dimensions = 1536
+    vector_type = None
+    if hasattr(config.database, "embeddings") and config.database.embeddings:
+        embedding_dimensions = getattr(config.database.embeddings, "dimensions", 1536)
+        vector_type = getattr(config.database.embeddings, "vector_type", None)
+
+    db = PostgresDatabase(
+        host=db_config.host,
+        port=db_config.port,
+        database=db_config.database,
+        user=db_config.user,
+        password=db_config.password,
+        ssl_mode=getattr(db_config, "ssl_mode", "prefer"),
+        embedding_dimensions=embedding_dimensions,
+        pool_min_size=db_config.pool_min_size,
+        pool_max_size=db_config.pool_max_size,
+        pool_max_lifetime=db_config.pool_max_lifetime,
+        pool_max_idle=db_config.pool_max_idle,
+        prepare_threshold=db_config.prepare_threshold,
+        vector_type=vector_type,
+    )
+    db.initialize()
+    return db
 
 
 def get_db() -> PostgresDatabase:
-    """Get or create singleton PostgresDatabase instance for web UI."""
-    global _db
-    if _db is None:
-        from workspace_secretary.config import load_config
-
-        config = load_config()
-        if not config.database or not config.database.postgres:
-            logger.error("PostgreSQL configuration is missing from config.yaml")
-            raise RuntimeError("PostgreSQL configuration is missing")
-
-        db_config = config.database.postgres
-        embedding_dimensions = 1536
-        if hasattr(config.database, "embeddings") and config.database.embeddings:
-            embedding_dimensions = getattr(
-                config.database.embeddings, "dimensions", 1536
-            )
-
-        _db = PostgresDatabase(
-            host=db_config.host,
-            port=db_config.port,
-            database=db_config.database,
-            user=db_config.user,
-            password=db_config.password,
-            ssl_mode=getattr(db_config, "ssl_mode", "prefer"),
-            embedding_dimensions=embedding_dimensions,
-        )
-        _db.initialize()
-        logger.info("Web UI database initialized")
-    return _db
+    """Return the shared PostgresDatabase, creating it if startup did not."""
+    return _db if _db is not None else init_db()
 
 
 def get_vector_type() -> str:
@@ -76,76 +141,221 @@ def get_pool():
     return get_db()._pool
 
 
-def get_inbox_emails(
+def get_pool_stats() -> dict[str, int]:
+    """Return connection pool counters without opening the pool."""
+    return _db.pool_stats() if _db is not None else {}
+
+
+def close_db() -> None:
+    """Close the shared database pool, if it was opened."""
+    global _db
+    with _db_lock:
+        if _db is not None:
+            _db.close()
+            _db = None
+
+
+async def get_inbox_emails(
     folder: str,
     limit: int,
     offset: int,
     unread_only: bool = False,
     label: str | None = None,
+    before: tuple[datetime, int] | None = None,
+    list_only: bool = False,
 ) -> list[dict]:
-    return email_q.get_inbox_emails(get_db(), folder, limit, offset, unread_only, label)
+    return await asyncio.to_thread(
+        email_q.get_inbox_emails,
+        get_db(),
+        folder,
+        limit,
+        offset,
+        unread_only,
+        label,
+        before,
+        list_only,
+    )
+
+
+def _row_cache_get(cache: dict, key: Any) -> tuple[bool, Any]:
+    cached = cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return True, cached[1]
+    return False, None
+
+
+def _row_cache_put(cache: dict, key: Any, row: Any) -> None:
+    cache.pop(key, None)
+    if len(cache) >= ROW_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = (time.monotonic() + ROW_CACHE_TTL_SECONDS, row)
+
+
+async def get_email(uid: int, folder: str) -> Optional[dict]:
+    return await asyncio.to_thread(email_q.get_email, get_db(), uid, folder)
 
 
-def get_email(uid: int, folder: str) -> Optional[dict]:
-    return email_q.get_email(get_db(), uid, folder)
+async def get_email_headers(uid: int, folder: str) -> Optional[dict]:
+    """Fetch one email without its bodies, cached for a short TTL."""
+    hit, row = _row_cache_get(_email_cache, (uid, folder))
+    if hit:
+        return row
 
+    row = await asyncio.to_thread(email_q.get_email_headers, get_db(), uid, folder)
+    _row_cache_put(_email_cache, (uid, folder), row)
+    return row
 
-def get_neighbor_uids(
+
+def invalidate_email(uid: int, folder: str) -> None:
+    """Drop a cached email after a flag, label, move or delete mutation."""
+    _email_cache.pop((uid, folder), None)
+
+
+async def get_neighbor_uids(
     folder: str, uid: int, unread_only: bool = False
 ) -> dict[str, Optional[int]]:
-    return email_q.get_neighbor_uids(get_db(), folder, uid, unread_only)
+    return await asyncio.to_thread(
+        email_q.get_neighbor_uids, get_db(), folder, uid, unread_only
+    )
+
+
+async def get_thread(uid: int, folder: str) -> list[dict]:
+    return await asyncio.to_thread(email_q.get_thread, get_db(), uid, folder)
+
+
+async def search_emails(query: str, folder: str, limit: int) -> list[dict]:
+    return await asyncio.to_thread(
+        email_q.search_emails_fts, get_db(), query, folder, limit
+    )
 
 
-def get_thread(uid: int, folder: str) -> list[dict]:
-    return email_q.get_thread(get_db(), uid, folder)
+async def has_embeddings() -> bool:
+    """Return whether any embeddings exist, cached for a short TTL."""
+    global _has_embeddings_cache
+    now = time.monotonic()
+    if _has_embeddings_cache and _has_embeddings_cache[0] > now:
+        return _has_embeddings_cache[1]
 
+    result = await asyncio.to_thread(emb_q.has_embeddings, get_db())
+    _has_embeddings_cache = (now + EMBEDDINGS_CACHE_TTL_SECONDS, result)
+    return result
 
-def search_emails(query: str, folder: str, limit: int) -> list[dict]:
-    return email_q.search_emails_fts(get_db(), query, folder, limit)
 
+async def get_folders() -> list[str]:
+    """Return the distinct folder names, cached for a short TTL."""
+    global _folders_cache
+    now = time.monotonic()
+    if _folders_cache and _folders_cache[0] > now:
+        return _folders_cache[1]
 
-def has_embeddings() -> bool:
-    return emb_q.has_embeddings(get_db())
+    folders = await asyncio.to_thread(email_q.get_folders, get_db())
+    _folders_cache = (now + FOLDERS_CACHE_TTL_SECONDS, folders)
+    return folders
 
 
-def get_folders() -> list[str]:
-    return email_q.get_folders(get_db())
+def invalidate_folders_cache() -> None:
+    """Drop the cached folder list after a mutation that may change it."""
+    global _folders_cache
+    _folders_cache = None
 
 
-def search_emails_advanced(
+async def search_emails_advanced(
     query: str, folder: str, limit: int, filters: dict
 ) -> list[dict]:
-    return email_q.search_emails_advanced(get_db(), query, folder, limit, filters)
+    return await asyncio.to_thread(
+        email_q.search_emails_advanced, get_db(), query, folder, limit, filters
+    )
+
+
+def _search_cache_key(query_embedding: list[float], *parts: Any) -> bytes:
+    """Hash the embedding as packed float32 plus the remaining search inputs."""
+    digest = hashlib.blake2b(array("f", query_embedding).tobytes(), digest_size=16)
+    digest.update(dumps_bytes(parts))
+    return digest.digest()
 
 
-def semantic_search(
+def _finish_search(key: bytes, task: asyncio.Future) -> None:
+    _search_inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    if len(_search_cache) >= SEARCH_CACHE_SIZE:
+        _search_cache.pop(next(iter(_search_cache)))
+    _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, task.result())
+
+
+async def _cached_search(
+    key: bytes, func: Callable[..., list[dict]], *args: Any
+) -> list[dict]:
+    """Serve a search from the TTL cache, or join an identical one in flight.
+
+    Only the first caller runs the query; the task is shielded so a
+    disconnecting client does not cancel it for the others.
+    """
+    cached = _search_cache.get(key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    task = _search_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        _search_inflight[key] = task
+        task.add_done_callback(lambda t: _finish_search(key, t))
+    return await asyncio.shield(task)
+
+
+async def semantic_search(
     query_embedding: list[float], folder: str, limit: int, threshold: float = 0.5
 ) -> list[dict]:
-    return emb_q.semantic_search(get_db(), query_embedding, folder, limit, threshold)
+    key = _search_cache_key(query_embedding, "basic", folder, limit, threshold)
+    return await _cached_search(
+        key,
+        emb_q.semantic_search,
+        get_db(),
+        query_embedding,
+        folder,
+        limit,
+        threshold,
+    )
 
 
-def semantic_search_advanced(
+async def semantic_search_advanced(
     query_embedding: list[float],
     folder: str,
     limit: int,
     filters: dict,
     threshold: float = 0.5,
 ) -> list[dict]:
-    return emb_q.semantic_search_advanced(
-        get_db(), query_embedding, folder, limit, filters, threshold
+    key = _search_cache_key(
+        query_embedding, "advanced", folder, limit, threshold, sorted(filters.items())
+    )
+    return await _cached_search(
+        key,
+        emb_q.semantic_search_advanced,
+        get_db(),
+        query_embedding,
+        folder,
+        limit,
+        filters,
+        threshold,
     )
 
 
-def get_search_suggestions(query: str, limit: int = 5) -> list[dict]:
-    return email_q.get_search_suggestions(get_db(), query, limit)
+async def get_search_suggestions(query: str, limit: int = 5) -> list[dict]:
+    return await asyncio.to_thread(
+        email_q.get_search_suggestions, get_db(), query, limit
+    )
 
 
-def find_related_emails(uid: int, folder: str, limit: int = 5) -> list[dict]:
-    return emb_q.find_related_emails(get_db(), uid, folder, limit)
+async def find_related_emails(uid: int, folder: str, limit: int = 5) -> list[dict]:
+    return await asyncio.to_thread(
+        emb_q.find_related_emails, get_db(), uid, folder, limit
+    )
 
 
-def get_new_priority_emails(since, limit: int = 10) -> list[dict]:
-    return email_q.get_new_priority_emails(get_db(), since, limit)
+async def get_new_priority_emails(since, limit: int = 10) -> list[dict]:
+    return await asyncio.to_thread(
+        email_q.get_new_priority_emails, get_db(), since, limit
+    )
 
 
 def upsert_contact(
@@ -181,45 +391,92 @@ def add_contact_interaction(
     )
 
 
-def get_all_contacts(
+def upsert_contacts_bulk(rows: list[tuple]):
+    result = contact_q.upsert_contacts_bulk(get_db(), rows)
+    # Sync changes both single contacts and the frequent/recent aggregates
+    _contact_row_cache.clear()
+    _contacts_cache.clear()
+    return result
+
+
+async def get_all_contacts(
     limit: int = 100,
     offset: int = 0,
     search: str | None = None,
     sort_by: str = "last_email_date",
 ):
-    return contact_q.get_all_contacts(get_db(), limit, offset, search, sort_by)
+    return await asyncio.to_thread(
+        contact_q.get_all_contacts, get_db(), limit, offset, search, sort_by
+    )
+
+
+async def get_contact_by_email(email: str):
+    """Fetch one contact, cached for a short TTL."""
+    hit, row = _row_cache_get(_contact_row_cache, email)
+    if hit:
+        return row
 
+    row = await asyncio.to_thread(contact_q.get_contact_by_email, get_db(), email)
+    _row_cache_put(_contact_row_cache, email, row)
+    return row
 
-def get_contact_by_email(email: str):
-    return contact_q.get_contact_by_email(get_db(), email)
+
+async def get_contact_interactions(contact_id: int, limit: int = 50):
+    return await asyncio.to_thread(
+        contact_q.get_contact_interactions, get_db(), contact_id, limit
+    )
 
 
-def get_contact_interactions(contact_id: int, limit: int = 50):
-    return contact_q.get_contact_interactions(get_db(), contact_id, limit)
+async def _cached_contacts(key: tuple, load: Callable[[], list[dict]]) -> list[dict]:
+    now = time.monotonic()
+    cached = _contacts_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
 
+    rows = await asyncio.to_thread(load)
+    _contacts_cache[key] = (now + CONTACTS_CACHE_TTL_SECONDS, rows)
+    return rows
 
-def get_frequent_contacts(limit: int = 20, exclude_email: str | None = None):
-    return contact_q.get_frequent_contacts(get_db(), limit, exclude_email)
+
+async def get_frequent_contacts(limit: int = 20, exclude_email: str | None = None):
+    """Most-emailed contacts, cached for a short TTL."""
+    return await _cached_contacts(
+        ("frequent", limit, exclude_email),
+        lambda: contact_q.get_frequent_contacts(get_db(), limit, exclude_email),
+    )
 
 
-def get_recent_contacts(limit: int = 20):
-    return contact_q.get_recent_contacts(get_db(), limit)
+async def get_recent_contacts(limit: int = 20):
+    """Most recently emailed contacts, cached for a short TTL."""
+    return await _cached_contacts(
+        ("recent", limit),
+        lambda: contact_q.get_recent_contacts(get_db(), limit),
+    )
 
 
-def search_contacts_autocomplete(query: str, limit: int = 10):
-    return contact_q.search_contacts_autocomplete(get_db(), query, limit)
+async def search_contacts_autocomplete(query: str, limit: int = 10):
+    return await asyncio.to_thread(
+        contact_q.search_contacts_autocomplete, get_db(), query, limit
+    )
 
 
-def update_contact_vip_status(contact_id: int, is_vip: bool):
-    return contact_q.update_contact_vip_status(get_db(), contact_id, is_vip)
+async def update_contact_vip_status(contact_id: int, is_vip: bool):
+    result = await asyncio.to_thread(
+        contact_q.update_contact_vip_status, get_db(), contact_id, is_vip
+    )
+    # Entries are keyed by address, not ID
+    _contact_row_cache.clear()
+    return result
 
 
-def add_contact_note(contact_id: int, note: str):
-    return contact_q.add_contact_note(get_db(), contact_id, note)
+async def add_contact_note(contact_id: int, note: str):
+    return await asyncio.to_thread(
+        contact_q.add_contact_note, get_db(), contact_id, note
+    )
 
 
-def get_contact_notes(contact_id: int):
-    return contact_q.get_contact_notes(get_db(), contact_id)
+async def get_contact_notes(contact_id: int):
+    return await asyncio.to_thread(contact_q.get_contact_notes, get_db(), contact_id)
 
 
 # =============================================================================
@@ -248,7 +505,28 @@ def get_user_calendar_preferences(user_id: str = "default") -> dict:
 
 
 def get_calendar_selection_state(user_id: str = "default") -> dict:
-    """Return selected/available calendar IDs along with sync state metadata."""
+    """Return selected/available calendar IDs along with sync state metadata.
+
+    Cached per user for a short TTL; see :func:`invalidate_calendar_selection`.
+    """
+    cached = _calendar_selection_cache.get(user_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
+    state = _load_calendar_selection_state(user_id)
+    _calendar_selection_cache[user_id] = (
+        time.monotonic() + CALENDAR_SELECTION_CACHE_TTL_SECONDS,
+        state,
+    )
+    return state
+
+
+def invalidate_calendar_selection(user_id: str) -> None:
+    """Drop a user's cached calendar selection after their preferences change."""
+    _calendar_selection_cache.pop(user_id, None)
+
+
+def _load_calendar_selection_state(user_id: str) -> dict:
     calendar_prefs = get_user_calendar_preferences(user_id)
     preferred_ids: list[str] = calendar_prefs.get("selected_calendar_ids", []) or []
 
@@ -261,14 +539,16 @@ def get_calendar_selection_state(user_id: str = "default") -> dict:
 
     if not available_ids:
         available_ids = ["primary"]
+    # Ordered list for display, set for membership checks
+    available_set = set(available_ids)
 
     if preferred_ids:
-        selected_ids = [cid for cid in preferred_ids if cid in available_ids]
+        selected_ids = [cid for cid in preferred_ids if cid in available_set]
     else:
-        selected_ids = ["primary"] if "primary" in available_ids else available_ids[:1]
+        selected_ids = ["primary"] if "primary" in available_set else available_ids[:1]
 
     if not selected_ids:
-        selected_ids = ["primary"] if "primary" in available_ids else available_ids
+        selected_ids = ["primary"] if "primary" in available_set else available_ids
 
     return {
         "selected_ids": selected_ids,
@@ -318,8 +598,14 @@ def get_user_calendar_event(
 
 
 def get_booking_link(link_id: str) -> Optional[dict[str, Any]]:
-    """Fetch a booking link definition by ID."""
-    return booking_q.get_booking_link(get_db(), link_id)
+    """Fetch a booking link definition by ID, cached for a short TTL."""
+    hit, link = _row_cache_get(_booking_link_cache, link_id)
+    if hit:
+        return link
+
+    link = booking_q.get_booking_link(get_db(), link_id)
+    _row_cache_put(_booking_link_cache, link_id, link)
+    return link
 
 
 def list_booking_links_for_user(
@@ -359,7 +645,10 @@ def save_booking_link(
         is_active,
         metadata,
     )
+    _booking_link_cache.pop(link_id, None)
 
 
 def set_booking_link_status(link_id: str, is_active: bool) -> bool:
-    return booking_q.set_booking_link_status(get_db(), link_id, is_active)
+    updated = booking_q.set_booking_link_status(get_db(), link_id, is_active)
+    _booking_link_cache.pop(link_id, None)
+    return updated
@@ -4,37 +4,73 @@ Engine API client for web UI mutations.
 All database mutations go through the Engine API - the web UI never writes directly.
 """
 
+import functools
 import httpx
 import os
 from typing import Optional
+from urllib.parse import quote
 from fastapi import HTTPException
 import logging
 
+from workspace_secretary.json_utils import dumps_bytes, loads
+from workspace_secretary.web.database import invalidate_email, invalidate_folders_cache
+
 logger = logging.getLogger(__name__)
 
 _client: Optional[httpx.AsyncClient] = None
 
 
+@functools.cache
 def get_engine_url() -> str:
+    """Engine base URL, read from ENGINE_API_URL once per process."""
     return os.environ.get("ENGINE_API_URL", "http://localhost:8001")
 
 
-ENGINE_URL = get_engine_url()
+# Keep warm connections to the engine so bursts of mutations skip the
+# TCP handshake; fail fast if the engine is not listening at all.
+ENGINE_TIMEOUT = httpx.Timeout(30, connect=5)
+ENGINE_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30
+)
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 async def get_client() -> httpx.AsyncClient:
     global _client
     if _client is None:
-        _client = httpx.AsyncClient(base_url=get_engine_url(), timeout=30)
+        _client = httpx.AsyncClient(
+            base_url=get_engine_url(), timeout=ENGINE_TIMEOUT, limits=ENGINE_LIMITS
+        )
     return _client
 
 
-async def _request(method: str, path: str, json: Optional[dict] = None) -> dict:
+async def close_client() -> None:
+    """Close the shared engine HTTP client (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _request(
+    method: str,
+    path: str,
+    json: Optional[dict] = None,
+    params: Optional[dict] = None,
+) -> dict:
     client = await get_client()
+    content = headers = None
+    if json is not None:
+        content = dumps_bytes(json)
+        headers = JSON_HEADERS
     try:
-        response = await client.request(method, path, json=json)
+        response = await client.request(
+            method, path, params=params, content=content, headers=headers
+        )
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
     except httpx.HTTPStatusError as e:
         detail_message = e.response.text
         detail_payload = {"message": detail_message, "error_type": None}
@@ -75,37 +111,49 @@ async def _request(method: str, path: str, json: Optional[dict] = None) -> dict:
 
 
 async def mark_read(uid: int, folder: str) -> dict:
-    return await _request(
+    result = await _request(
         "POST", "/api/email/mark-read", {"uid": uid, "folder": folder}
     )
+    invalidate_email(uid, folder)
+    return result
 
 
 async def mark_unread(uid: int, folder: str) -> dict:
-    return await _request(
+    result = await _request(
         "POST", "/api/email/mark-unread", {"uid": uid, "folder": folder}
     )
+    invalidate_email(uid, folder)
+    return result
 
 
 async def move_email(uid: int, folder: str, destination: str) -> dict:
-    return await _request(
+    result = await _request(
         "POST",
         "/api/email/move",
         {"uid": uid, "folder": folder, "destination": destination},
     )
+    invalidate_email(uid, folder)
+    invalidate_folders_cache()
+    return result
 
 
 async def delete_email(uid: int, folder: str) -> dict:
-    return await _request(
+    result = await _request(
         "POST", "/api/internal/email/delete", {"uid": uid, "folder": folder}
     )
+    invalidate_email(uid, folder)
+    invalidate_folders_cache()
+    return result
 
 
 async def modify_labels(uid: int, folder: str, labels: list[str], action: str) -> dict:
-    return await _request(
+    result = await _request(
         "POST",
         "/api/email/labels",
         {"uid": uid, "folder": folder, "labels": labels, "action": action},
     )
+    invalidate_email(uid, folder)
+    return result
 
 
 async def send_email(
@@ -226,7 +274,9 @@ async def respond_to_invite(event_id: str, response: str, calendar_id: str) -> d
 
 
 async def get_calendar_event(calendar_id: str, event_id: str) -> dict:
-    return await _request("GET", f"/api/calendar/{calendar_id}/events/{event_id}")
+    calendar = quote(calendar_id, safe="")
+    event = quote(event_id, safe="")
+    return await _request("GET", f"/api/calendar/{calendar}/events/{event}")
 
 
 async def freebusy_query(time_min: str, time_max: str, calendar_ids: list[str]) -> dict:
@@ -243,5 +293,5 @@ async def freebusy_query(time_min: str, time_max: str, calendar_ids: list[str])
 
 async def get_conference_solutions(calendar_id: str = "primary") -> dict:
     return await _request(
-        "GET", f"/api/calendar/conference-solutions?calendar_id={calendar_id}"
+        "GET", "/api/calendar/conference-solutions", params={"calendar_id": calendar_id}
     )
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 def main():
-    from workspace_secretary.web import web_app, init_web_app
+    from workspace_secretary.web import web_app, init_web_app, _running_in_docker
     from workspace_secretary.web.routes import (
         inbox,
         thread,
@@ -72,6 +72,14 @@ def main():
     host = os.environ.get("WEB_HOST", "0.0.0.0")
     port = int(os.environ.get("WEB_PORT", "8080"))
 
+    # Behind a TLS-terminating proxy the original scheme only arrives in
+    # X-Forwarded-Proto. Trusting it makes request.url.scheme "https", so
+    # session cookies keep their Secure flag. In Docker the proxy connects
+    # from another container's address rather than loopback.
+    forwarded_allow_ips = os.environ.get("FORWARDED_ALLOW_IPS") or (
+        "*" if _running_in_docker() else "127.0.0.1"
+    )
+
     logger.info(f"Starting Secretary Web UI on {host}:{port}")
 
     uvicorn.run(
@@ -79,6 +87,8 @@ def main():
         host=host,
         port=port,
         log_level="info",
+        proxy_headers=True,
+        forwarded_allow_ips=forwarded_allow_ips,
     )
 
 
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Query, Depends, HTTPException
-from fastapi.responses import JSONResponse
 import logging
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import engine_client as engine
 from workspace_secretary.web.auth import require_auth, Session
 
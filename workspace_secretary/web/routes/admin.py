@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Request, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from datetime import datetime, timedelta, timezone
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import database as db
 from workspace_secretary.web import templates, get_template_context
 from workspace_secretary.web.auth import require_auth, Session
@@ -277,7 +278,7 @@ async def admin_dashboard(
 
     return templates.TemplateResponse(
         "admin.html",
-        get_template_context(
+        await get_template_context(
             request,
             overall_health=overall_health,
             alerts=alerts,
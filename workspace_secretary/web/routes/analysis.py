@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Request, Query, Depends
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
+import asyncio
 import re
 import idna
 from email.utils import parseaddr
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.email_auth import parse_authentication_results
 
 from workspace_secretary.web import database as db
@@ -220,24 +222,29 @@ def compute_priority(signals: dict) -> tuple[str, str]:
     return priority, ", ".join(reasons) if reasons else "No priority signals"
 
 
+async def _load_related(uid: int, folder: str) -> tuple[bool, list[dict]]:
+    """Return (has_embeddings, related emails) for the analysis views."""
+    if not await db.has_embeddings():
+        return False, []
+    try:
+        return True, await db.find_related_emails(uid, folder, limit=5)
+    except Exception:
+        return True, []
+
+
 @router.get("/api/analysis/{folder}/{uid}", response_class=JSONResponse)
 async def get_email_analysis(
     folder: str, uid: int, session: Session = Depends(require_auth)
 ):
-    email = db.get_email(uid, folder)
+    email, (has_embeddings, related) = await asyncio.gather(
+        db.get_email(uid, folder), _load_related(uid, folder)
+    )
     if not email:
         return JSONResponse({"error": "Email not found"}, status_code=404)
 
     signals = analyze_signals(email)
     priority, priority_reason = compute_priority(signals)
 
-    related = []
-    if db.has_embeddings():
-        try:
-            related = db.find_related_emails(uid, folder, limit=5)
-        except Exception:
-            pass
-
     suggested_actions = []
     if signals["has_question"]:
         suggested_actions.append(
@@ -272,7 +279,7 @@ async def get_email_analysis(
             for r in related
         ],
         "suggested_actions": suggested_actions,
-        "has_embeddings": db.has_embeddings(),
+        "has_embeddings": has_embeddings,
     }
 
 
@@ -280,20 +287,15 @@ async def get_email_analysis(
 async def analysis_sidebar(
     request: Request, folder: str, uid: int, session: Session = Depends(require_auth)
 ):
-    email = db.get_email(uid, folder)
+    email, (has_embeddings, related) = await asyncio.gather(
+        db.get_email(uid, folder), _load_related(uid, folder)
+    )
     if not email:
         return HTMLResponse("<div class='p-4 text-red-400'>Email not found</div>")
 
     signals = analyze_signals(email)
     priority, priority_reason = compute_priority(signals)
 
-    related = []
-    if db.has_embeddings():
-        try:
-            related = db.find_related_emails(uid, folder, limit=5)
-        except Exception:
-            pass
-
     suggested_actions = []
     if signals["has_question"]:
         suggested_actions.append(
@@ -310,14 +312,14 @@ async def analysis_sidebar(
 
     return templates.TemplateResponse(
         "partials/analysis_sidebar.html",
-        get_template_context(
+        await get_template_context(
             request,
             signals=signals,
             priority=priority,
             priority_reason=priority_reason,
             related_emails=related,
             suggested_actions=suggested_actions,
-            has_embeddings=db.has_embeddings(),
+            has_embeddings=has_embeddings,
             folder=folder,
             uid=uid,
         ),
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Request, Depends, HTTPException
-from fastapi.responses import JSONResponse
 from typing import List, Optional
 import json
 import logging
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import engine_client
 from workspace_secretary.web.auth import require_auth, Session
 
@@ -173,7 +173,7 @@ async def toggle_star(folder: str, uid: int, session: Session = Depends(require_
     from workspace_secretary.web import database as db
 
     try:
-        email = db.get_email(uid, folder)
+        email = await db.get_email(uid, folder)
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
 
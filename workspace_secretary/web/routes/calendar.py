@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Request, Query, Form, Depends, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from typing import Optional, Any
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import asyncio
 import json
 import logging
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import (
     engine_client as engine,
     templates,
@@ -134,12 +136,12 @@ def _generate_booking_slots(
     return slots
 
 
-def _get_booking_link_context(
+async def _get_booking_link_context(
     link_id: str,
 ) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
     """Fetch booking link along with an error descriptor if invalid/inactive."""
 
-    link = db.get_booking_link(link_id)
+    link = await asyncio.to_thread(db.get_booking_link, link_id)
     if not link:
         return None, {"status": 404, "detail": "Booking link not found"}
     if not link.get("is_active", True):
@@ -147,8 +149,8 @@ def _get_booking_link_context(
     return link, None
 
 
-def _require_booking_link(link_id: str) -> dict[str, Any]:
-    link, error = _get_booking_link_context(link_id)
+async def _require_booking_link(link_id: str) -> dict[str, Any]:
+    link, error = await _get_booking_link_context(link_id)
     if error:
         raise HTTPException(status_code=error["status"], detail=error["detail"])
     assert link is not None  # For type-checkers
@@ -216,8 +218,8 @@ async def calendar_view(
     events: list[dict] = []
 
     try:
-        selection_state, events = db.get_user_calendar_events_with_state(
-            session.user_id, time_min, time_max
+        selection_state, events = await asyncio.to_thread(
+            db.get_user_calendar_events_with_state, session.user_id, time_min, time_max
         )
     except Exception as e:
         logger.error(
@@ -225,28 +227,31 @@ async def calendar_view(
         )
         engine_error = f"Calendar service unavailable: {str(e)}"
 
+    # Both engine calls are independent; issue them together.
+    freebusy_response, calendars_response = await asyncio.gather(
+        engine.freebusy_query(time_min, time_max, selection_state["selected_ids"]),
+        engine.list_calendars(),
+        return_exceptions=True,
+    )
+
     busy_slots = []
-    try:
-        freebusy_response = await engine.freebusy_query(
-            time_min, time_max, selection_state["selected_ids"]
-        )
+    if isinstance(freebusy_response, BaseException):
+        e = freebusy_response
+        logger.error(f"Failed to fetch freebusy data from engine: {e}", exc_info=e)
+        if not engine_error:
+            engine_error = f"Calendar service unavailable: {str(e)}"
+    else:
         busy_by_calendar = (
             freebusy_response.get("freebusy", {}).get("calendars", {}) or {}
         )
         for cid in selection_state["selected_ids"]:
             busy_slots.extend(busy_by_calendar.get(cid, {}).get("busy", []))
-    except Exception as e:
-        logger.error(f"Failed to fetch freebusy data from engine: {e}", exc_info=True)
-        if not engine_error:
-            engine_error = f"Calendar service unavailable: {str(e)}"
 
     calendar_options: list[dict] = []
-    try:
-        calendars_response = await engine.list_calendars()
-        if calendars_response.get("status") == "ok":
-            calendar_options = calendars_response.get("calendars", []) or []
-    except Exception as e:
-        logger.warning(f"Failed to load calendar list: {e}")
+    if isinstance(calendars_response, BaseException):
+        logger.warning(f"Failed to load calendar list: {calendars_response}")
+    elif calendars_response.get("status") == "ok":
+        calendar_options = calendars_response.get("calendars", []) or []
 
     filtered_options = []
     available = set(selection_state["available_ids"])
@@ -290,7 +295,7 @@ async def calendar_view(
             for cid in selection_state["available_ids"]
         ]
 
-    context = get_template_context(
+    context = await get_template_context(
         request,
         view=view,
         events=events,
@@ -424,7 +429,7 @@ async def find_time_view(
 ):
     return templates.TemplateResponse(
         "calendar_find_time.html",
-        get_template_context(request),
+        await get_template_context(request),
     )
 
 
@@ -447,8 +452,8 @@ async def find_time_slots(
         time_min = start_dt.strftime("%Y-%m-%dT00:00:00Z")
         time_max = end_dt.strftime("%Y-%m-%dT23:59:59Z")
 
-        selection_state, my_busy = db.get_user_calendar_events_with_state(
-            session.user_id, time_min, time_max
+        selection_state, my_busy = await asyncio.to_thread(
+            db.get_user_calendar_events_with_state, session.user_id, time_min, time_max
         )
 
         freebusy_response = await engine.freebusy_query(
@@ -554,8 +559,8 @@ async def availability_widget(
     time_max = (now + timedelta(days=days)).strftime("%Y-%m-%dT23:59:59Z")
 
     try:
-        selection_state, _ = db.get_user_calendar_events_with_state(
-            session.user_id, time_min, time_max
+        selection_state, _ = await asyncio.to_thread(
+            db.get_user_calendar_events_with_state, session.user_id, time_min, time_max
         )
         freebusy_response = await engine.freebusy_query(
             time_min, time_max, selection_state["selected_ids"]
@@ -569,7 +574,7 @@ async def availability_widget(
 
     return templates.TemplateResponse(
         "partials/availability_widget.html",
-        get_template_context(
+        await get_template_context(
             request,
             busy_slots=busy_slots,
             days=days,
@@ -583,7 +588,9 @@ async def get_calendar_event_detail(
     event_id: str,
     session: Session = Depends(require_auth),
 ):
-    event = db.get_user_calendar_event(session.user_id, calendar_id, event_id)
+    event = await asyncio.to_thread(
+        db.get_user_calendar_event, session.user_id, calendar_id, event_id
+    )
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     return JSONResponse({"success": True, "event": event})
@@ -608,9 +615,12 @@ async def create_event(
             if attendees
             else None
         )
-        target_calendar_id = (
-            calendar_id or db.get_selected_calendar_ids(session.user_id)[0]
-        )
+        target_calendar_id = calendar_id
+        if not target_calendar_id:
+            selected_ids = await asyncio.to_thread(
+                db.get_selected_calendar_ids, session.user_id
+            )
+            target_calendar_id = selected_ids[0]
 
         meeting_type: Optional[str] = None
         if add_meet:
@@ -697,9 +707,12 @@ async def respond_to_event(
         )
 
     try:
-        target_calendar_id = (
-            calendar_id or db.get_selected_calendar_ids(session.user_id)[0]
-        )
+        target_calendar_id = calendar_id
+        if not target_calendar_id:
+            selected_ids = await asyncio.to_thread(
+                db.get_selected_calendar_ids, session.user_id
+            )
+            target_calendar_id = selected_ids[0]
         result = await engine.respond_to_invite(event_id, response, target_calendar_id)
         if result.get("status") == "error":
             return JSONResponse(
@@ -721,7 +734,7 @@ async def public_booking_page(
     request: Request,
     link_id: str,
 ):
-    link, error = _get_booking_link_context(link_id)
+    link, error = await _get_booking_link_context(link_id)
     context = {
         "link_id": link_id,
         "booking_link": link,
@@ -732,7 +745,7 @@ async def public_booking_page(
     }
     return templates.TemplateResponse(
         "calendar_booking.html",
-        get_template_context(request, **context),
+        await get_template_context(request, **context),
     )
 
 
@@ -741,7 +754,7 @@ async def get_booking_slots(
     link_id: str = Query(...),
 ):
     try:
-        link = _require_booking_link(link_id)
+        link = await _require_booking_link(link_id)
         booking_tz = _get_timezone(link.get("timezone") or "UTC")
 
         now = datetime.now(booking_tz)
@@ -754,8 +767,8 @@ async def get_booking_slots(
         time_min = start_dt.astimezone(ZoneInfo("UTC")).strftime("%Y-%m-%dT%H:%M:%SZ")
         time_max = end_dt.astimezone(ZoneInfo("UTC")).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        selected_ids, busy_events = db.get_user_calendar_events(
-            user_id, time_min, time_max
+        selected_ids, busy_events = await asyncio.to_thread(
+            db.get_user_calendar_events, user_id, time_min, time_max
         )
         busy_events = [
             evt for evt in busy_events if evt.get("calendarId") in {calendar_id}
@@ -904,7 +917,7 @@ async def book_meeting(
     slot_end: str = Form(...),
 ):
     try:
-        link = _require_booking_link(link_id)
+        link = await _require_booking_link(link_id)
         summary = link.get("meeting_title") or f"Meeting with {name}"
         description = link.get("meeting_description") or "Booked via scheduling link"
         description += f"\n\nAttendee: {name} ({email})"
@@ -9,9 +9,10 @@ import uuid
 from typing import Optional
 
 from fastapi import APIRouter, Cookie, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from langchain_core.messages import HumanMessage, AIMessage
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import templates, get_template_context
 from workspace_secretary.web.auth import require_auth, Session
 from workspace_secretary.web.database import get_db
@@ -104,7 +105,7 @@ async def chat_page(
     """Render the chat page."""
     chat_session_id = piper_chat_session or _generate_chat_session_id()
 
-    ctx = get_template_context(
+    ctx = await get_template_context(
         request,
         page="chat",
         chat_session_id=chat_session_id,
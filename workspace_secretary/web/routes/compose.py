@@ -8,10 +8,11 @@ from fastapi import (
     File,
     HTTPException,
 )
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from typing import Optional, List
 import logging
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import database as db
 from workspace_secretary.web import engine_client as engine
 from workspace_secretary.web import templates, get_template_context
@@ -54,7 +55,7 @@ async def compose_modal(
     if uid:
         # Fetch original email for reply/forward context
         try:
-            email = db.get_email(uid, folder)
+            email = await db.get_email(uid, folder)
         except Exception as e:
             logger.warning(f"Failed to fetch email uid={uid} folder={folder}: {e}")
             email = None
@@ -120,7 +121,9 @@ async def compose_modal(
                 )
 
     template_name = "compose.html" if is_htmx_request else "compose_page.html"
-    return templates.TemplateResponse(template_name, get_template_context(**context))
+    return templates.TemplateResponse(
+        template_name, await get_template_context(**context)
+    )
 
 
 @router.post("/api/email/send")
@@ -184,7 +187,7 @@ async def contacts_autocomplete(
     q: str = Query(..., min_length=1),
     session: Session = Depends(require_auth),
 ):
-    emails_raw = db.get_inbox_emails("INBOX", limit=100, offset=0)
+    emails_raw = await db.get_inbox_emails("INBOX", limit=100, offset=0)
     contacts = set()
     for email in emails_raw:
         addr = email.get("from_addr", "")
@@ -4,12 +4,12 @@ Contact extraction and management routes.
 
 import asyncio
 from fastapi import APIRouter, Request, Depends, Query, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web.auth import Session, require_auth
 from workspace_secretary.web import templates, get_template_context
 from workspace_secretary.web.database import (
-    upsert_contact,
-    add_contact_interaction,
+    upsert_contacts_bulk,
     get_all_contacts,
     get_contact_by_email,
     get_contact_interactions,
@@ -71,7 +71,6 @@ async def sync_contacts_from_emails(
         from psycopg.rows import dict_row
 
         pool = get_pool()
-        contact_count = 0
 
         with pool.connection() as conn:
             with conn.cursor(row_factory=dict_row) as cur:
@@ -86,6 +85,7 @@ async def sync_contacts_from_emails(
                 )
                 emails = cur.fetchall()
 
+        rows = []
         for email in emails:
             for addr_str in [
                 email.get("from_addr"),
@@ -106,16 +106,6 @@ async def sync_contacts_from_emails(
                         else (None, None)
                     )
 
-                    contact_id = upsert_contact(
-                        email=email_addr,
-                        display_name=display_name or email_addr,
-                        first_name=first_name,
-                        last_name=last_name,
-                    )
-
-                    if contact_id is None:
-                        continue
-
                     direction = "received"
                     from_addr = email.get("from_addr")
                     to_addr = email.get("to_addr")
@@ -128,17 +118,23 @@ async def sync_contacts_from_emails(
                     elif cc_addr and email_addr in cc_addr:
                         direction = "cc"
 
-                    add_contact_interaction(
-                        contact_id=contact_id,
-                        email_uid=email["uid"],
-                        email_folder=email["folder"],
-                        direction=direction,
-                        subject=email.get("subject") or "(No subject)",
-                        email_date=email["date"],
-                        message_id=email.get("message_id") or "",
+                    rows.append(
+                        (
+                            email_addr,
+                            display_name or email_addr,
+                            first_name,
+                            last_name,
+                            email["uid"],
+                            email["folder"],
+                            direction,
+                            email.get("subject") or "(No subject)",
+                            email["date"],
+                            email.get("message_id") or "",
+                        )
                     )
 
-                    contact_count += 1
+        upsert_contacts_bulk(rows)
+        contact_count = len(rows)
 
         return {
             "success": True,
@@ -172,13 +168,15 @@ async def contacts_page(
     limit = 50
     offset = (page - 1) * limit
 
-    contacts = get_all_contacts(limit=limit, offset=offset, search=search, sort_by=sort)
-    frequent = get_frequent_contacts(limit=10, exclude_email=session.email)
-    recent = get_recent_contacts(limit=10)
+    contacts = await get_all_contacts(
+        limit=limit, offset=offset, search=search, sort_by=sort
+    )
+    frequent = await get_frequent_contacts(limit=10, exclude_email=session.email)
+    recent = await get_recent_contacts(limit=10)
 
     return templates.TemplateResponse(
         "contacts.html",
-        get_template_context(
+        await get_template_context(
             request,
             contacts=contacts,
             frequent=frequent,
@@ -196,16 +194,16 @@ async def contact_detail_page(
     email: str,
     session: Session = Depends(require_auth),
 ):
-    contact = get_contact_by_email(email)
+    contact = await get_contact_by_email(email)
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
 
-    interactions = get_contact_interactions(contact["id"], limit=100)
-    notes = get_contact_notes(contact["id"])
+    interactions = await get_contact_interactions(contact["id"], limit=100)
+    notes = await get_contact_notes(contact["id"])
 
     return templates.TemplateResponse(
         "contact_detail.html",
-        get_template_context(
+        await get_template_context(
             request,
             contact=contact,
             interactions=interactions,
@@ -222,7 +220,7 @@ async def toggle_vip_status(
 ):
     """Toggle VIP status."""
     try:
-        update_contact_vip_status(contact_id, is_vip)
+        await update_contact_vip_status(contact_id, is_vip)
         return JSONResponse({"success": True, "is_vip": is_vip})
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
@@ -236,7 +234,7 @@ async def add_note(
 ):
     """Add a note to a contact."""
     try:
-        note_id = add_contact_note(contact_id, note)
+        note_id = await add_contact_note(contact_id, note)
         return JSONResponse({"success": True, "note_id": note_id})
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
@@ -249,7 +247,7 @@ async def contacts_autocomplete(
 ):
     """Autocomplete search for contacts."""
     try:
-        results = search_contacts_autocomplete(q, limit=10)
+        results = await search_contacts_autocomplete(q, limit=10)
         return JSONResponse(
             {
                 "success": True,
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
 from datetime import datetime, timezone
+import asyncio
 import logging
 
 from workspace_secretary.web import database as db
@@ -15,7 +16,9 @@ logger = logging.getLogger(__name__)
 
 @router.get("/", response_class=HTMLResponse, name="dashboard")
 async def dashboard(request: Request, session: Session = Depends(require_auth)):
-    unread_emails = db.get_inbox_emails("INBOX", limit=50, offset=0, unread_only=True)
+    unread_emails = await db.get_inbox_emails(
+        "INBOX", limit=50, offset=0, unread_only=True
+    )
 
     priority_emails = []
     for email in unread_emails[:20]:
@@ -49,8 +52,11 @@ async def dashboard(request: Request, session: Session = Depends(require_auth)):
     upcoming_events: list[dict] = []
 
     try:
-        selection_state, events = db.get_user_calendar_events_with_state(
-            session.user_id, today_start, today_end
+        selection_state, events = await asyncio.to_thread(
+            db.get_user_calendar_events_with_state,
+            session.user_id,
+            today_start,
+            today_end,
         )
         for event in events:
             event_data = event.copy() if isinstance(event, dict) else dict(event)
@@ -86,7 +92,7 @@ async def dashboard(request: Request, session: Session = Depends(require_auth)):
 
     return templates.TemplateResponse(
         "dashboard.html",
-        get_template_context(
+        await get_template_context(
             request,
             priority_emails=priority_emails,
             upcoming_events=upcoming_events,
@@ -102,7 +108,9 @@ async def dashboard(request: Request, session: Session = Depends(require_auth)):
 
 @router.get("/api/stats", response_class=HTMLResponse)
 async def get_stats(request: Request, session: Session = Depends(require_auth)):
-    unread_emails = db.get_inbox_emails("INBOX", limit=100, offset=0, unread_only=True)
+    unread_emails = await db.get_inbox_emails(
+        "INBOX", limit=100, offset=0, unread_only=True
+    )
 
     high_priority = 0
     for email in unread_emails[:30]:
@@ -120,8 +128,11 @@ async def get_stats(request: Request, session: Session = Depends(require_auth)):
     )
 
     try:
-        selection_state, events = db.get_user_calendar_events_with_state(
-            session.user_id, today_start, today_end
+        selection_state, events = await asyncio.to_thread(
+            db.get_user_calendar_events_with_state,
+            session.user_id,
+            today_start,
+            today_end,
         )
         meetings_today = len(events)
     except Exception:
@@ -129,7 +140,7 @@ async def get_stats(request: Request, session: Session = Depends(require_auth)):
 
     return templates.TemplateResponse(
         "partials/stats_badges.html",
-        get_template_context(
+        await get_template_context(
             request,
             unread_count=len(unread_emails),
             priority_count=high_priority,
@@ -1,8 +1,9 @@
 import httpx
 from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web.auth import Session, require_auth
+from workspace_secretary.web.database import get_pool_stats
 from workspace_secretary.web.engine_client import get_client
 
 router = APIRouter()
@@ -63,5 +64,6 @@ async def get_services_health(session: Session = Depends(require_auth)):
         content={
             "status": overall_status,
             "services": services,
+            "database_pool": get_pool_stats(),
         }
     )
@@ -1,15 +1,45 @@
 from fastapi import APIRouter, Request, Query, Depends
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+import functools
+import hashlib
 import html
 
-from workspace_secretary.web import database as db, templates, get_template_context
-from workspace_secretary.web.auth import require_auth, Session
+from workspace_secretary import __version__
+from workspace_secretary.json_utils import dumps_bytes
+from workspace_secretary.web import (
+    database as db,
+    templates,
+    get_template_context,
+    get_ui_prefs,
+    get_web_config,
+)
+from workspace_secretary.web.auth import CSRF_COOKIE, require_auth, Session
 
 router = APIRouter()
 
 
+@dataclass(slots=True)
+class EmailListItem:
+    """One row of an email list, shaped for the list templates."""
+
+    uid: int
+    folder: str
+    from_name: str
+    from_addr: str
+    subject: str
+    preview: str
+    date: str
+    is_unread: bool
+    is_starred: bool
+    has_attachments: bool
+
+
 def is_starred(email: dict) -> bool:
+    if "is_starred" in email:
+        return bool(email["is_starred"])
     labels = email.get("gmail_labels")
     if not labels:
         return False
@@ -48,6 +78,85 @@ def truncate(text: str, length: int = 100) -> str:
     return text[:length].rsplit(" ", 1)[0] + "..."
 
 
+def encode_cursor(email: dict) -> str | None:
+    """Build a keyset cursor from the last email on a page."""
+    date_val = email.get("date")
+    if not isinstance(date_val, datetime):
+        return None
+    return f"{date_val.isoformat()}_{email['uid']}"
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    if not cursor:
+        return None
+    try:
+        date_str, uid = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(date_str), int(uid)
+    except ValueError:
+        return None
+
+
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+@functools.cache
+def markup_version() -> str:
+    """App version plus the newest template mtime, read once per process.
+
+    Deploys restart the process, so a template change yields new list ETags
+    and browsers revalidating with ``no-cache`` fetch the new markup.
+    """
+    newest = max(
+        (path.stat().st_mtime_ns for path in _TEMPLATES_DIR.rglob("*.html")),
+        default=0,
+    )
+    return f"{__version__}:{newest}"
+
+
+async def list_etag(request: Request, session: Session, *parts) -> str:
+    """Fingerprint everything an email list page is rendered from."""
+    web_config = get_web_config()
+    digest = hashlib.blake2b(
+        dumps_bytes(
+            [
+                markup_version(),
+                str(request.url),
+                request.cookies.get(CSRF_COOKIE),
+                session.user_id,
+                session.name,
+                session.email,
+                await get_ui_prefs(session.user_id),
+                web_config.theme if web_config else None,
+                *parts,
+            ]
+        ),
+        digest_size=16,
+    )
+    return f'W/"{digest.hexdigest()}"'
+
+
+LIST_CACHE_CONTROL = "private, no-cache"
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 when the client already holds this exact list.
+
+    ``no-cache`` makes browsers revalidate on every visit, so read/unread
+    changes show up immediately while unchanged pages skip the body.
+    """
+    if request.headers.get("if-none-match") != etag:
+        return None
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": LIST_CACHE_CONTROL}
+    )
+
+
+def with_cache_headers(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = LIST_CACHE_CONTROL
+    return response
+
+
 def extract_name(addr: str) -> str:
     if not addr:
         return ""
@@ -56,6 +165,22 @@ def extract_name(addr: str) -> str:
     return addr.split("@")[0]
 
 
+def to_list_item(email: dict, preview_length: int = 120) -> EmailListItem:
+    from_addr = email.get("from_addr", "")
+    return EmailListItem(
+        uid=email["uid"],
+        folder=email["folder"],
+        from_name=extract_name(from_addr),
+        from_addr=from_addr,
+        subject=email.get("subject", "(no subject)"),
+        preview=truncate(email.get("preview") or "", preview_length),
+        date=format_date(email.get("date")),
+        is_unread=email.get("is_unread", False),
+        is_starred=is_starred(email),
+        has_attachments=email.get("has_attachments", False),
+    )
+
+
 @router.get("/inbox", response_class=HTMLResponse)
 async def inbox(
     request: Request,
@@ -64,43 +189,46 @@ async def inbox(
     folder: str = Query("INBOX"),
     unread_only: bool = Query(False),
     label: str | None = Query(None),
+    cursor: str | None = Query(None),
     session: Session = Depends(require_auth),
 ):
     offset = (page - 1) * per_page
-    emails_raw = db.get_inbox_emails(folder, per_page + 1, offset, unread_only, label)
+    emails_raw = await db.get_inbox_emails(
+        folder,
+        per_page + 1,
+        offset,
+        unread_only,
+        label,
+        decode_cursor(cursor),
+        list_only=True,
+    )
 
     has_more = len(emails_raw) > per_page
     emails_raw = emails_raw[:per_page]
+    next_cursor = encode_cursor(emails_raw[-1]) if has_more else None
 
-    emails = [
-        {
-            "uid": e["uid"],
-            "folder": e["folder"],
-            "from_name": extract_name(e.get("from_addr", "")),
-            "from_addr": e.get("from_addr", ""),
-            "subject": e.get("subject", "(no subject)"),
-            "preview": truncate(e.get("preview") or "", 120),
-            "date": format_date(e.get("date")),
-            "is_unread": e.get("is_unread", False),
-            "is_starred": is_starred(e),
-            "has_attachments": e.get("has_attachments", False),
-        }
-        for e in emails_raw
-    ]
+    emails = [to_list_item(e) for e in emails_raw]
 
-    return templates.TemplateResponse(
+    etag = await list_etag(request, session, emails, has_more, next_cursor)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    response = templates.TemplateResponse(
         "inbox.html",
-        get_template_context(
+        await get_template_context(
             request,
             emails=emails,
             page=page,
             per_page=per_page,
             has_more=has_more,
+            next_cursor=next_cursor,
             folder=folder,
             unread_only=unread_only,
             label=label,
         ),
     )
+    return with_cache_headers(response, etag)
 
 
 @router.get("/api/emails", response_class=HTMLResponse)
@@ -111,36 +239,43 @@ async def emails_partial(
     folder: str = Query("INBOX"),
     unread_only: bool = Query(False),
     label: str | None = Query(None),
+    cursor: str | None = Query(None),
     session: Session = Depends(require_auth),
 ):
     offset = (page - 1) * per_page
-    emails_raw = db.get_inbox_emails(folder, per_page + 1, offset, unread_only, label)
+    emails_raw = await db.get_inbox_emails(
+        folder,
+        per_page + 1,
+        offset,
+        unread_only,
+        label,
+        decode_cursor(cursor),
+        list_only=True,
+    )
 
     has_more = len(emails_raw) > per_page
     emails_raw = emails_raw[:per_page]
+    next_cursor = encode_cursor(emails_raw[-1]) if has_more else None
 
-    emails = [
-        {
-            "uid": e["uid"],
-            "folder": e["folder"],
-            "from_name": extract_name(e.get("from_addr", "")),
-            "from_addr": e.get("from_addr", ""),
-            "subject": e.get("subject", "(no subject)"),
-            "preview": truncate(e.get("preview") or "", 120),
-            "date": format_date(e.get("date")),
-            "is_unread": e.get("is_unread", False),
-            "is_starred": is_starred(e),
-            "has_attachments": e.get("has_attachments", False),
-        }
-        for e in emails_raw
-    ]
+    emails = [to_list_item(e) for e in emails_raw]
 
-    return templates.TemplateResponse(
+    etag = await list_etag(request, session, emails, has_more, next_cursor)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    response = templates.TemplateResponse(
         "partials/email_list.html",
-        get_template_context(
-            request, emails=emails, page=page, has_more=has_more, label=label
+        await get_template_context(
+            request,
+            emails=emails,
+            page=page,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            label=label,
         ),
     )
+    return with_cache_headers(response, etag)
 
 
 @router.get("/inbox/more", response_class=HTMLResponse)
@@ -151,41 +286,44 @@ async def inbox_more(
     folder: str = Query("INBOX"),
     unread_only: bool = Query(False),
     label: str | None = Query(None),
+    cursor: str | None = Query(None),
     session: Session = Depends(require_auth),
 ):
     offset = (page - 1) * per_page
-    emails_raw = db.get_inbox_emails(folder, per_page + 1, offset, unread_only, label)
+    emails_raw = await db.get_inbox_emails(
+        folder,
+        per_page + 1,
+        offset,
+        unread_only,
+        label,
+        decode_cursor(cursor),
+        list_only=True,
+    )
 
     has_more = len(emails_raw) > per_page
     emails_raw = emails_raw[:per_page]
+    next_cursor = encode_cursor(emails_raw[-1]) if has_more else None
 
-    emails = [
-        {
-            "uid": e["uid"],
-            "folder": e["folder"],
-            "from_name": extract_name(e.get("from_addr", "")),
-            "from_addr": e.get("from_addr", ""),
-            "subject": e.get("subject", "(no subject)"),
-            "preview": truncate(e.get("preview") or "", 120),
-            "date": format_date(e.get("date")),
-            "is_unread": e.get("is_unread", False),
-            "is_starred": is_starred(e),
-            "has_attachments": e.get("has_attachments", False),
-        }
-        for e in emails_raw
-    ]
+    emails = [to_list_item(e) for e in emails_raw]
 
-    return templates.TemplateResponse(
+    etag = await list_etag(request, session, emails, has_more, next_cursor)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    response = templates.TemplateResponse(
         "partials/inbox_more.html",
-        get_template_context(
+        await get_template_context(
             request,
             emails=emails,
             page=page,
             has_more=has_more,
+            next_cursor=next_cursor,
             folder=folder,
             unread_only=unread_only,
         ),
     )
+    return with_cache_headers(response, etag)
 
 
 @router.get("/inbox/partial", response_class=HTMLResponse)
@@ -195,22 +333,13 @@ async def inbox_widget(
     unread_only: bool = Query(False),
     session: Session = Depends(require_auth),
 ):
-    emails_raw = db.get_inbox_emails("INBOX", limit, 0, unread_only)
-
-    emails = [
-        {
-            "uid": e["uid"],
-            "folder": e["folder"],
-            "from_name": extract_name(e.get("from_addr", "")),
-            "subject": e.get("subject", "(no subject)"),
-            "preview": truncate(e.get("preview") or "", 80),
-            "date": format_date(e.get("date")),
-            "is_unread": e.get("is_unread", False),
-        }
-        for e in emails_raw
-    ]
+    emails_raw = await db.get_inbox_emails(
+        "INBOX", limit, 0, unread_only, list_only=True
+    )
+
+    emails = [to_list_item(e, preview_length=80) for e in emails_raw]
 
     return templates.TemplateResponse(
         "partials/email_widget.html",
-        get_template_context(request, emails=emails),
+        await get_template_context(request, emails=emails),
     )
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Request, Depends, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 from datetime import datetime, timedelta, timezone
 from typing import Optional
+import asyncio
 import json
 import logging
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import database as db, engine_client as engine
 from workspace_secretary.web import templates, get_template_context
 from workspace_secretary.web.auth import require_auth, Session
@@ -63,7 +65,7 @@ async def check_notifications(
         )
 
     # Get new priority emails since last check
-    new_emails = db.get_new_priority_emails(since=last_check)
+    new_emails = await db.get_new_priority_emails(since=last_check)
 
     # Get upcoming calendar events in the next hour for reminders
     time_min = now.strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -71,8 +73,8 @@ async def check_notifications(
 
     calendar_reminders = []
     try:
-        selection_state, events = db.get_user_calendar_events_with_state(
-            session.user_id, time_min, time_max
+        selection_state, events = await asyncio.to_thread(
+            db.get_user_calendar_events_with_state, session.user_id, time_min, time_max
         )
     except Exception as e:
         logger.error(
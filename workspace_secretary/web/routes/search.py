@@ -171,8 +171,8 @@ async def search(
     is_unread: Optional[bool] = Query(None),
     session: Session = Depends(require_auth),
 ):
-    supports_semantic = db.has_embeddings()
-    folders = db.get_folders()
+    supports_semantic = await db.has_embeddings()
+    folders = await db.get_folders()
 
     # Parse search operators from query string
     parsed_query, parsed_filters = parse_search_operators(q)
@@ -206,7 +206,7 @@ async def search(
     if not parsed_query.strip() and not has_filters:
         return templates.TemplateResponse(
             "search.html",
-            get_template_context(
+            await get_template_context(
                 request,
                 query=q,
                 parsed_query=parsed_query,
@@ -224,13 +224,17 @@ async def search(
     if mode == "semantic" and supports_semantic and parsed_query.strip():
         embedding = await get_embedding(parsed_query)
         if embedding:
-            results_raw = db.semantic_search_advanced(embedding, folder, limit, filters)
+            results_raw = await db.semantic_search_advanced(
+                embedding, folder, limit, filters
+            )
         else:
-            results_raw = db.search_emails_advanced(
+            results_raw = await db.search_emails_advanced(
                 parsed_query, folder, limit, filters
             )
     else:
-        results_raw = db.search_emails_advanced(parsed_query, folder, limit, filters)
+        results_raw = await db.search_emails_advanced(
+            parsed_query, folder, limit, filters
+        )
 
     results = [
         {
@@ -250,7 +254,7 @@ async def search(
 
     return templates.TemplateResponse(
         "search.html",
-        get_template_context(
+        await get_template_context(
             request,
             query=q,
             parsed_query=parsed_query,
@@ -300,7 +304,7 @@ async def save_search(request: Request, session: Session = Depends(require_auth)
     # Return updated saved searches list
     return templates.TemplateResponse(
         "partials/saved_searches.html",
-        get_template_context(request, saved_searches=_saved_searches),
+        await get_template_context(request, saved_searches=_saved_searches),
     )
 
 
@@ -313,7 +317,7 @@ async def delete_saved_search(
     _saved_searches = [s for s in _saved_searches if s["id"] != search_id]
     return templates.TemplateResponse(
         "partials/saved_searches.html",
-        get_template_context(request, saved_searches=_saved_searches),
+        await get_template_context(request, saved_searches=_saved_searches),
     )
 
 
@@ -325,11 +329,11 @@ async def search_suggestions(
     if len(q) < 2:
         return HTMLResponse("")
 
-    suggestions = db.get_search_suggestions(q)
+    suggestions = await db.get_search_suggestions(q)
     if not suggestions:
         return HTMLResponse("")
 
     return templates.TemplateResponse(
         "partials/search_suggestions.html",
-        get_template_context(request, suggestions=suggestions),
+        await get_template_context(request, suggestions=suggestions),
     )
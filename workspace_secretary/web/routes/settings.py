@@ -1,5 +1,6 @@
 """Settings routes for user preferences."""
 
+import asyncio
 import json
 import logging
 
@@ -47,7 +48,7 @@ class CalendarSettingsRequest(BaseModel):
 async def settings_page(request: Request, session: Session = Depends(require_auth)):
     web_config = get_web_config()
 
-    ctx = get_template_context(
+    ctx = await get_template_context(
         request,
         page="settings",
         web_config=web_config,
@@ -200,7 +201,9 @@ async def calendar_partial(request: Request, session: Session = Depends(require_
         logger.error(f"Failed to load calendar preferences: {e}")
 
     try:
-        selection_state = db.get_calendar_selection_state(session.user_id)
+        selection_state = await asyncio.to_thread(
+            db.get_calendar_selection_state, session.user_id
+        )
         states_by_id = {
             state["calendar_id"]: state for state in selection_state["states"]
         }
@@ -248,6 +251,7 @@ async def update_ui_settings(
     payload: UISettingsRequest,
     session: Session = Depends(require_auth),
 ):
+    from workspace_secretary.web import invalidate_ui_prefs
     from workspace_secretary.web.database import get_pool
 
     pool = get_pool()
@@ -278,6 +282,8 @@ async def update_ui_settings(
             )
         conn.commit()
 
+    invalidate_ui_prefs(session.user_id)
+
     return {
         "updated": True,
         "theme": payload.theme,
@@ -290,7 +296,10 @@ async def update_calendar_settings(
     payload: CalendarSettingsRequest,
     session: Session = Depends(require_auth),
 ):
-    from workspace_secretary.web.database import get_pool
+    from workspace_secretary.web.database import (
+        get_pool,
+        invalidate_calendar_selection,
+    )
 
     pool = get_pool()
     with pool.connection() as conn:
@@ -323,4 +332,5 @@ async def update_calendar_settings(
             )
         conn.commit()
 
+    invalidate_calendar_selection(session.user_id)
     return {"updated": True}
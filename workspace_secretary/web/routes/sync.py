@@ -1,9 +1,9 @@
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
 from psycopg.rows import dict_row
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import database as db
 from workspace_secretary.web.auth import Session, require_auth
 
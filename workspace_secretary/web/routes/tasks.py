@@ -6,8 +6,9 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Request, Form, Depends, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse
 
+from workspace_secretary.json_utils import JSONResponse
 from workspace_secretary.web import templates, get_template_context
 from workspace_secretary.web.auth import require_auth, Session
 
@@ -109,7 +110,7 @@ async def tasks_page(
 
     return templates.TemplateResponse(
         "tasks.html",
-        get_template_context(
+        await get_template_context(
             request,
             tasks=tasks,
             show_completed=show_completed,
@@ -173,7 +174,7 @@ async def tasks_sidebar(
     SIDEBAR_LIMIT = 10
     return templates.TemplateResponse(
         "partials/tasks_sidebar.html",
-        get_template_context(
+        await get_template_context(
             request,
             tasks=incomplete_tasks[:SIDEBAR_LIMIT],
             total_tasks=len(incomplete_tasks),
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request, HTTPException, Depends, Query, BackgroundTasks
 from fastapi.responses import HTMLResponse, StreamingResponse
 from datetime import datetime
+import asyncio
 import html
 import re
 import httpx
@@ -24,6 +25,7 @@ async def _mark_read_background(uid: int, folder: str) -> None:
                 json={"uid": uid, "folder": folder},
                 timeout=5.0,
             )
+        db.invalidate_email(uid, folder)
         logger.debug(f"Auto-marked {folder}/{uid} as read")
     except Exception as e:
         # Don't fail the page load if marking read fails
@@ -159,7 +161,12 @@ async def thread_view(
     load_images: bool = Query(False),
     session: Session = Depends(require_auth),
 ):
-    email = db.get_email(uid, folder)
+    # Independent lookups; each runs on its own pooled connection
+    email, thread_emails, neighbors = await asyncio.gather(
+        db.get_email(uid, folder),
+        db.get_thread(uid, folder),
+        db.get_neighbor_uids(folder, uid, unread_only),
+    )
     if not email:
         raise HTTPException(status_code=404, detail="Email not found")
 
@@ -175,13 +182,9 @@ async def thread_view(
     else:
         is_starred = "\\Starred" in (labels or [])
 
-    thread_emails = db.get_thread(uid, folder)
     if not thread_emails:
         thread_emails = [email]
 
-    # Get neighbors for navigation
-    neighbors = db.get_neighbor_uids(folder, uid, unread_only)
-
     messages = []
     calendar_invite = None
 
@@ -219,7 +222,7 @@ async def thread_view(
 
     return templates.TemplateResponse(
         "thread.html",
-        get_template_context(
+        await get_template_context(
             request,
             subject=email.get("subject", "(no subject)"),
             messages=messages,
@@ -273,7 +276,7 @@ async def download_all_attachments(
 
     engine_url = get_engine_url()
 
-    email = db.get_email(uid, folder)
+    email = await db.get_email_headers(uid, folder)
     if not email or not email.get("attachment_filenames"):
         raise HTTPException(status_code=404, detail="No attachments found")
 